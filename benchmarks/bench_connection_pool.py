@@ -0,0 +1,104 @@
+"""Per-call latency of connect-per-call SQLite access vs the pooled GymTracker connections
+
+Usage: python benchmarks/bench_connection_pool.py [--sets 5000] [--calls 500]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def seed(tracker, sets):
+    """Fill the tracker with a deterministic history of single-set workouts"""
+    rng = random.Random(42)
+    exercises = ['Bench Press', 'Squat', 'Deadlift', 'Overhead Press', 'Barbell Row']
+    start = date.today() - timedelta(days=sets // 10)
+    for i in range(sets):
+        day = (start + timedelta(days=i // 10)).strftime('%Y-%m-%d')
+        tracker.log_workout(day, rng.choice(exercises), [{
+            'reps': rng.randint(3, 12), 'weight': rng.randint(20, 160) * 1.25, 'rpe': rng.randint(6, 10)
+        }])
+
+
+def legacy_read(db_name, date_str):
+    """Reproduce the original connect/query/close pattern of get_daily_workout"""
+    conn = sqlite3.connect(db_name)
+    df = pd.read_sql_query('''
+        SELECT id, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, created_at
+        FROM workouts WHERE date = ? ORDER BY exercise, set_number
+    ''', conn, params=(date_str,))
+    conn.close()
+    return df
+
+
+def legacy_write(db_name, date_str):
+    """Reproduce the original connect/insert/commit/close pattern of log_workout"""
+    conn = sqlite3.connect(db_name)
+    cursor = conn.cursor()
+    cursor.execute('''
+        INSERT INTO workouts (date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (date_str, 'Bench Press', 1, 8, 100.0, 8, '', ''))
+    conn.commit()
+    conn.close()
+
+
+def time_per_call(fn, calls):
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) * 1000 / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sets', type=int, default=5000)
+    parser.add_argument('--calls', type=int, default=500)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            from gym_tracker_core import GymTracker
+
+            tracker = GymTracker(os.path.join(workdir, 'pooled.db'))
+            seed(tracker, args.sets)
+
+            # Legacy copy in the default rollback-journal mode the old code ran in
+            legacy_db = os.path.join(workdir, 'legacy.db')
+            legacy_conn = sqlite3.connect(legacy_db)
+            tracker.pool.connection().backup(legacy_conn)
+            legacy_conn.execute('PRAGMA journal_mode = DELETE')
+            legacy_conn.close()
+
+            date_str = date.today().strftime('%Y-%m-%d')
+            results = [
+                ('read  get_daily_workout',
+                 time_per_call(lambda: legacy_read(legacy_db, date_str), args.calls),
+                 time_per_call(lambda: tracker.get_daily_workout(date_str), args.calls)),
+                ('write log_workout (1 set)',
+                 time_per_call(lambda: legacy_write(legacy_db, date_str), args.calls),
+                 time_per_call(lambda: tracker.log_workout(date_str, 'Bench Press', [{'reps': 8, 'weight': 100.0, 'rpe': 8}]), args.calls)),
+            ]
+            tracker.close()
+        finally:
+            os.chdir(cwd)
+
+    print(f"{args.sets} seeded sets, {args.calls} calls each (ms per call)")
+    print(f"{'operation':<28}{'before':>10}{'after':>10}{'speedup':>10}")
+    for name, before, after in results:
+        print(f"{name:<28}{before:>10.3f}{after:>10.3f}{before / after:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Query latency of the legacy linear exercise search vs ExerciseSearchIndex
+
+Usage: python benchmarks/bench_exercise_search.py [--exercises 10000] [--rounds 20]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+QUERIES = ['rdl', 'bench', 'squat', 'benhc press', 'press bench', 'db row', 'ohp', 'sq',
+           'curl', 'pull up', 'tricep ext', 'lateral raise', 'xyz', 'incline dumbell']
+
+
+def legacy_search(all_exercises, search_term, abbreviations, max_results=10):
+    """The original smart_exercise_search: substring scan plus a per-character 70% match loop"""
+    search_term = search_term.lower().strip()
+    exact_matches = [ex for ex in all_exercises if search_term in ex.lower()]
+
+    expanded_search = abbreviations.get(search_term, search_term)
+    if expanded_search != search_term:
+        exact_matches.extend([ex for ex in all_exercises if expanded_search in ex.lower() and ex not in exact_matches])
+
+    fuzzy_matches = []
+    for exercise in all_exercises:
+        if exercise in exact_matches:
+            continue
+        exercise_lower = exercise.lower()
+        if len(search_term) >= 3:
+            matches = sum(1 for c in search_term if c in exercise_lower)
+            if matches >= len(search_term) * 0.7:
+                fuzzy_matches.append(exercise)
+
+    seen = set()
+    final_results = []
+    for ex in exact_matches + fuzzy_matches:
+        if ex not in seen:
+            seen.add(ex)
+            final_results.append(ex)
+    return final_results[:max_results]
+
+
+def synthetic_catalog(base_exercises, size):
+    """Grow the built-in catalog to `size` names with equipment and grip variations"""
+    rng = random.Random(7)
+    modifiers = ['Paused', 'Tempo', 'Banded', 'Chain', 'Deficit', 'Single Arm', 'Kneeling', 'Seated',
+                 'Standing', 'Cable', 'Smith Machine', 'Landmine', 'Wide Grip', 'Close Grip', 'Reverse Grip']
+    names = list(base_exercises)
+    seen = set(names)
+    for modifier, exercise in itertools.product(modifiers, base_exercises):
+        if len(names) >= size:
+            break
+        name = f'{modifier} {exercise}'
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    while len(names) < size:
+        name = f'{rng.choice(modifiers)} {rng.choice(base_exercises)} {len(names)}'
+        seen.add(name)
+        names.append(name)
+    return sorted(names)
+
+
+def time_queries(search, rounds):
+    """Average milliseconds per query over all benchmark queries"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in QUERIES:
+            search(query)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(QUERIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--exercises', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            from gym_tracker_core import EXERCISE_ABBREVIATIONS, ExerciseSearchIndex, GymTracker
+
+            tracker = GymTracker('search.db')
+            catalog = synthetic_catalog(tracker.get_all_exercises(), args.exercises)
+            tracker.close()
+        finally:
+            os.chdir(cwd)
+
+    start = time.perf_counter()
+    index = ExerciseSearchIndex(catalog)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    legacy_ms = time_queries(lambda q: legacy_search(catalog, q, EXERCISE_ABBREVIATIONS), args.rounds)
+    indexed_ms = time_queries(lambda q: index.search(q), args.rounds)
+
+    print(f"{len(catalog)} exercises, {len(QUERIES)} queries x {args.rounds} rounds")
+    print(f"index build: {build_ms:.1f} ms (once)")
+    print(f"legacy scan: {legacy_ms:.3f} ms/query")
+    print(f"indexed:     {indexed_ms:.3f} ms/query ({legacy_ms / indexed_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
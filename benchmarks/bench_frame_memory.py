@@ -0,0 +1,78 @@
+"""Memory per million sets of the compact get_data() frame vs the wide all-columns layout
+
+The wide layout is query_sets() with every column - what get_data() used to cache: object strings for
+exercise, notes and created_at, 64-bit numbers and datetime64[ns] dates. The compact frame keeps
+exercise as a categorical over the catalog, int16 set numbers and reps, float32 weight, RPE in half
+points as nullable Int8, int32 epoch-day dates and datetime64[s] created_at, and leaves the notes in SQLite.
+
+Measured with memory_usage(deep=True) on a 1,000,000-set synthetic history (pandas 3.0, Python 3.11):
+
+    wide      111.5 bytes/set   106.3 MB per million sets   cold load 14.9 s
+    compact    32.0 bytes/set    30.5 MB per million sets   cold load 16.3 s
+
+The biggest wins are exercise (20 -> 2 bytes) and created_at (27 -> 8); the notes cost nothing until
+get_set_notes() asks for them.
+
+Usage: python benchmarks/bench_frame_memory.py [--sets 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from synthetic_history import seed_tracker
+
+
+# Compact columns stored under another name than their wide counterpart
+COMPACT_NAMES = {'rpe': 'rpe_x2'}
+
+
+def column_bytes(frame):
+    """Deep bytes per column, index excluded"""
+    return frame.memory_usage(deep=True, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sets', type=int, default=1000000)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            from gym_tracker_core import GymTracker
+
+            tracker = GymTracker(os.path.join(workdir, 'frame_memory.db'))
+            sets = seed_tracker(tracker, args.sets)
+
+            start = time.perf_counter()
+            wide = tracker.query_sets()
+            wide_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            compact = tracker.get_data()
+            compact_s = time.perf_counter() - start
+            tracker.close()
+        finally:
+            os.chdir(cwd)
+
+    wide_bytes, compact_bytes = column_bytes(wide), column_bytes(compact)
+    print(f"{sets:,} sets")
+    print(f"{'column':<16}{'wide B/set':>12}{'compact B/set':>15}")
+    for column in wide_bytes.index:
+        compact_column = COMPACT_NAMES.get(column, column)
+        compact_cell = f"{compact_bytes[compact_column] / sets:>15.1f}" if compact_column in compact_bytes else f"{'lazy':>15}"
+        print(f"{column:<16}{wide_bytes[column] / sets:>12.1f}{compact_cell}")
+
+    print(f"\n{'layout':<10}{'B/set':>8}{'MB/million':>12}{'load s':>9}")
+    for name, total, seconds in (('wide', wide_bytes.sum(), wide_s), ('compact', compact_bytes.sum(), compact_s)):
+        print(f"{name:<10}{total / sets:>8.1f}{total / sets * 10 ** 6 / (1024 * 1024):>12.1f}{seconds:>9.2f}")
+    print(f"\ncompact is {wide_bytes.sum() / compact_bytes.sum():.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
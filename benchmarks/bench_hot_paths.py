@@ -0,0 +1,188 @@
+"""Scaling benchmark of the GymTracker hot paths on synthetic histories
+
+Seeds a fresh database per size with benchmarks/synthetic_history.py, then times log_workout,
+get_data (cold and cached), a 30-day query_sets projection, get_quick_stats, get_smart_suggestions,
+get_exercise_stats, get_goals and smart_exercise_search. Results are written as JSON; with --baseline every operation is compared
+to an earlier run and the exit status is 1 when any of them got slower than the tolerance allows.
+
+Usage: python benchmarks/bench_hot_paths.py [--sizes 1000,100000,1000000] [--athletes 1] [--years 5]
+                                            [--repeat 20] [--output results.json]
+                                            [--baseline old.json] [--tolerance 0.25]
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from synthetic_history import seed_tracker
+
+EXERCISES = ['Bench Press', 'Squat', 'Deadlift', 'Lat Pulldown']
+SEARCH_TERMS = ['bench', 'rdl', 'benhc press', 'lat pull', 'sq']
+
+# Differences below this many milliseconds are noise, whatever the ratio
+NOISE_FLOOR_MS = 0.5
+
+
+def time_calls(fn, repeat):
+    """Per-call milliseconds of fn: median, p95, min and max over repeat calls"""
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min_ms': samples[0],
+        'max_ms': samples[-1],
+        'calls': repeat
+    }
+
+
+def bench_size(workdir, size, args):
+    """Seed one database with size sets and time every hot path against it"""
+    from gym_tracker_core import GymTracker
+
+    db_name = os.path.join(workdir, f'bench_{size}.db')
+    tracker = GymTracker(db_name)
+
+    start = time.perf_counter()
+    sets = seed_tracker(tracker, size, args.athletes, args.years, args.seed)
+    seed_s = time.perf_counter() - start
+
+    tracker.create_goal('Bench 140', 'max_weight', 140, 'Bench Press')
+    tracker.create_goal('Squat volume', 'total_volume', 10 ** 9, 'Squat')
+    tracker.create_goal('Train often', 'workout_frequency', 200, target_date='2099-12-31')
+
+    today = date.today().strftime('%Y-%m-%d')
+    month_ago = (date.today() - timedelta(days=30)).strftime('%Y-%m-%d')
+
+    def cold_get_data(_):
+        tracker._workouts_frame = None
+        tracker.get_data()
+
+    results = {
+        'get_data_cold': time_calls(cold_get_data, max(3, args.repeat // 5)),
+        'get_data': time_calls(lambda _: tracker.get_data(), args.repeat),
+        'query_sets_30d': time_calls(lambda i: tracker.query_sets(['date', 'reps', 'weight'], [EXERCISES[i % len(EXERCISES)]], month_ago), args.repeat),
+        'get_quick_stats': time_calls(lambda _: tracker.get_quick_stats(), args.repeat),
+        'get_smart_suggestions': time_calls(lambda i: tracker.get_smart_suggestions(EXERCISES[i % len(EXERCISES)]), args.repeat),
+        'get_exercise_stats': time_calls(lambda i: tracker.get_exercise_stats(EXERCISES[i % len(EXERCISES)]), args.repeat),
+        'get_goals': time_calls(lambda _: tracker.get_goals(), args.repeat),
+        # The page helper smart_exercise_search is a thin wrapper over this
+        'smart_exercise_search': time_calls(lambda i: tracker.search_exercises(SEARCH_TERMS[i % len(SEARCH_TERMS)]), args.repeat),
+        # Last, so the other operations see exactly the seeded history
+        'log_workout': time_calls(lambda i: tracker.log_workout(today, 'Bench Press', [{'reps': 5, 'weight': 100.0 + i, 'rpe': 8}]), args.repeat),
+    }
+    tracker.close()
+
+    return {
+        'sets': sets,
+        'seed_seconds': seed_s,
+        'seed_sets_per_second': sets / seed_s if seed_s else None,
+        'file_size_bytes': os.path.getsize(db_name),
+        'operations': results
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Median-time regressions against a baseline run - a list of (size, operation, before, after)"""
+    regressions = []
+    for size, run in results['sizes'].items():
+        before_run = baseline.get('sizes', {}).get(size)
+        if before_run is None:
+            continue
+        for operation, timing in run['operations'].items():
+            before = before_run['operations'].get(operation)
+            if before is None:
+                continue
+            after_ms, before_ms = timing['median_ms'], before['median_ms']
+            timing['baseline_median_ms'] = before_ms
+            if after_ms > before_ms * (1 + tolerance) and after_ms - before_ms > NOISE_FLOOR_MS:
+                regressions.append((size, operation, before_ms, after_ms))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000', help='comma separated set counts')
+    parser.add_argument('--athletes', type=int, default=1)
+    parser.add_argument('--years', type=float, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--output', help='write the JSON results here as well as to stdout')
+    parser.add_argument('--baseline', help='earlier JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed median slowdown, 0.25 = 25%%')
+    args = parser.parse_args()
+
+    # Parse the baseline before spending minutes on seeding
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {
+        'meta': {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'athletes': args.athletes,
+            'years': args.years,
+            'seed': args.seed,
+            'repeat': args.repeat
+        },
+        'sizes': {}
+    }
+    # The seeded databases live and die in a temp dir; the caller's cwd is back before --output is written
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            for size in (int(s) for s in args.sizes.split(',')):
+                print(f"seeding and timing {size:,} sets...", file=sys.stderr)
+                results['sizes'][str(size)] = bench_size(workdir, size, args)
+        finally:
+            os.chdir(cwd)
+
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+    results['regressions'] = [
+        {'size': int(size), 'operation': operation, 'baseline_median_ms': before, 'median_ms': after}
+        for size, operation, before, after in regressions
+    ]
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+
+    # Human-readable summary on stderr so stdout stays valid JSON
+    for size, run in results['sizes'].items():
+        print(f"\n{int(size):,} sets (seeded at {run['seed_sets_per_second']:,.0f} sets/s)", file=sys.stderr)
+        for operation, timing in run['operations'].items():
+            before = timing.get('baseline_median_ms')
+            change = f"{timing['median_ms'] / before:>7.2f}x" if before else ''
+            print(f"  {operation:<24}{timing['median_ms']:>10.3f} ms{change}", file=sys.stderr)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:", file=sys.stderr)
+        for size, operation, before, after in regressions:
+            print(f"  {int(size):,} sets {operation}: {before:.3f} -> {after:.3f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
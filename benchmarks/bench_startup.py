@@ -0,0 +1,100 @@
+"""Import time and memory of the headless core vs the Streamlit app module, held to a budget
+
+Each import runs in a fresh interpreter. The core must not pull in Streamlit or any plotting library,
+and must stay within --budget-ms and --budget-mb; the exit status is 1 otherwise.
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--budget-ms 1500] [--budget-mb 120] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Modules the headless core must never import
+UI_MODULES = ['streamlit', 'plotly', 'matplotlib', 'seaborn']
+
+PROBE = '''
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{statement}
+import_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{
+    'import_ms': import_ms,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'added_rss_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024,
+    'modules': len(sys.modules),
+    'ui_modules': sorted({{name.split('.')[0] for name in sys.modules}} & set({ui_modules!r}))
+}}))
+'''
+
+TARGETS = {
+    'core': 'import gym_tracker_core',
+    'core + tracker': 'import gym_tracker_core; gym_tracker_core.GymTracker("startup.db").close()',
+    'app module': 'import gym_tracker_v7',
+}
+
+
+def probe(statement, workdir):
+    """Import statement in a fresh interpreter and return its measurements"""
+    code = PROBE.format(root=os.path.abspath(ROOT), statement=statement, ui_modules=UI_MODULES)
+    result = subprocess.run([sys.executable, '-c', code], cwd=workdir, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=1500, help='median import time allowed for the core')
+    parser.add_argument('--budget-mb', type=float, default=120, help='peak RSS allowed after importing the core')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in TARGETS.items():
+        # Every run gets a fresh directory so the app module's tracker starts from an empty database
+        runs = []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+                runs.append(probe(statement, workdir))
+        results[name] = {
+            'import_ms': statistics.median(run['import_ms'] for run in runs),
+            'rss_mb': statistics.median(run['rss_mb'] for run in runs),
+            'added_rss_mb': statistics.median(run['added_rss_mb'] for run in runs),
+            'modules': runs[-1]['modules'],
+            'ui_modules': runs[-1]['ui_modules']
+        }
+
+    core = results['core']
+    failures = []
+    if core['ui_modules']:
+        failures.append(f"core imports {', '.join(core['ui_modules'])}")
+    if core['import_ms'] > args.budget_ms:
+        failures.append(f"core import {core['import_ms']:.0f} ms > {args.budget_ms:.0f} ms budget")
+    if core['rss_mb'] > args.budget_mb:
+        failures.append(f"core RSS {core['rss_mb']:.0f} MB > {args.budget_mb:.0f} MB budget")
+
+    if args.json:
+        print(json.dumps({'results': results, 'budget_ms': args.budget_ms, 'budget_mb': args.budget_mb,
+                          'failures': failures}, indent=2))
+    else:
+        print(f"median of {args.runs} fresh interpreters")
+        print(f"{'target':<16}{'import ms':>11}{'RSS MB':>9}{'+RSS MB':>9}{'modules':>9}  UI modules")
+        for name, result in results.items():
+            print(f"{name:<16}{result['import_ms']:>11.0f}{result['rss_mb']:>9.1f}{result['added_rss_mb']:>9.1f}"
+                  f"{result['modules']:>9}  {', '.join(result['ui_modules']) or '-'}")
+        for failure in failures:
+            print(f"BUDGET EXCEEDED: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
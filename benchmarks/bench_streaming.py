@@ -0,0 +1,91 @@
+"""Peak memory of one pass over the whole history: query_sets() at once vs iter_sets() / iter_sessions()
+
+Every pass computes the same per-exercise tonnage. Peak Python heap (tracemalloc, which also sees the
+numpy buffers behind pandas) should grow with the history for query_sets and stay flat for the streams.
+
+Usage: python benchmarks/bench_streaming.py [--sizes 10000,100000,1000000] [--chunk-size 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from synthetic_history import seed_tracker
+
+
+def whole_frame(tracker, chunk_size):
+    """Tonnage per exercise from one frame of every set"""
+    df = tracker.query_sets(['exercise', 'reps', 'weight'])
+    return (df['reps'] * df['weight']).groupby(df['exercise']).sum().to_dict()
+
+
+def set_chunks(tracker, chunk_size):
+    """Tonnage per exercise summed chunk by chunk"""
+    tonnage = defaultdict(float)
+    for chunk in tracker.iter_sets(['exercise', 'reps', 'weight'], chunk_size=chunk_size):
+        for exercise, value in (chunk['reps'] * chunk['weight']).groupby(chunk['exercise']).sum().items():
+            tonnage[exercise] += value
+    return dict(tonnage)
+
+
+def raw_sessions(tracker, chunk_size):
+    """Tonnage per exercise summed session by session over plain tuples"""
+    tonnage = defaultdict(float)
+    for exercise, _, sets in tracker.iter_sessions(['reps', 'weight'], chunk_size=chunk_size, raw=True):
+        tonnage[exercise] += sum(reps * weight for reps, weight in sets)
+    return dict(tonnage)
+
+
+PASSES = {
+    'query_sets': whole_frame,
+    'iter_sets': set_chunks,
+    'iter_sessions raw': raw_sessions,
+}
+
+
+def measure(fn, tracker, chunk_size):
+    """Seconds and peak traced MB of one pass"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(tracker, chunk_size)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / (1024 * 1024), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='comma separated set counts')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            from gym_tracker_core import GymTracker
+
+            print(f"{'sets':>10}  {'pass':<20}{'seconds':>9}{'peak MB':>10}")
+            for size in (int(s) for s in args.sizes.split(',')):
+                tracker = GymTracker(os.path.join(workdir, f'stream_{size}.db'))
+                sets = seed_tracker(tracker, size)
+                expected = None
+                for name, fn in PASSES.items():
+                    seconds, peak_mb, result = measure(fn, tracker, args.chunk_size)
+                    # Every pass must see the same history
+                    expected = expected or result
+                    assert result.keys() == expected.keys()
+                    print(f"{sets:>10,}  {name:<20}{seconds:>9.2f}{peak_mb:>10.1f}")
+                tracker.close()
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Tap-to-feedback latency of LOG SET with synchronous commits vs write-behind logging
+
+Each "tap" is what the Quick Log page does on submit: quick_log, evaluate_goals and a get_data() reload.
+
+Usage: python benchmarks/bench_write_behind.py [--sets 20000] [--taps 200]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def seed(tracker, sets):
+    """Fill the tracker with a deterministic history, one workout per exercise and day"""
+    rng = random.Random(42)
+    exercises = ['Bench Press', 'Squat', 'Deadlift', 'Overhead Press', 'Barbell Row']
+    start = date.today() - timedelta(days=sets // 10 + 1)
+    tracker.log_workouts([
+        {
+            'date': (start + timedelta(days=i // 10)).strftime('%Y-%m-%d'),
+            'exercise': rng.choice(exercises),
+            'sets': [{'reps': rng.randint(3, 12), 'weight': rng.randint(20, 160) * 1.25, 'rpe': rng.randint(6, 10)}]
+        }
+        for i in range(sets)
+    ])
+
+
+def tap_latencies(tracker, taps):
+    """Milliseconds until quick_log returns and until the page has the new set, per tap"""
+    rng = random.Random(7)
+    date_str = date.today().strftime('%Y-%m-%d')
+    log_latencies, page_latencies = [], []
+    for _ in range(taps):
+        start = time.perf_counter()
+        tracker.quick_log('Bench Press', rng.randint(3, 12), rng.randint(20, 160) * 1.25, 8, '', '', date_str)
+        log_latencies.append((time.perf_counter() - start) * 1000)
+        tracker.evaluate_goals()
+        tracker.get_data()
+        page_latencies.append((time.perf_counter() - start) * 1000)
+        # Think time between taps - a real set takes far longer than the group-commit window
+        time.sleep(0.01)
+    return sorted(log_latencies), sorted(page_latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sets', type=int, default=20000)
+    parser.add_argument('--taps', type=int, default=200)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='gym_bench_') as workdir:
+        os.chdir(workdir)
+        try:
+            from gym_tracker_core import GymTracker
+
+            results = []
+            for name, write_behind in (('synchronous', False), ('write-behind', True)):
+                tracker = GymTracker(os.path.join(workdir, f'{name}.db'))
+                seed(tracker, args.sets)
+                tracker.create_goal('Bench 200', 'max_weight', 200, 'Bench Press')
+                tracker.get_data()
+                tracker.set_write_behind(write_behind)
+
+                log_latencies, latencies = tap_latencies(tracker, args.taps)
+                start = time.perf_counter()
+                tracker.flush()
+                flush_ms = (time.perf_counter() - start) * 1000
+                stored = len(tracker.get_data())
+                tracker.close()
+                results.append((name, log_latencies, latencies, flush_ms, stored))
+        finally:
+            os.chdir(cwd)
+
+    print(f"{args.sets} seeded sets, {args.taps} taps each (ms)")
+    print(f"{'mode':<14}{'log p50':>10}{'log p95':>10}{'tap p50':>10}{'tap p95':>10}{'flush':>10}{'stored':>10}")
+    for name, log_latencies, latencies, flush_ms, stored in results:
+        log_p50, log_p95 = (log_latencies[int(len(log_latencies) * q)] for q in (0.5, 0.95))
+        p50, p95 = (latencies[int(len(latencies) * q)] for q in (0.5, 0.95))
+        print(f"{name:<14}{log_p50:>10.3f}{log_p95:>10.3f}{p50:>10.3f}{p95:>10.3f}{flush_ms:>10.3f}{stored:>10}")
+
+
+if __name__ == '__main__':
+    main()
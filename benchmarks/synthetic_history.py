@@ -0,0 +1,109 @@
+"""Deterministic synthetic training histories for the benchmarks
+
+Every athlete follows a push/pull/legs split drawn from the built-in catalog: 3-5 sessions a week,
+4-6 exercises a session, 3-5 sets an exercise, with slow weight progression, periodic deloads and
+an RPE distribution centred on 8 (some sets unrated). The tracker has no athlete column, so several
+athletes' histories are interleaved in one database - the multi-athlete load the hot paths then see.
+"""
+import random
+from datetime import date, timedelta
+
+SPLIT = {
+    'push': ['Bench Press', 'Incline Dumbbell Press', 'Overhead Press', 'Lateral Raises', 'Tricep Dips',
+             'Tricep Pushdown', 'Dumbbell Flyes'],
+    'pull': ['Deadlift', 'Barbell Row', 'Pull-ups', 'Lat Pulldown', 'Seated Cable Row', 'Barbell Curls',
+             'Face Pulls'],
+    'legs': ['Squat', 'Romanian Deadlift', 'Leg Press', 'Hack Squat', 'Leg Curl', 'Leg Extension',
+             'Calf Raises']
+}
+
+# Starting working weight in kg for an average athlete
+START_WEIGHTS = {
+    'Bench Press': 60, 'Incline Dumbbell Press': 22, 'Overhead Press': 40, 'Lateral Raises': 8,
+    'Tricep Dips': 0, 'Tricep Pushdown': 20, 'Dumbbell Flyes': 12, 'Deadlift': 100,
+    'Barbell Row': 50, 'Pull-ups': 0, 'Lat Pulldown': 50, 'Seated Cable Row': 45, 'Barbell Curls': 25,
+    'Face Pulls': 15, 'Squat': 80, 'Romanian Deadlift': 70, 'Leg Press': 120, 'Hack Squat': 80,
+    'Leg Curl': 35, 'Leg Extension': 40, 'Calf Raises': 60
+}
+
+RPE_VALUES = [None, 6, 7, 8, 9, 10]
+RPE_WEIGHTS = [10, 8, 22, 32, 21, 7]
+
+
+def athlete_sessions(athlete, years, seed=0, end_date=None):
+    """Yield one athlete's sessions oldest first as lists of {date, exercise, sets, notes} workouts
+
+    The history ends at end_date (today by default, so streaks and weekly stats have recent data);
+    the same seed and end_date always give the same history.
+    """
+    rng = random.Random(f'{seed}:{athlete}')
+    end_date = end_date or date.today()
+    day = end_date - timedelta(days=int(years * 365))
+    strength = rng.uniform(0.7, 1.4)
+    sessions_per_week = rng.randint(3, 5)
+    rotation = list(SPLIT)
+    session_index = 0
+
+    while day <= end_date:
+        weeks = (end_date - day).days / 7
+        focus = rotation[session_index % len(rotation)]
+        # Every eighth week is a deload at 85%
+        progress = strength * (1 + 0.004 * (years * 52 - weeks)) * (0.85 if int(weeks) % 8 == 0 else 1.0)
+
+        workouts = []
+        for exercise in rng.sample(SPLIT[focus], rng.randint(4, 6)):
+            working = round(START_WEIGHTS[exercise] * progress / 1.25) * 1.25
+            sets = []
+            for set_number in range(1, rng.randint(3, 5) + 1):
+                reps = max(1, int(rng.gauss(9, 2.5)))
+                sets.append({
+                    'set_number': set_number,
+                    'reps': reps,
+                    'weight': max(0.0, working + rng.choice([-2.5, 0, 0, 0, 2.5])),
+                    'rpe': rng.choices(RPE_VALUES, RPE_WEIGHTS)[0],
+                    'set_notes': 'felt heavy' if rng.random() < 0.05 else ''
+                })
+            workouts.append({'date': day.strftime('%Y-%m-%d'), 'exercise': exercise, 'sets': sets, 'notes': ''})
+
+        yield workouts
+        session_index += 1
+        day += timedelta(days=max(1, round(rng.gauss(7 / sessions_per_week, 0.5))))
+
+
+def generate_history(target_sets, athletes=1, years=5, seed=0, end_date=None):
+    """Yield workout batches until about target_sets sets exist
+
+    Athletes train round-robin one session at a time; once every athlete's years are used up, further
+    cohorts start so any target size is reachable with a realistic per-athlete history.
+    """
+    produced = 0
+    cohort = 0
+    while produced < target_sets:
+        streams = [athlete_sessions(cohort * athletes + a, years, seed, end_date) for a in range(athletes)]
+        while streams and produced < target_sets:
+            for stream in list(streams):
+                workouts = next(stream, None)
+                if workouts is None:
+                    streams.remove(stream)
+                    continue
+                produced += sum(len(workout['sets']) for workout in workouts)
+                yield workouts
+                if produced >= target_sets:
+                    return
+        cohort += 1
+
+
+def seed_tracker(tracker, target_sets, athletes=1, years=5, seed=0, end_date=None, batch_sets=20000):
+    """Bulk insert a synthetic history through log_workouts - returns the number of sets written"""
+    pending, pending_sets, written = [], 0, 0
+    for workouts in generate_history(target_sets, athletes, years, seed, end_date):
+        pending.extend(workouts)
+        pending_sets += sum(len(workout['sets']) for workout in workouts)
+        if pending_sets >= batch_sets:
+            tracker.log_workouts(pending)
+            written += pending_sets
+            pending, pending_sets = [], 0
+    if pending:
+        tracker.log_workouts(pending)
+        written += pending_sets
+    return written
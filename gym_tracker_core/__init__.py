@@ -0,0 +1,31 @@
+"""Headless core of the gym tracker: data layer, analytics and chart builders without Streamlit
+
+Importing this package loads pandas and SQLite only; plotly is imported the first time a chart is built.
+"""
+from .catalog import (
+    BUILT_IN_CATEGORIES,
+    BUILT_IN_EXERCISES,
+    EXERCISE_ABBREVIATIONS,
+    EXERCISE_CATALOG,
+    ExerciseSearchIndex,
+)
+from .charts import FigureCache, build_trend_figure, build_volume_progress_figure, build_weight_progress_figure
+from .storage import ConnectionPool, InstrumentedConnection, InstrumentedCursor, Instrumentation
+from .tracker import GymTracker
+
+__all__ = [
+    'BUILT_IN_CATEGORIES',
+    'BUILT_IN_EXERCISES',
+    'EXERCISE_ABBREVIATIONS',
+    'EXERCISE_CATALOG',
+    'ConnectionPool',
+    'ExerciseSearchIndex',
+    'FigureCache',
+    'GymTracker',
+    'Instrumentation',
+    'InstrumentedConnection',
+    'InstrumentedCursor',
+    'build_trend_figure',
+    'build_volume_progress_figure',
+    'build_weight_progress_figure',
+]
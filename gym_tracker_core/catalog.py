@@ -0,0 +1,214 @@
+"""Built-in exercise catalog and the prebuilt exercise search index"""
+import bisect
+import difflib
+from types import MappingProxyType
+
+# ===== BUILT-IN EXERCISE CATALOG =====
+# Built-in exercise catalog by category - immutable, shared by every tracker
+EXERCISE_CATALOG = MappingProxyType({
+    'Chest': (
+        'Bench Press', 'Incline Bench Press', 'Decline Bench Press', 'Dumbbell Press', 'Incline Dumbbell Press',
+        'Decline Dumbbell Press', 'Dumbbell Flyes', 'Incline Dumbbell Flyes', 'Cable Crossover', 'Pec Deck',
+        'Chest Dips', 'Push-ups', 'Diamond Push-ups', 'Wide Grip Push-ups', 'Incline Push-ups', 'Machine Chest Press',
+        'Hammer Strength Chest Press', 'Landmine Press', 'Svend Press'
+    ),
+    'Back': (
+        'Deadlift', 'Romanian Deadlift', 'Sumo Deadlift', 'Stiff Leg Deadlift', 'Single Leg RDL', 'Barbell Row',
+        'Bent Over Row', 'Pendlay Row', 'T-Bar Row', 'Dumbbell Row', 'Single Arm Dumbbell Row', 'Chest Supported Row',
+        'Seated Cable Row', 'Wide Grip Cable Row', 'Pull-ups', 'Chin-ups', 'Wide Grip Pull-ups', 'Narrow Grip Pull-ups',
+        'Weighted Pull-ups', 'Lat Pulldown', 'Wide Grip Pulldown', 'Reverse Grip Pulldown', 'V-Bar Pulldown',
+        'Face Pulls', 'Reverse Flyes', 'Shrugs', 'Dumbbell Shrugs', 'Cable Shrugs', 'Good Mornings',
+        'Hyperextensions', 'Reverse Hyperextensions'
+    ),
+    'Legs': (
+        'Squat', 'Back Squat', 'Front Squat', 'Goblet Squat', 'Box Squat', 'Pause Squat', 'Bulgarian Split Squat',
+        'Split Squat', 'Reverse Lunge', 'Forward Lunge', 'Walking Lunges', 'Lateral Lunges', 'Curtsy Lunges',
+        'Jump Lunges', 'Hack Squat', 'Leg Press', 'Single Leg Press', 'Leg Extension', 'Leg Curl', 'Lying Leg Curl',
+        'Seated Leg Curl', 'Standing Leg Curl', 'Nordic Curls', 'Glute Ham Raise', 'Hip Thrust', 'Glute Bridge',
+        'Single Leg Hip Thrust', 'Barbell Hip Thrust', 'Dumbbell Hip Thrust', 'Cossack Squat', 'Pistol Squat',
+        'Jump Squat', 'Wall Sit', 'Step Ups', 'Lateral Step Ups'
+    ),
+    'Shoulders': (
+        'Overhead Press', 'Military Press', 'Push Press', 'Seated Overhead Press', 'Dumbbell Shoulder Press',
+        'Single Arm Overhead Press', 'Arnold Press', 'Machine Shoulder Press', 'Pike Push-ups', 'Lateral Raises',
+        'Side Lateral Raises', 'Front Raises', 'Rear Delt Flyes', 'Bent Over Lateral Raises', 'Cable Lateral Raises',
+        'Leaning Lateral Raises', 'Upright Row', 'High Pull', 'Handstand Push-ups', 'Cuban Press',
+        'Bradford Press'
+    ),
+    'Arms': (
+        'Bicep Curls', 'Barbell Curls', 'Dumbbell Curls', 'Hammer Curls', 'Concentration Curls', 'Preacher Curls',
+        'Spider Curls', 'Cable Curls', '21s', 'Zottman Curls', 'Reverse Curls', 'Drag Curls', 'Incline Dumbbell Curls',
+        'Cable Hammer Curls', 'Tricep Pushdown', 'Close Grip Bench Press', 'Tricep Dips', 'Diamond Push-ups',
+        'Overhead Tricep Extension', 'Lying Tricep Extension', 'Skull Crushers', 'French Press', 'Single Arm Tricep Extension',
+        'Tricep Kickbacks', 'Dumbbell Tricep Press'
+    ),
+    'Core': (
+        'Plank', 'Side Plank', 'Plank Up-Downs', 'Plank Jacks', 'Mountain Climbers', 'Crunches', 'Bicycle Crunches',
+        'Reverse Crunches', 'Russian Twists', 'Dead Bug', 'Bird Dog', 'Hollow Body Hold', 'V-Ups', 'Leg Raises',
+        'Hanging Leg Raises', 'Knee Raises', 'Windshield Wipers', 'Ab Wheel', 'Dragon Flag', 'L-Sits',
+        'Wood Chops', 'Cable Crunches', 'Machine Crunches', 'Sit-ups', 'Decline Sit-ups'
+    ),
+    'Other': (
+        'Calf Raises', 'Standing Calf Raises', 'Seated Calf Raises', 'Single Leg Calf Raises', 'Farmers Walk',
+        'Kettlebell Swings', 'Turkish Get-ups', 'Burpees', 'Battle Ropes'
+    )
+})
+
+# Every built-in name once, sorted, with the first category it is listed under
+BUILT_IN_EXERCISES = tuple(sorted({exercise for exercises in EXERCISE_CATALOG.values() for exercise in exercises}))
+BUILT_IN_CATEGORIES = MappingProxyType({
+    exercise: category
+    for category, exercises in reversed(list(EXERCISE_CATALOG.items()))
+    for exercise in exercises
+})
+
+# ===== EXERCISE SEARCH INDEX =====
+# Common abbreviations and synonyms
+EXERCISE_ABBREVIATIONS = {
+    'rdl': 'romanian deadlift',
+    'ohp': 'overhead press',
+    'bp': 'bench press',
+    'mp': 'military press',
+    'dl': 'deadlift',
+    'sq': 'squat',
+    'db': 'dumbbell',
+    'bb': 'barbell',
+    'cg': 'close grip',
+    'wg': 'wide grip',
+    'lat': 'lateral',
+    'tri': 'tricep',
+    'bi': 'bicep',
+    'leg ext': 'leg extension',
+    'leg cur': 'leg curl',
+    'calf': 'calf raises',
+    'pull up': 'pull-ups',
+    'chin up': 'chin-ups',
+    'push up': 'push-ups'
+}
+
+class ExerciseSearchIndex:
+    """Prebuilt trigram and token postings for ranked, typo-tolerant exercise search"""
+    
+    def __init__(self, exercises=()):
+        self.exercises = []
+        self._names = []
+        self._known = set()
+        self._trigrams = {}
+        self._tokens = {}
+        self._vocabulary = []
+        for exercise in exercises:
+            self.add(exercise)
+    
+    @staticmethod
+    def _trigrams_of(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _tokens_of(text):
+        return [token for token in text.replace('-', ' ').split() if token]
+    
+    def add(self, exercise):
+        """Index one more exercise name"""
+        if exercise in self._known:
+            return
+        
+        exercise_id = len(self.exercises)
+        name = exercise.lower()
+        self.exercises.append(exercise)
+        self._names.append(name)
+        self._known.add(exercise)
+        
+        for trigram in self._trigrams_of(name):
+            self._trigrams.setdefault(trigram, set()).add(exercise_id)
+        for token in self._tokens_of(name):
+            if token not in self._tokens:
+                bisect.insort(self._vocabulary, token)
+            self._tokens.setdefault(token, set()).add(exercise_id)
+    
+    def _substring_matches(self, query):
+        """Ids of exercises containing the query, narrowed by trigram postings"""
+        trigrams = self._trigrams_of(query)
+        if not trigrams:
+            return [i for i, name in enumerate(self._names) if query in name]
+        
+        postings = sorted((self._trigrams.get(t, set()) for t in trigrams), key=len)
+        candidates = set.intersection(*postings)
+        return [i for i in candidates if query in self._names[i]]
+    
+    def _token_prefix_matches(self, query_tokens):
+        """Ids of exercises where every query token starts some word of the name"""
+        matches = None
+        for query_token in query_tokens:
+            ids = set()
+            start = bisect.bisect_left(self._vocabulary, query_token)
+            for token in self._vocabulary[start:]:
+                if not token.startswith(query_token):
+                    break
+                ids |= self._tokens[token]
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return set()
+        return matches or set()
+    
+    def _close_word_matches(self, query_tokens):
+        """Ids of exercises with a word close to every query token, mapped to the mean closeness"""
+        matches = None
+        for query_token in query_tokens:
+            ids = {}
+            for token in difflib.get_close_matches(query_token, self._vocabulary, n=5, cutoff=0.6):
+                similarity = difflib.SequenceMatcher(None, query_token, token).ratio()
+                for i in self._tokens[token]:
+                    ids[i] = max(ids.get(i, 0), similarity)
+            matches = ids if matches is None else {i: matches[i] + ids[i] for i in matches.keys() & ids.keys()}
+            if not matches:
+                return {}
+        return {i: total / len(query_tokens) for i, total in (matches or {}).items()}
+    
+    def search(self, search_term, max_results=10):
+        """Return exercise names ranked by match quality"""
+        query = search_term.lower().strip()
+        if not query:
+            return self.exercises[:max_results]
+        
+        scores = {}
+        
+        def score(exercise_id, value):
+            if value > scores.get(exercise_id, 0):
+                scores[exercise_id] = value
+        
+        # Substring matches first, then abbreviation expansions of the whole query
+        variants = [(query, 100)]
+        if query in EXERCISE_ABBREVIATIONS:
+            variants.append((EXERCISE_ABBREVIATIONS[query], 90))
+        
+        for variant, base in variants:
+            for i in self._substring_matches(variant):
+                name = self._names[i]
+                bonus = 20 if name.startswith(variant) else 10 if f' {variant}' in f' {name}' else 0
+                score(i, base + bonus - len(name) / 100)
+        
+        # Words in any order ("press bench", "db row")
+        query_tokens = [EXERCISE_ABBREVIATIONS.get(t, t) for t in self._tokens_of(query)]
+        if len(query_tokens) > 1:
+            for i in self._token_prefix_matches([w for t in query_tokens for w in t.split()]):
+                score(i, 80 - len(self._names[i]) / 100)
+        
+        # Typo tolerance: share of the query's trigrams found in the name
+        query_trigrams = self._trigrams_of(query)
+        if len(query) >= 3 and query_trigrams:
+            overlap = {}
+            for trigram in query_trigrams:
+                for i in self._trigrams.get(trigram, ()):
+                    overlap[i] = overlap.get(i, 0) + 1
+            for i, shared in overlap.items():
+                similarity = shared / len(query_trigrams)
+                if similarity >= 0.4:
+                    score(i, 50 * similarity)
+        
+        # Short transpositions ("bnech", "sqaut") share almost no trigrams - fall back to close words
+        if not scores and len(query) >= 3:
+            for i, similarity in self._close_word_matches(self._tokens_of(query)).items():
+                score(i, 40 * similarity - len(self._names[i]) / 100)
+        
+        ranked = sorted(scores, key=lambda i: (-scores[i], self.exercises[i]))
+        return [self.exercises[i] for i in ranked[:max_results]]
@@ -0,0 +1,162 @@
+"""Progress chart builders and their cache - plotly is only imported when a chart is first built"""
+from collections import OrderedDict
+
+# ===== CHART CACHE =====
+class FigureCache:
+    """Bounded LRU of built chart figures keyed by (exercise, chart type) and the exercise's data version"""
+    
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._figures = OrderedDict()
+    
+    def get_or_build(self, exercise, version, chart, build):
+        """Return the cached figure for this exercise version, calling build() on a miss"""
+        key = (exercise, chart)
+        cached = self._figures.get(key)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            self._figures.move_to_end(key)
+            return cached[1]
+        
+        # A figure of an older version of this exercise is replaced in place
+        self.misses += 1
+        figure = build()
+        self._figures[key] = (version, figure)
+        self._figures.move_to_end(key)
+        while len(self._figures) > self.max_entries:
+            self._figures.popitem(last=False)
+            self.evictions += 1
+        return figure
+    
+    def clear(self):
+        """Drop every cached figure, keeping the counters"""
+        self._figures.clear()
+    
+    def get_stats(self):
+        """Entry count and hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._figures),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# ===== PROGRESS CHART BUILDERS =====
+def build_weight_progress_figure(exercise, daily_stats):
+    """Max and average weight per workout day"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    # Max weight line
+    fig.add_trace(go.Scatter(
+        x=daily_stats['date'], 
+        y=daily_stats['max_weight'],
+        mode='lines+markers',
+        name='Max Weight',
+        line=dict(color='#1e40af', width=3),
+        marker=dict(size=8, color='#1e40af')
+    ))
+    
+    # Average weight line
+    fig.add_trace(go.Scatter(
+        x=daily_stats['date'], 
+        y=daily_stats['avg_weight'],
+        mode='lines+markers',
+        name='Average Weight',
+        line=dict(color='#10b981', width=2, dash='dash'),
+        marker=dict(size=6, color='#10b981')
+    ))
+    
+    fig.update_layout(
+        title=f'{exercise} - Weight Progress',
+        xaxis_title='Date',
+        yaxis_title='Weight (kg)',
+        height=400,
+        paper_bgcolor='#ffffff',
+        plot_bgcolor='#f8fafc',
+        font=dict(color='#1e293b', size=12),
+        xaxis=dict(gridcolor='#e2e8f0'),
+        yaxis=dict(gridcolor='#e2e8f0'),
+        legend=dict(
+            bgcolor='rgba(248, 250, 252, 0.9)',
+            bordercolor='#e2e8f0',
+            borderwidth=1,
+            font=dict(color='#1e293b')
+        )
+    )
+    return fig
+
+def build_volume_progress_figure(exercise, daily_stats):
+    """Total volume per workout day"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_stats['date'], 
+        y=daily_stats['volume'],
+        mode='lines+markers',
+        name='Daily Volume',
+        line=dict(color='#f59e0b', width=3),
+        marker=dict(size=8, color='#f59e0b'),
+        fill='tonexty'
+    ))
+    
+    fig.update_layout(
+        title=f'{exercise} - Volume Progress',
+        xaxis_title='Date',
+        yaxis_title='Volume (kg)',
+        height=400,
+        paper_bgcolor='#ffffff',
+        plot_bgcolor='#f8fafc',
+        font=dict(color='#1e293b', size=12),
+        xaxis=dict(gridcolor='#e2e8f0'),
+        yaxis=dict(gridcolor='#e2e8f0')
+    )
+    return fig
+
+def build_trend_figure(exercise, period, rollups):
+    """Tonnage bars and max weight line per week or month"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=rollups['bucket'],
+        y=rollups['tonnage'],
+        name='Tonnage',
+        marker=dict(color='#93c5fd')
+    ))
+    fig.add_trace(go.Scatter(
+        x=rollups['bucket'],
+        y=rollups['max_weight'],
+        mode='lines+markers',
+        name='Max Weight',
+        yaxis='y2',
+        line=dict(color='#1e40af', width=3),
+        marker=dict(size=6, color='#1e40af')
+    ))
+    
+    fig.update_layout(
+        title=f'{exercise} - {period.title()} Trend',
+        xaxis_title='Week' if period == 'weekly' else 'Month',
+        yaxis=dict(title='Tonnage (kg)', gridcolor='#e2e8f0'),
+        yaxis2=dict(title='Max Weight (kg)', overlaying='y', side='right', showgrid=False),
+        height=400,
+        paper_bgcolor='#ffffff',
+        plot_bgcolor='#f8fafc',
+        font=dict(color='#1e293b', size=12),
+        xaxis=dict(gridcolor='#e2e8f0'),
+        legend=dict(
+            bgcolor='rgba(248, 250, 252, 0.9)',
+            bordercolor='#e2e8f0',
+            borderwidth=1,
+            font=dict(color='#1e293b')
+        )
+    )
+    return fig
@@ -0,0 +1,264 @@
+"""SQLite connection pooling and opt-in statement instrumentation"""
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# ===== PERSISTENT SQLITE CONNECTION POOL =====
+class ConnectionPool:
+    """Per-thread SQLite connections opened once with WAL mode and tuned PRAGMAs"""
+    
+    # Applied to every new connection; journal_mode=WAL is persisted in the file itself and
+    # auto_vacuum only takes effect on a new, empty file
+    PRAGMAS = (
+        'PRAGMA auto_vacuum = INCREMENTAL',
+        'PRAGMA journal_mode = WAL',
+        'PRAGMA synchronous = NORMAL',
+        'PRAGMA temp_store = MEMORY',
+        'PRAGMA cache_size = -16000',
+        'PRAGMA mmap_size = 134217728',
+        'PRAGMA busy_timeout = 5000'
+    )
+    
+    def __init__(self, db_name, cached_statements=256):
+        self.db_name = db_name
+        self.cached_statements = cached_statements
+        self.instrumentation = None
+        self._connections = {}
+        self._lock = threading.Lock()
+    
+    def _open(self):
+        """Open a connection in autocommit mode so transactions are explicit"""
+        conn = sqlite3.connect(
+            self.db_name,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            factory=sqlite3.Connection if self.instrumentation is None else InstrumentedConnection
+        )
+        if self.instrumentation is not None:
+            conn.instrumentation = self.instrumentation
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def set_instrumentation(self, instrumentation):
+        """Time every statement with the given Instrumentation, or stop with None - reopens the connections"""
+        self.instrumentation = instrumentation
+        self.close_all()
+    
+    def connection(self):
+        """Get the calling thread's connection, opening it on first use"""
+        thread = threading.current_thread()
+        conn = self._connections.get(thread)
+        if conn is None:
+            conn = self._open()
+            with self._lock:
+                # Streamlit runs each rerun on a fresh script thread - drop connections of finished ones
+                for dead in [t for t in self._connections if not t.is_alive()]:
+                    self._connections.pop(dead).close()
+                self._connections[thread] = conn
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Yield a cursor inside BEGIN IMMEDIATE; commit on success, roll back on error"""
+        conn = self.connection()
+        cursor = conn.cursor()
+        
+        # Nested use joins the outer transaction
+        if conn.in_transaction:
+            yield cursor
+            return
+        
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            yield cursor
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+    
+    @contextmanager
+    def snapshot(self):
+        """Yield a cursor inside a read transaction so every query sees the same data"""
+        conn = self.connection()
+        cursor = conn.cursor()
+        
+        if conn.in_transaction:
+            yield cursor
+            return
+        
+        cursor.execute('BEGIN')
+        try:
+            yield cursor
+        finally:
+            conn.commit()
+    
+    def close_all(self):
+        """Checkpoint the WAL into the main file and close every pooled connection"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        
+        for i, conn in enumerate(connections):
+            try:
+                if i == 0:
+                    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error:
+                pass
+            conn.close()
+
+# ===== OPT-IN INSTRUMENTATION =====
+class Instrumentation:
+    """Call counts, durations and rows for GymTracker methods and SQL statements, plus per-rerun page traces
+    
+    Method times are inclusive, so a method's time also shows up in the methods it calls.
+    """
+    
+    def __init__(self, max_traces=20):
+        self.methods = {}
+        self.statements = {}
+        self.traces = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    @staticmethod
+    def _statement_key(sql):
+        """Collapse whitespace so the same statement is counted once however it is indented"""
+        return ' '.join(str(sql).split())[:300]
+    
+    def _add(self, table, key, elapsed_ms, rows=0, calls=1):
+        with self._lock:
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0}
+            entry['calls'] += calls
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['rows'] += rows
+        
+        # Attribute SQL to the page this thread is rendering
+        page = getattr(self._local, 'page', None)
+        if page is not None and table is self.statements:
+            page['sql_calls'] += calls
+            page['sql_ms'] += elapsed_ms
+            page['sql_rows'] += rows
+    
+    def record_sql(self, sql, elapsed_ms, rows=0, calls=1):
+        self._add(self.statements, self._statement_key(sql), elapsed_ms, rows, calls)
+    
+    def wrap_method(self, name, method):
+        """Return method timed under name"""
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._add(self.methods, name, elapsed_ms)
+                page = getattr(self._local, 'page', None)
+                if page is not None:
+                    page['method_calls'] += 1
+        
+        timed.__name__ = name
+        timed.__doc__ = method.__doc__
+        timed.__wrapped__ = method
+        return timed
+    
+    @contextmanager
+    def trace(self):
+        """Record one Streamlit rerun - pages rendered inside it are attributed separately"""
+        trace = {'started_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'pages': [], 'total_ms': 0.0}
+        self._local.trace = trace
+        start = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            trace['total_ms'] = (time.perf_counter() - start) * 1000
+            self._local.trace = None
+            with self._lock:
+                self.traces.append(trace)
+    
+    @contextmanager
+    def page(self, page_name):
+        """Attribute the time, SQL and tracker calls of one page function to the current rerun"""
+        page = {'page': page_name, 'ms': 0.0, 'sql_calls': 0, 'sql_ms': 0.0, 'sql_rows': 0, 'method_calls': 0}
+        outer, self._local.page = getattr(self._local, 'page', None), page
+        start = time.perf_counter()
+        try:
+            yield page
+        finally:
+            page['ms'] = (time.perf_counter() - start) * 1000
+            self._local.page = outer
+            trace = getattr(self._local, 'trace', None)
+            if trace is not None:
+                trace['pages'].append(page)
+    
+    def reset(self):
+        with self._lock:
+            self.methods.clear()
+            self.statements.clear()
+            self.traces.clear()
+    
+    def report(self):
+        """Everything recorded so far, slowest first, ready for json.dumps"""
+        def ranked(table, key_name):
+            return [dict({key_name: key, 'avg_ms': entry['total_ms'] / entry['calls']}, **entry)
+                    for key, entry in sorted(table.items(), key=lambda item: -item[1]['total_ms'])]
+        
+        with self._lock:
+            return {
+                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'methods': ranked(self.methods, 'method'),
+                'statements': ranked(self.statements, 'sql'),
+                'reruns': list(self.traces)
+            }
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports each statement's execution time, and its fetch time and rows, to Instrumentation"""
+    
+    def _timed(self, sql, run, calls=1):
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            self._sql = sql
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.connection.instrumentation.record_sql(sql, elapsed_ms, max(self.rowcount, 0), calls)
+    
+    def execute(self, sql, parameters=()):
+        return self._timed(sql, lambda: super(InstrumentedCursor, self).execute(sql, parameters))
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self._timed(sql, lambda: super(InstrumentedCursor, self).executemany(sql, seq_of_parameters))
+    
+    def _fetched(self, fetch):
+        start = time.perf_counter()
+        rows = fetch()
+        count = (rows is not None) if not isinstance(rows, list) else len(rows)
+        self.connection.instrumentation.record_sql(getattr(self, '_sql', ''), (time.perf_counter() - start) * 1000, count, calls=0)
+        return rows
+    
+    def fetchone(self):
+        return self._fetched(super().fetchone)
+    
+    def fetchmany(self, size=None):
+        return self._fetched(lambda: super(InstrumentedCursor, self).fetchmany(self.arraysize if size is None else size))
+    
+    def fetchall(self):
+        return self._fetched(super().fetchall)
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors, including the execute() shortcuts, are InstrumentedCursors"""
+    
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+    
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
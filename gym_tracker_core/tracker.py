@@ -0,0 +1,2372 @@
+"""GymTracker - the SQLite-backed data layer and analytics behind the app, free of any UI imports"""
+import atexit
+import bisect
+import gzip
+import hashlib
+import io
+import json
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .catalog import BUILT_IN_CATEGORIES, ExerciseSearchIndex
+from .storage import ConnectionPool, Instrumentation
+
+# ===== AI-ENHANCED GITHUB-PERSISTENT GYM TRACKER V9 - SMART FITNESS COMPANION =====
+class GymTracker:
+    def __init__(self, db_name='gym_tracker_MASTER.db', write_behind=False):
+        """Initialize AI-Enhanced GitHub-Persistent Gym Tracker with smart features"""
+        self.db_name = db_name
+        self.pool = ConnectionPool(db_name)
+        
+        # In-memory workout frame, valid while its version matches data_versions
+        self._data_lock = threading.RLock()
+        self._workouts_frame = None
+        self._workouts_version = None
+        
+        # Merged exercise catalog and its search index, keyed by the custom_exercises version
+        self._all_exercises = None
+        self._exercise_categories = {}
+        self._catalog_version = None
+        self._search_index = None
+        
+        # Write-behind logging: sets queued for the process-wide writer, visible to reads until committed
+        self.write_behind = False
+        self._pending_writes = {}
+        self._pending_done = threading.Condition()
+        self._write_behind_error = None
+        self._completed_goals = []
+        
+        # Opt-in method and SQL timing, see enable_instrumentation()
+        self.instrumentation = None
+        
+        # Previous-version database whose workouts were imported into this new one, if any
+        self.migrated_from = None
+        
+        self.init_database()
+        self.set_write_behind(write_behind)
+    
+    def close(self):
+        """Commit queued writes and close all pooled database connections"""
+        self.set_write_behind(False)
+        self.pool.close_all()
+    
+    # Instrumentation controls are never timed themselves
+    UNINSTRUMENTED_METHODS = {'enable_instrumentation', 'disable_instrumentation', 'get_instrumentation_report', 'dump_instrumentation'}
+    
+    def enable_instrumentation(self, instrumentation=None):
+        """Time every tracker method and SQL statement from now on - returns the Instrumentation recording them"""
+        if self.instrumentation is not None:
+            return self.instrumentation
+        
+        self.flush()
+        self.instrumentation = instrumentation or Instrumentation()
+        for name in dir(type(self)):
+            if name.startswith('__') or name in self.UNINSTRUMENTED_METHODS or not callable(getattr(type(self), name)):
+                continue
+            setattr(self, name, self.instrumentation.wrap_method(name, getattr(self, name)))
+        self.pool.set_instrumentation(self.instrumentation)
+        return self.instrumentation
+    
+    def disable_instrumentation(self):
+        """Stop timing and restore the plain methods and connections"""
+        if self.instrumentation is None:
+            return
+        
+        self.flush()
+        for name, value in list(vars(self).items()):
+            if getattr(value, '__wrapped__', None) is not None and callable(value):
+                delattr(self, name)
+        self.instrumentation = None
+        self.pool.set_instrumentation(None)
+    
+    def get_instrumentation_report(self):
+        """Method, SQL and per-rerun timings recorded so far, or None when instrumentation is off"""
+        return self.instrumentation.report() if self.instrumentation is not None else None
+    
+    def dump_instrumentation(self, dump_file='gym_tracker_profile.json'):
+        """Write the instrumentation report to a JSON file"""
+        report = self.get_instrumentation_report()
+        if report is None:
+            return "❌ Instrumentation is not enabled"
+        
+        with open(dump_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+        return f"✅ Wrote {len(report['methods'])} methods and {len(report['statements'])} statements to {dump_file}"
+        
+    def is_database_empty(self):
+        """Check if database is completely empty"""
+        try:
+            cursor = self.pool.connection().cursor()
+            cursor.execute('SELECT EXISTS (SELECT 1 FROM workouts)')
+            return cursor.fetchone()[0] == 0
+        except:
+            return True
+    
+    # Ordered schema upgrades - each step runs once and bumps PRAGMA user_version
+    SCHEMA_MIGRATIONS = [
+        (1, '_migration_add_indexes'),
+        (2, '_migration_import_legacy_databases'),
+        (3, '_migration_add_data_versions'),
+        (4, '_migration_add_exercise_summary'),
+        (5, '_migration_version_custom_exercises'),
+        (6, '_migration_store_goal_progress'),
+        (7, '_migration_add_content_hashes'),
+        (8, '_migration_add_offline_retry_state'),
+        (9, '_migration_add_exercise_versions'),
+        (10, '_migration_add_exercise_rollups'),
+        (11, '_migration_add_maintenance_log'),
+    ]
+    
+    # Offline entries that failed this many syncs are kept but no longer retried
+    OFFLINE_MAX_ATTEMPTS = 5
+    
+    # Write-behind group commits: wait this long for more sets, up to this many workouts per transaction
+    GROUP_COMMIT_WINDOW = 0.05
+    GROUP_COMMIT_MAX_WORKOUTS = 100
+    
+    # Rollup granularities and the SQL for the bucket a set falls in - the first day of its day, ISO week or month
+    # (_rollup_bucket_keys() computes the same buckets in Python for the streaming rebuild)
+    ROLLUP_BUCKETS = {
+        'daily': "substr(date, 1, 10)",
+        'weekly': "date(substr(date, 1, 10), '-' || ((CAST(strftime('%w', substr(date, 1, 10)) AS INTEGER) + 6) % 7) || ' days')",
+        'monthly': "substr(date, 1, 7) || '-01'"
+    }
+    
+    # GitHub rejects files above this size
+    GITHUB_SIZE_LIMIT = 100 * 1024 * 1024
+    
+    # Scheduled maintenance runs at most this often; the size projection uses this much recent history
+    MAINTENANCE_INTERVAL_DAYS = 7
+    INGEST_WINDOW_DAYS = 90
+    
+    # Columns kept in the compact in-memory frame - the notes are fetched on demand (content_hash stays in SQLite)
+    COMPACT_COLUMNS = 'id, date, exercise, set_number, reps, weight, rpe, created_at'
+    
+    # Columns query_sets() can project and the dtype each comes back as (None: text, as read)
+    SET_COLUMNS = {
+        'id': 'int64',
+        'date': 'datetime64[ns]',
+        'exercise': None,
+        'set_number': 'int64',
+        'reps': 'int64',
+        'weight': 'float64',
+        'rpe': 'float64',
+        'set_notes': None,
+        'workout_notes': None,
+        'created_at': None
+    }
+    SET_ORDER = ['date', 'exercise', 'set_number']
+    
+    def init_database(self):
+        """Create all database tables and apply pending schema migrations"""
+        with self.pool.transaction() as cursor:
+            self._create_tables(cursor)
+            self.migrate_schema(cursor)
+    
+    def migrate_schema(self, cursor):
+        """Upgrade the database in place to the latest schema version"""
+        cursor.execute('PRAGMA user_version')
+        current_version = cursor.fetchone()[0]
+        
+        for version, migration in self.SCHEMA_MIGRATIONS:
+            if version > current_version:
+                getattr(self, migration)(cursor)
+                cursor.execute(f'PRAGMA user_version = {version}')
+        
+        return max(current_version, self.SCHEMA_MIGRATIONS[-1][0])
+    
+    def _migration_add_indexes(self, cursor):
+        """Index the hot date, exercise and (exercise, date) lookups"""
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_workouts_exercise_date ON workouts (exercise, date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_workouts_date ON workouts (date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_daily_programs_date ON daily_programs (date)')
+    
+    def _migration_add_data_versions(self, cursor):
+        """Count every change to workouts so caches can tell when they are stale"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS data_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES ('workouts', 0)")
+        
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_workouts_version_{event.lower()}
+                AFTER {event} ON workouts
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = 'workouts';
+                END
+            ''')
+    
+    def _migration_version_custom_exercises(self, cursor):
+        """Count changes to custom_exercises so the merged exercise catalog can be cached"""
+        cursor.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES ('custom_exercises', 0)")
+        
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_custom_exercises_version_{event.lower()}
+                AFTER {event} ON custom_exercises
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = 'custom_exercises';
+                END
+            ''')
+    
+    def _migration_add_exercise_summary(self, cursor):
+        """Materialize per-exercise facts so reads stop rescanning workouts"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS exercise_summary (
+                exercise TEXT PRIMARY KEY,
+                max_weight REAL NOT NULL,
+                last_date TEXT NOT NULL,
+                last_session TEXT NOT NULL,
+                total_volume REAL NOT NULL,
+                total_sets INTEGER NOT NULL,
+                workout_count INTEGER NOT NULL,
+                rpe_sum REAL NOT NULL,
+                rpe_count INTEGER NOT NULL
+            )
+        ''')
+        self._rebuild_exercise_summary(cursor)
+    
+    def _migration_store_goal_progress(self, cursor):
+        """Index goals by target exercise and bring every stored current_value up to date"""
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_goals_type_exercise ON goals (goal_type, target_exercise)')
+        self._refresh_goal_values(cursor)
+    
+    def _migration_add_content_hashes(self, cursor, chunk_size=50000):
+        """Fingerprint every set so imports can skip sets that are already present
+        
+        Streams the table a chunk at a time: first every set gets the hash of its content, then SQLite numbers
+        the repeats of each hash in id order and only those few rows are re-hashed with their occurrence.
+        """
+        cursor.execute('PRAGMA table_info(workouts)')
+        if 'content_hash' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE workouts ADD COLUMN content_hash TEXT')
+        
+        # Updates go through a second cursor so the first one keeps streaming
+        writer = cursor.connection.cursor()
+        cursor.execute('''
+            SELECT id, date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes
+            FROM workouts ORDER BY id
+        ''')
+        for rows in self._iter_rows(cursor, chunk_size):
+            writer.executemany('UPDATE workouts SET content_hash = ? WHERE id = ?',
+                               [(self._content_hash(*row[1:]), row[0]) for row in rows])
+        
+        cursor.execute('''
+            SELECT id, date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, occurrence
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY content_hash ORDER BY id) - 1 AS occurrence
+                FROM workouts
+            )
+            WHERE occurrence > 0
+        ''')
+        for rows in self._iter_rows(cursor, chunk_size):
+            writer.executemany('UPDATE workouts SET content_hash = ? WHERE id = ?',
+                               [(self._content_hash(*row[1:9], occurrence=row[9]), row[0]) for row in rows])
+        
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_workouts_content_hash ON workouts (content_hash)')
+    
+    def _migration_add_offline_retry_state(self, cursor):
+        """Track sync attempts per offline entry and index the unsynced ones"""
+        cursor.execute('PRAGMA table_info(offline_queue)')
+        columns = [column[1] for column in cursor.fetchall()]
+        if 'attempts' not in columns:
+            cursor.execute('ALTER TABLE offline_queue ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+        if 'last_error' not in columns:
+            cursor.execute('ALTER TABLE offline_queue ADD COLUMN last_error TEXT')
+        if 'synced_at' not in columns:
+            cursor.execute('ALTER TABLE offline_queue ADD COLUMN synced_at TIMESTAMP')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_offline_queue_pending ON offline_queue (id) WHERE synced = 0')
+    
+    def _migration_add_exercise_versions(self, cursor):
+        """Count changes per exercise so per-exercise caches survive writes to other exercises"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS exercise_versions (
+                exercise TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('INSERT OR IGNORE INTO exercise_versions (exercise, version) SELECT DISTINCT exercise, 1 FROM workouts')
+        
+        for event, rows in (('INSERT', ('NEW',)), ('UPDATE', ('OLD', 'NEW')), ('DELETE', ('OLD',))):
+            bumps = ''.join(f'''
+                    INSERT INTO exercise_versions (exercise, version) VALUES ({row}.exercise, 1)
+                    ON CONFLICT (exercise) DO UPDATE SET version = version + 1;''' for row in rows)
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_exercise_versions_{event.lower()}
+                AFTER {event} ON workouts
+                BEGIN{bumps}
+                END
+            ''')
+    
+    def _migration_add_exercise_rollups(self, cursor):
+        """Pre-aggregate sets per exercise and day, ISO week and month for long-range charts"""
+        for period in self.ROLLUP_BUCKETS:
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS exercise_rollup_{period} (
+                    exercise TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    tonnage REAL NOT NULL,
+                    set_count INTEGER NOT NULL,
+                    rep_count INTEGER NOT NULL,
+                    max_weight REAL NOT NULL,
+                    rpe_sum REAL NOT NULL,
+                    rpe_count INTEGER NOT NULL,
+                    PRIMARY KEY (exercise, bucket)
+                ) WITHOUT ROWID
+            ''')
+        self._rebuild_rollups(cursor)
+    
+    def _migration_add_maintenance_log(self, cursor):
+        """Record every storage maintenance run so it can be scheduled"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS maintenance_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ran_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                trigger TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                pages_before INTEGER NOT NULL,
+                pages_after INTEGER NOT NULL,
+                freelist_before INTEGER NOT NULL,
+                freelist_after INTEGER NOT NULL
+            )
+        ''')
+    
+    def _migration_import_legacy_databases(self, cursor):
+        """Import workouts from the first previous-version database found - only for a new, empty database"""
+        if not self.is_database_empty():
+            return
+        
+        old_db_names = [
+            'complete_gym_app.db', 'demo_workout.db', 'gym_app.db',
+            'gym_tracker_v2.db', 'gym_tracker_v2.1.db', 'gym_tracker_v3.db',
+            'gym_tracker_v4.db', 'gym_tracker_v5.db', 'gym_tracker_v6.db',
+            'gym_tracker_v7.db', 'workout_tracker.db'
+        ]
+        
+        cursor.execute('PRAGMA table_info(workouts)')
+        workout_columns = [row[1] for row in cursor.fetchall()]
+        
+        for old_db in old_db_names:
+            if not os.path.exists(old_db) or old_db == self.db_name:
+                continue
+            
+            try:
+                old_conn = sqlite3.connect(old_db)
+                try:
+                    old_cursor = old_conn.cursor()
+                    old_cursor.execute('PRAGMA table_info(workouts)')
+                    columns = [row[1] for row in old_cursor.fetchall() if row[1] in workout_columns]
+                    if not columns:
+                        continue
+                    
+                    # Copied in chunks so an old database of any size never sits in memory at once
+                    column_list = ', '.join(columns)
+                    placeholders = ', '.join('?' for _ in columns)
+                    old_cursor.execute(f'SELECT {column_list} FROM workouts')
+                    copied = 0
+                    for rows in self._iter_rows(old_cursor, 10000):
+                        cursor.executemany(f'INSERT INTO workouts ({column_list}) VALUES ({placeholders})', rows)
+                        copied += len(rows)
+                finally:
+                    old_conn.close()
+                
+                if copied:
+                    self.migrated_from = old_db
+                    break  # Stop after first successful migration
+            
+            except sqlite3.Error:
+                cursor.execute('DELETE FROM workouts')
+                continue
+    
+    def _create_tables(self, cursor):
+        """Create the base tables on an open cursor"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS workouts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                exercise TEXT NOT NULL,
+                set_number INTEGER NOT NULL,
+                reps INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                rpe INTEGER,
+                set_notes TEXT,
+                workout_notes TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS custom_exercises (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                exercise_name TEXT UNIQUE NOT NULL,
+                category TEXT,
+                description TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS workout_templates (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                template_name TEXT UNIQUE NOT NULL,
+                category TEXT,
+                description TEXT,
+                created_by TEXT,
+                exercises TEXT,
+                is_public INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_used TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_programs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                program_name TEXT,
+                created_by TEXT,
+                program_notes TEXT,
+                exercises TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS goals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                goal_name TEXT NOT NULL,
+                goal_type TEXT NOT NULL,
+                target_value REAL,
+                target_exercise TEXT,
+                target_date TEXT,
+                current_value REAL DEFAULT 0,
+                is_completed INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS offline_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workout_data TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                synced INTEGER DEFAULT 0
+            )
+        ''')
+    
+    def log_workout(self, date_str, exercise, sets_data, workout_notes=""):
+        """Log a complete workout with multiple sets"""
+        self.log_workouts([{'date': date_str, 'exercise': exercise, 'sets': sets_data, 'notes': workout_notes}])
+        return f"✅ Logged {len(sets_data)} sets for {exercise}"
+    
+    def log_workouts(self, workouts):
+        """Bulk insert workouts ({date, exercise, sets, notes}) in one transaction - returns the new row ids"""
+        # Same rules as imports and offline sync, so e.g. an RPE of 8.25 never reaches the table
+        rows = [self._valid_set_row(row) for workout in workouts for row in self._workout_rows(workout)]
+        if not rows:
+            return []
+        
+        # Write-behind: return at once, the background writer commits (ids are not known yet)
+        if self.write_behind:
+            self._enqueue_workouts(workouts, rows)
+            return []
+        
+        new_ids, _ = self._commit_rows(rows)
+        return new_ids
+    
+    def _commit_rows(self, rows, entries=()):
+        """Insert rows in one transaction and patch the cached frame - returns the new ids and data version
+        
+        Queued write-behind entries holding these rows get the new version before the commit makes the rows
+        visible, so no reader ever sees a set both committed and in the pending overlay.
+        """
+        with self.pool.transaction() as cursor:
+            base_version = self.get_data_version(cursor)
+            last_id, new_ids = self._insert_sets(cursor, rows)
+            new_rows = self._fetch_workout_rows(cursor, last_id) if self._workouts_frame is not None else None
+            new_version = self.get_data_version(cursor)
+            with self._data_lock:
+                for entry in entries:
+                    entry['version'] = new_version
+        
+        self._patch_workouts_cache(base_version, new_version, added=new_rows)
+        return new_ids, new_version
+    
+    @staticmethod
+    def _workout_rows(workout):
+        """Insert rows for one {date, exercise, sets, notes} workout"""
+        return [
+            (workout['date'], workout['exercise'], set_data.get('set_number', i),
+             set_data['reps'], set_data['weight'], set_data.get('rpe'),
+             set_data.get('set_notes', ''), workout.get('notes', ''))
+            for i, set_data in enumerate(workout['sets'], 1)
+        ]
+    
+    def _insert_sets(self, cursor, rows, hashes=None, rebuild_summary=False):
+        """Insert (date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes) rows and fold them
+        into the summary and goals inside the caller's transaction - returns the previous max id and the new ids
+        
+        Without precomputed content hashes each set gets the next free occurrence of its content's hash.
+        rebuild_summary=True recomputes the touched exercises in one pass, which is cheaper for large imports.
+        """
+        if hashes is None:
+            hashes = []
+            next_occurrences = {}
+            for row in rows:
+                first = self._content_hash(*row)
+                occurrence = next_occurrences.get(first)
+                if occurrence is None:
+                    occurrence = 0
+                    while self._content_hash_exists(cursor, self._content_hash(*row, occurrence=occurrence)):
+                        occurrence += 1
+                hashes.append(self._content_hash(*row, occurrence=occurrence))
+                next_occurrences[first] = occurrence + 1
+        
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM workouts')
+        last_id = cursor.fetchone()[0]
+        
+        cursor.executemany('''
+            INSERT INTO workouts (date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [row + (content_hash,) for row, content_hash in zip(rows, hashes)])
+        
+        # We hold the write lock, so every id above the previous maximum is ours
+        cursor.execute('SELECT id FROM workouts WHERE id > ? ORDER BY id', (last_id,))
+        new_ids = [row[0] for row in cursor.fetchall()]
+        
+        # Summary updates go per exercise and day, oldest first
+        sessions = {}
+        for date_str, exercise, set_number, reps, weight, rpe, _, _ in rows:
+            sessions.setdefault((date_str, exercise), []).append((set_number, reps, weight, rpe))
+        
+        exercises = {exercise for _, exercise in sessions}
+        if rebuild_summary:
+            self._rebuild_exercise_summary(cursor, sorted(exercises))
+        else:
+            for (date_str, exercise), session_sets in sorted(sessions.items()):
+                self._summary_add_sets(cursor, date_str, exercise, session_sets)
+        self._rollups_add_sets(cursor, last_id)
+        self._refresh_goal_values(cursor, exercises, {date_str for date_str, _ in sessions})
+        
+        return last_id, new_ids
+    
+    @staticmethod
+    def _valid_set_row(row):
+        """Check an insert row with the same rules as _backup_set_row and normalize its numbers - ValueError if unusable"""
+        date_str, exercise, set_number, reps, weight, rpe, set_notes, workout_notes = row
+        date.fromisoformat(str(date_str)[:10])
+        if not isinstance(exercise, str) or not exercise.strip():
+            raise ValueError('missing exercise')
+        
+        set_number, reps, weight = int(set_number), int(reps), float(weight)
+        rpe = None if rpe is None else float(rpe)
+        if reps < 0 or not math.isfinite(weight) or weight < 0:
+            raise ValueError(f'reps {reps} or weight {weight} out of range')
+        if rpe is not None and not (0 <= rpe <= 10 and (rpe * 2).is_integer()):
+            raise ValueError(f'rpe {rpe} is not a half point from 0 to 10')
+        return (date_str, exercise, set_number, reps, weight, rpe, set_notes or '', workout_notes or '')
+    
+    @staticmethod
+    def _content_hash(date_str, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, occurrence=0):
+        """Fingerprint of a set's content, independent of its id and creation time
+        
+        Identical sets (e.g. quick-logged one at a time) are told apart by their occurrence number.
+        """
+        content = '\x1f'.join((
+            str(date_str)[:10], exercise, str(int(set_number)), str(int(reps)), repr(float(weight)),
+            '' if rpe is None else repr(float(rpe)), set_notes or '', workout_notes or ''
+        ))
+        if occurrence:
+            content += f'\x1e{occurrence}'
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _content_hash_exists(self, cursor, content_hash):
+        """Whether a set with this content hash is stored"""
+        cursor.execute('SELECT 1 FROM workouts WHERE content_hash = ?', (content_hash,))
+        return cursor.fetchone() is not None
+    
+    def set_write_behind(self, enabled):
+        """Switch write-behind logging on or off - switching off commits everything still queued first
+        
+        Every tracker shares one background writer thread, so sessions that turn this on start no threads
+        of their own and leave nothing running when they end.
+        """
+        if enabled and not self.write_behind:
+            _WRITER.start()
+            self.write_behind = True
+        elif not enabled and self.write_behind:
+            self.flush()
+            self.write_behind = False
+    
+    def flush(self):
+        """Block until every queued write-behind workout of this tracker is committed"""
+        with self._pending_done:
+            self._pending_done.wait_for(lambda: not self._pending_writes)
+    
+    def get_write_behind_status(self):
+        """Queued workouts not yet committed and the last background write error, if any"""
+        return {'enabled': self.write_behind, 'pending_workouts': len(self._pending_writes), 'last_error': self._write_behind_error}
+    
+    def _enqueue_workouts(self, workouts, rows):
+        """Hand workouts to the background writer and show them to readers until they are committed"""
+        entry = {'workouts': workouts, 'rows': rows, 'version': None}
+        with self._pending_done:
+            self._pending_writes[id(entry)] = entry
+        _WRITER.put(self, entry)
+    
+    def _commit_pending(self, entries):
+        """Commit a group of queued workouts in one transaction, falling back to the offline queue on failure"""
+        try:
+            _, version = self._commit_rows([row for entry in entries for row in entry['rows']], entries)
+            self._write_behind_error = None
+        except Exception as e:
+            # Nothing is lost - the workouts wait in the durable offline queue instead
+            self._write_behind_error = str(e)
+            version = -1
+            for entry in entries:
+                for workout in entry['workouts']:
+                    self.queue_offline_workout(workout)
+                entry['version'] = version
+        
+        with self._pending_done:
+            for entry in entries:
+                self._pending_writes.pop(id(entry), None)
+            self._pending_done.notify_all()
+        
+        if version >= 0:
+            try:
+                self._completed_goals.extend(self._evaluate_goals())
+            except Exception:
+                pass
+    
+    def _pending_snapshot(self):
+        """Queued write-behind entries - taken before a read so commits racing it are not missed"""
+        return list(self._pending_writes.values()) if self._pending_writes else []
+    
+    @staticmethod
+    def _uncommitted_rows(pending, version):
+        """Queued insert rows that the data read at `version` does not contain yet"""
+        return [row for entry in pending if entry['version'] is None or entry['version'] > version for row in entry['rows']]
+    
+    def _with_pending(self, frame, pending, version, date_str=None):
+        """Overlay queued sets that the data read at `version` does not contain yet"""
+        rows = self._uncommitted_rows(pending, version)
+        if date_str is not None:
+            rows = [row for row in rows if str(row[0])[:10] == date_str]
+        if not rows:
+            return frame
+        
+        overlay = pd.DataFrame(rows, columns=['date', 'exercise', 'set_number', 'reps', 'weight', 'rpe', 'set_notes', 'workout_notes'])
+        # Pending sets have no row id yet
+        overlay.insert(0, 'id', -np.arange(1, len(overlay) + 1))
+        overlay['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        overlay['rpe'] = pd.to_numeric(overlay['rpe'])
+        if 'date' in frame.columns:
+            overlay['date'] = pd.to_datetime(overlay['date']) if pd.api.types.is_datetime64_any_dtype(frame['date']) else overlay['date']
+        
+        overlay = overlay[[column for column in frame.columns if column in overlay.columns]]
+        if date_str is not None:
+            merged = pd.concat([frame, overlay], ignore_index=True)
+            return merged.sort_values(['exercise', 'set_number'], kind='stable', ignore_index=True)
+        
+        # The frame is newest first and pending sets are usually today's - only re-sort the rows they land among
+        cut = int((frame['date'] >= overlay['date'].min()).sum()) if len(frame) else 0
+        head = pd.concat([frame.iloc[:cut], overlay], ignore_index=True)
+        head = head.sort_values(['date', 'exercise', 'set_number'], ascending=[False, True, True], kind='stable')
+        return pd.concat([head, frame.iloc[cut:]], ignore_index=True)
+    
+    def quick_log(self, exercise, reps, weight, rpe=None, set_notes="", workout_notes="", date_str=None):
+        """Quick log a single set"""
+        if date_str is None:
+            date_str = date.today().strftime('%Y-%m-%d')
+        
+        self.log_workout(date_str, exercise, [{'reps': reps, 'weight': weight, 'rpe': rpe, 'set_notes': set_notes}], workout_notes)
+    
+    def delete_set(self, set_id):
+        """Delete a specific set by ID"""
+        self.flush()
+        with self.pool.transaction() as cursor:
+            base_version = self.get_data_version(cursor)
+            cursor.execute('SELECT exercise, date FROM workouts WHERE id = ?', (set_id,))
+            deleted = cursor.fetchone()
+            cursor.execute('DELETE FROM workouts WHERE id = ?', (set_id,))
+            rows_affected = cursor.rowcount
+            if deleted:
+                self._rebuild_exercise_summary(cursor, [deleted[0]])
+                self._rebuild_rollups(cursor, [deleted[0]])
+                self._refresh_goal_values(cursor, [deleted[0]], [deleted[1]])
+            new_version = self.get_data_version(cursor)
+        
+        self._patch_workouts_cache(base_version, new_version, deleted_ids=[set_id])
+        return "✅ Set deleted successfully!" if rows_affected > 0 else "❌ Set not found!"
+    
+    def get_daily_workout(self, date_str):
+        """Get all exercises and sets for a specific date, including sets still queued for write-behind"""
+        try:
+            pending = self._pending_snapshot()
+            with self.pool.snapshot() as cursor:
+                df = pd.read_sql_query('''
+                    SELECT id, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, created_at
+                    FROM workouts 
+                    WHERE date = ? 
+                    ORDER BY exercise, set_number
+                ''', cursor.connection, params=(date_str,))
+                version = self.get_data_version(cursor) if pending else None
+            
+            return self._with_pending(df, pending, version, date_str) if pending else df
+        except:
+            return pd.DataFrame()
+    
+    def get_smart_suggestions(self, exercise):
+        """Get intelligent workout suggestions from the exercise's materialized last session"""
+        summary = self.get_exercise_summary(exercise)
+        if summary is None or not summary['last_session']:
+            return None
+        
+        last_session = summary['last_session']
+        last_date = summary['last_date']
+        
+        # Calculate suggestions
+        max_weight_last = max(weight for _, _, weight, _ in last_session)
+        total_volume_last = sum(reps * weight for _, reps, weight, _ in last_session)
+        rpes = [rpe for _, _, _, rpe in last_session if rpe is not None]
+        avg_rpe_last = sum(rpes) / len(rpes) if rpes else 8
+        
+        # Progressive overload suggestions
+        suggestions = {
+            'last_workout': {
+                'date': last_date[:10],
+                'max_weight': max_weight_last,
+                'total_volume': total_volume_last,
+                'avg_rpe': avg_rpe_last,
+                'sets_reps': [(reps, weight) for _, reps, weight, _ in last_session]
+            }
+        }
+        
+        # Weight progression suggestion
+        if avg_rpe_last < 8:
+            weight_increase = 2.5 if max_weight_last < 60 else 5.0
+            suggestions['weight_suggestion'] = max_weight_last + weight_increase
+            suggestions['progression_type'] = 'weight'
+            suggestions['reason'] = f"Last RPE was {avg_rpe_last:.1f} - ready for more weight!"
+        elif avg_rpe_last > 9:
+            suggestions['weight_suggestion'] = max_weight_last - 2.5
+            suggestions['progression_type'] = 'deload'
+            suggestions['reason'] = f"Last RPE was {avg_rpe_last:.1f} - consider reducing weight"
+        else:
+            # Suggest rep progression
+            avg_reps_last = sum(reps for _, reps, _, _ in last_session) / len(last_session)
+            suggestions['rep_suggestion'] = int(avg_reps_last + 1)
+            suggestions['weight_suggestion'] = max_weight_last
+            suggestions['progression_type'] = 'reps'
+            suggestions['reason'] = f"Good RPE {avg_rpe_last:.1f} - try adding a rep!"
+        
+        return suggestions
+    
+    def get_quick_stats(self):
+        """Calculate motivational quick stats from the training days, the summaries and the last 30 days of sets"""
+        empty_stats = {
+            'streak': 0,
+            'weekly_volume': 0,
+            'weekly_workouts': 0,
+            'recent_prs': [],
+            'total_workouts': 0,
+            'total_volume': 0
+        }
+        
+        try:
+            day_numbers = self.get_training_days().astype(np.int64)[::-1]
+            if not day_numbers.size:
+                return empty_stats
+            
+            now = datetime.now()
+            today = now.date()
+            
+            # Streak: newest day must be today or yesterday, then count gaps of at most 2 days (1 rest day)
+            days_since_last = np.datetime64(today, 'D').astype(np.int64) - day_numbers[0]
+            if days_since_last in (0, 1):
+                gaps = day_numbers[:-1] - day_numbers[1:]
+                breaks = np.flatnonzero(gaps > 2)
+                streak = 1 + (breaks[0] if breaks.size else gaps.size)
+            else:
+                streak = 0
+            
+            # Only this week's and the last 30 days' sets are read, four columns of them
+            week_start = today - timedelta(days=today.weekday())
+            recent_start = now - timedelta(days=30)
+            df = self.query_sets(['date', 'exercise', 'reps', 'weight'],
+                                 start_date=min(week_start, recent_start.date()).strftime('%Y-%m-%d'))
+            workout_days = df['date'].dt.normalize()
+            volume = df['reps'] * df['weight']
+            
+            # This week's stats
+            week_mask = (workout_days >= pd.Timestamp(week_start)).to_numpy()
+            weekly_volume = float(volume[week_mask].sum())
+            weekly_workouts = workout_days[week_mask].nunique()
+            
+            # Queued write-behind sets are in the training days and the recent frame but not yet in the summaries
+            summaries = self.get_exercise_summaries()
+            pending_rows = self._uncommitted_rows(self._pending_snapshot(), self.get_data_version())
+            all_time = summaries[['total_sets', 'max_weight']]
+            if pending_rows:
+                pending = pd.DataFrame([(row[1], row[4]) for row in pending_rows], columns=['exercise', 'weight'])
+                pending = pending.groupby('exercise')['weight'].agg(total_sets='size', max_weight='max')
+                all_time = pd.concat([all_time, pending]).groupby(level=0).agg({'total_sets': 'sum', 'max_weight': 'max'})
+            
+            # Recent PRs (last 30 days): recent max equals the all-time max of an exercise with 2+ sets
+            recent_prs = []
+            recent_data = df[df['date'] >= recent_start]
+            if not recent_data.empty:
+                recent_max = recent_data.groupby('exercise', sort=False)['weight'].max()
+                all_time = all_time.reindex(recent_max.index)
+                pr_max = recent_max[(all_time['total_sets'] > 1) & (recent_max == all_time['max_weight'])]
+                
+                pr_rows = recent_data[recent_data['weight'] == recent_data['exercise'].map(pr_max)]
+                pr_dates = pr_rows.groupby('exercise')['date'].max()
+                
+                for exercise, weight in pr_max.items():
+                    recent_prs.append({
+                        'exercise': exercise,
+                        'weight': float(weight),
+                        'date': pr_dates[exercise].strftime('%Y-%m-%d')
+                    })
+            
+            total_volume = float(summaries['total_volume'].sum()) + sum(row[3] * row[4] for row in pending_rows)
+            
+            return {
+                'streak': int(streak),
+                'weekly_volume': weekly_volume,
+                'weekly_workouts': int(weekly_workouts),
+                'recent_prs': recent_prs[:3],  # Top 3 recent PRs
+                'total_workouts': int(day_numbers.size),
+                'total_volume': total_volume
+            }
+            
+        except Exception as e:
+            # Fallback to empty stats if anything goes wrong
+            return empty_stats
+    
+    def create_goal(self, goal_name, goal_type, target_value, target_exercise=None, target_date=None):
+        """Create a new fitness goal"""
+        with self.pool.transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO goals (goal_name, goal_type, target_value, target_exercise, target_date)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (goal_name, goal_type, target_value, target_exercise, target_date))
+            self._refresh_goal_values(cursor, goal_ids=[cursor.lastrowid])
+        
+        return f"✅ Goal '{goal_name}' created successfully!"
+    
+    def get_goals(self):
+        """Get all goals with progress (kept current on every write)"""
+        return self._goals_to_list(self._load_goals())
+    
+    def evaluate_goals(self, refresh=False):
+        """Mark goals whose stored progress reached the target as completed - returns the newly completed goals
+        
+        refresh=True recomputes every stored value from the raw sets first (repair command). Goals that the
+        write-behind writer already completed since the last call are included.
+        """
+        completed, self._completed_goals = self._completed_goals, []
+        return completed + self._evaluate_goals(refresh)
+    
+    def _evaluate_goals(self, refresh=False):
+        """Promote goals that reached their target in one transaction"""
+        with self.pool.transaction() as cursor:
+            if refresh:
+                self._refresh_goal_values(cursor)
+            completed = self._load_goals('WHERE is_completed = 0 AND current_value >= target_value')
+            cursor.executemany('''
+                UPDATE goals SET is_completed = 1, completed_at = CURRENT_TIMESTAMP WHERE id = ?
+            ''', [(int(goal_id),) for goal_id in completed['id']])
+        
+        return self._goals_to_list(completed.assign(is_completed=1))
+    
+    def update_goal_progress(self, goal_id):
+        """Update goal progress and check completion"""
+        return any(goal['id'] == goal_id for goal in self.evaluate_goals())
+    
+    def _load_goals(self, where=''):
+        """Read the goals table, newest first"""
+        return pd.read_sql_query(f'SELECT * FROM goals {where} ORDER BY created_at DESC', self.pool.connection())
+    
+    def _refresh_goal_values(self, cursor, exercises=None, dates=None, goal_ids=None):
+        """Recompute stored goal progress inside the caller's transaction
+        
+        Only goals targeting one of the exercises, or whose window covers one of the dates, are touched;
+        with no filter at all every goal is refreshed. An exercise goal whose exercise has no sets left drops to 0.
+        """
+        refresh_all = exercises is None and dates is None and goal_ids is None
+        id_filter = ''
+        id_params = []
+        if goal_ids is not None:
+            id_filter = f"OR id IN ({', '.join('?' for _ in goal_ids)})"
+            id_params = list(goal_ids)
+        
+        # Exercise goals copy the materialized summary - no summary row means no sets
+        exercise_filter = '1' if refresh_all else f"target_exercise IN ({', '.join('?' for _ in exercises or ())})"
+        cursor.execute(f'''
+            UPDATE goals SET current_value = COALESCE((
+                SELECT CASE goals.goal_type WHEN 'max_weight' THEN s.max_weight ELSE s.total_volume END
+                FROM exercise_summary s WHERE s.exercise = goals.target_exercise
+            ), 0)
+            WHERE goal_type IN ('max_weight', 'total_volume') AND target_exercise IS NOT NULL
+              AND ({exercise_filter} {id_filter})
+        ''', list(exercises or ()) + id_params)
+        
+        # Frequency goals count distinct workout days between creation and target date
+        date_filter = '1'
+        date_params = []
+        if not refresh_all:
+            days = sorted(str(d)[:10] for d in dates or ())
+            date_filter = "substr(created_at, 1, 10) <= ? AND target_date >= ?" if days else '0'
+            date_params = [days[-1], days[0]] if days else []
+        cursor.execute(f'''
+            UPDATE goals SET current_value = (
+                SELECT COUNT(DISTINCT substr(w.date, 1, 10)) FROM workouts w
+                WHERE w.date >= substr(goals.created_at, 1, 10) AND w.date < date(goals.target_date, '+1 day')
+            )
+            WHERE goal_type = 'workout_frequency' AND target_date IS NOT NULL
+              AND (({date_filter}) {id_filter})
+        ''', date_params + id_params)
+    
+    def _goals_to_list(self, goals):
+        """Convert a goals frame to the dictionaries the pages use - NULL columns become None, not NaN"""
+        def value(v):
+            return None if pd.isna(v) else v
+        
+        return [
+            {
+                'id': int(goal.id),
+                'name': goal.goal_name,
+                'type': goal.goal_type,
+                'target_value': value(goal.target_value),
+                'target_exercise': value(goal.target_exercise),
+                'target_date': value(goal.target_date),
+                'current_value': value(goal.current_value),
+                'is_completed': bool(goal.is_completed),
+                'created_at': value(goal.created_at),
+                'completed_at': value(goal.completed_at)
+            }
+            for goal in goals.itertuples()
+        ]
+    
+    def queue_offline_workout(self, workout_data):
+        """Queue workout for offline sync - persisted in offline_queue so it survives restarts"""
+        try:
+            with self.pool.transaction() as cursor:
+                cursor.execute('INSERT INTO offline_queue (workout_data) VALUES (?)', (json.dumps(workout_data, default=str),))
+        except Exception as e:
+            return f"❌ Could not save workout offline: {str(e)}"
+        
+        return "📱 Workout saved offline - will sync when connection returns"
+    
+    def get_offline_queue_count(self):
+        """Number of queued workouts still waiting to sync"""
+        cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT COUNT(*) FROM offline_queue WHERE synced = 0 AND attempts < ?', (self.OFFLINE_MAX_ATTEMPTS,))
+        return cursor.fetchone()[0]
+    
+    def sync_offline_workouts(self):
+        """Drain every pending offline workout through one bulk insert transaction
+        
+        Every entry is read, validated and hashed on its own first, so only the valid ones go into the batch;
+        entries that cannot be used stay queued with their attempt count and error, and after
+        OFFLINE_MAX_ATTEMPTS failed syncs an entry is kept for inspection but no longer retried.
+        """
+        cursor = self.pool.connection().cursor()
+        cursor.execute('''
+            SELECT id, workout_data FROM offline_queue
+            WHERE synced = 0 AND attempts < ? ORDER BY id
+        ''', (self.OFFLINE_MAX_ATTEMPTS,))
+        pending = cursor.fetchall()
+        if not pending:
+            return "✅ No offline workouts to sync"
+        
+        rows = []
+        synced_ids = []
+        failed = []
+        for entry_id, workout_data in pending:
+            try:
+                entry_rows = [self._valid_set_row(row) for row in self._workout_rows(json.loads(workout_data))]
+                if not entry_rows:
+                    raise ValueError('no sets')
+                for row in entry_rows:
+                    self._content_hash(*row)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                failed.append((f'Invalid entry: {e}', entry_id))
+                continue
+            rows.extend(entry_rows)
+            synced_ids.append((entry_id,))
+        
+        try:
+            with self.pool.transaction() as cursor:
+                base_version = self.get_data_version(cursor)
+                last_id = None
+                if rows:
+                    last_id, _ = self._insert_sets(cursor, rows)
+                cursor.executemany('''
+                    UPDATE offline_queue SET synced = 1, synced_at = CURRENT_TIMESTAMP,
+                                             attempts = attempts + 1, last_error = NULL
+                    WHERE id = ?
+                ''', synced_ids)
+                cursor.executemany('UPDATE offline_queue SET attempts = attempts + 1, last_error = ? WHERE id = ?', failed)
+                new_rows = None
+                if last_id is not None and self._workouts_frame is not None:
+                    new_rows = self._fetch_workout_rows(cursor, last_id)
+                new_version = self.get_data_version(cursor)
+        except Exception as e:
+            # The batch rolled back as a whole - every entry keeps its place and counts one failed attempt
+            try:
+                with self.pool.transaction() as cursor:
+                    cursor.executemany('UPDATE offline_queue SET attempts = attempts + 1, last_error = ? WHERE id = ?',
+                                       [(str(e), entry_id) for entry_id, _ in pending])
+            except Exception:
+                pass
+            return f"❌ Sync failed: {str(e)}"
+        
+        self._patch_workouts_cache(base_version, new_version, added=new_rows)
+        
+        result = f"✅ Synced {len(synced_ids)} offline workouts"
+        if failed:
+            result += f" ({len(failed)} invalid and stay queued)"
+        return result
+    
+    def import_workouts(self, import_file, chunk_size=10000, progress=None):
+        """Stream sets, templates and custom exercises in from a CSV, JSON or NDJSON backup, optionally gzipped
+        
+        Records are validated and written in one transaction per chunk. The n-th identical set of the file is
+        skipped when the database already holds at least n copies of it, so importing the same file again -
+        or a backup taken after deleting a duplicate - changes nothing. progress(bytes_read, total_bytes)
+        is called after every chunk.
+        """
+        try:
+            raw = open(import_file, 'rb') if isinstance(import_file, str) else import_file
+            text = None
+            try:
+                raw.seek(0, os.SEEK_END)
+                total_bytes = raw.tell()
+                raw.seek(0)
+                
+                file_name = str(getattr(import_file, 'name', import_file)).lower().removesuffix('.gz')
+                text = self._open_backup_text(raw)
+                records = self._iter_backup_records(text, file_name.endswith('.csv'), chunk_size)
+                
+                counts = {'sets': 0, 'duplicates': 0, 'invalid': 0, 'templates': 0, 'custom_exercises': 0}
+                pending = {'workouts': [], 'templates': [], 'custom_exercises': []}
+                next_set_numbers = {}
+                # How many identical copies of each set the file has had so far
+                file_copies = {}
+                
+                for section, record in records:
+                    if section == 'workouts':
+                        row = self._backup_set_row(record, next_set_numbers)
+                        if row is not None:
+                            first = self._content_hash(*row)
+                            copy = file_copies.get(first, 0)
+                            file_copies[first] = copy + 1
+                            row = (row, first, copy)
+                    elif section == 'templates':
+                        row = self._backup_template_row(record)
+                    elif section == 'custom_exercises':
+                        row = self._backup_custom_exercise_row(record)
+                    else:
+                        row = None
+                    
+                    if row is None:
+                        counts['invalid'] += 1
+                        continue
+                    pending[section].append(row)
+                    
+                    if len(pending[section]) >= chunk_size:
+                        self._import_chunk(pending, counts)
+                        if progress:
+                            progress(min(raw.tell(), total_bytes), total_bytes)
+                
+                self._import_chunk(pending, counts)
+                if progress:
+                    progress(total_bytes, total_bytes)
+            finally:
+                # Leave a caller's file object open for them
+                if isinstance(text, io.TextIOWrapper) and text is not import_file:
+                    text.detach()
+                if raw is not import_file:
+                    raw.close()
+            
+            result = f"✅ Imported {counts['sets']} sets ({counts['duplicates']} already present"
+            if counts['invalid']:
+                result += f", {counts['invalid']} invalid rows skipped"
+            if counts['templates'] or counts['custom_exercises']:
+                result += f", {counts['templates']} templates, {counts['custom_exercises']} custom exercises"
+            return result + ")"
+        
+        except Exception as e:
+            return f"❌ Import failed: {str(e)}"
+    
+    def _open_backup_text(self, raw):
+        """Text stream over a binary or text file, transparently un-gzipping it"""
+        if isinstance(raw, io.TextIOBase):
+            return raw
+        
+        magic = raw.read(2)
+        raw.seek(0)
+        if magic == b'\x1f\x8b':
+            raw = gzip.GzipFile(fileobj=raw)
+        return io.TextIOWrapper(raw, encoding='utf-8')
+    
+    def _iter_backup_records(self, text, csv, chunk_size):
+        """Yield (section, record) pairs from a CSV, NDJSON, streamed JSON or any JSON backup document"""
+        if csv:
+            for chunk in pd.read_csv(text, chunksize=chunk_size):
+                for record in chunk.to_dict('records'):
+                    yield 'workouts', record
+            return
+        
+        first = text.readline()
+        second = text.readline() if first.strip() == '{' else ''
+        
+        if first.strip().startswith('{') and first.strip().endswith('}'):
+            # NDJSON - one tagged record per line
+            line = first
+            while line:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record.pop('section', 'workouts'), record
+                line = text.readline()
+        elif second.startswith('"'):
+            # Layout written by export_data - a section header line, then one record per line
+            section = None
+            line = second
+            while line:
+                line = line.strip().rstrip(',')
+                if line.endswith('['):
+                    section = json.loads(line[:line.index(':')])
+                elif line.startswith('{'):
+                    yield section, json.loads(line)
+                line = text.readline()
+        else:
+            # Any other JSON document (e.g. an indented backup) has to be parsed whole
+            document = json.loads(first + second + text.read())
+            if isinstance(document, list):
+                document = {'workouts': document}
+            for section in ('workouts', 'templates', 'custom_exercises'):
+                for record in document.get(section) or []:
+                    yield section, record
+    
+    @staticmethod
+    def _backup_set_row(record, next_set_numbers):
+        """Validate a backup set into an insert row - None when it is unusable"""
+        try:
+            date_str = str(record['date'])[:10]
+            date.fromisoformat(date_str)
+            exercise = record['exercise']
+            reps = int(record['reps'])
+            weight = float(record['weight'])
+            rpe = record.get('rpe')
+            rpe = None if rpe is None or pd.isna(rpe) else float(rpe)
+            set_number = record.get('set_number')
+            if set_number is not None and not pd.isna(set_number):
+                # CSV columns with a gap or a stray value hold 2.0 or '2' rather than 2
+                set_number = float(set_number)
+                if not set_number.is_integer():
+                    return None
+                set_number = int(set_number)
+            else:
+                set_number = None
+        except (KeyError, TypeError, ValueError):
+            return None
+        
+        if len(date_str) != 10 or not isinstance(exercise, str) or not exercise.strip():
+            return None
+        if reps < 0 or not math.isfinite(weight) or weight < 0:
+            return None
+        if rpe is not None and not (0 <= rpe <= 10 and (rpe * 2).is_integer()):
+            return None
+        
+        set_notes = record.get('set_notes')
+        workout_notes = record.get('workout_notes')
+        set_notes = '' if set_notes is None or pd.isna(set_notes) else str(set_notes)
+        workout_notes = '' if workout_notes is None or pd.isna(workout_notes) else str(workout_notes)
+        
+        # Sets without a number are numbered in file order within their workout
+        key = (date_str, exercise, workout_notes)
+        if set_number is None:
+            set_number = next_set_numbers.get(key, 1)
+        next_set_numbers[key] = set_number + 1
+        
+        return (date_str, exercise, set_number, reps, weight, rpe, set_notes, workout_notes)
+    
+    @staticmethod
+    def _backup_template_row(record):
+        """Validate a backup template into an insert row - None when it is unusable"""
+        name = record.get('name', record.get('template_name'))
+        exercises = record.get('exercises')
+        if isinstance(exercises, str):
+            try:
+                exercises = json.loads(exercises)
+            except ValueError:
+                return None
+        if not isinstance(name, str) or not name.strip() or not isinstance(exercises, list):
+            return None
+        
+        return (name, record.get('category'), record.get('description'), record.get('created_by'),
+                json.dumps(exercises), int(bool(record.get('is_public'))))
+    
+    @staticmethod
+    def _backup_custom_exercise_row(record):
+        """Validate a backup custom exercise into an insert row - None when it is unusable"""
+        name = record.get('exercise_name')
+        if not isinstance(name, str) or not name.strip():
+            return None
+        return (name, record.get('category'), record.get('description'))
+    
+    def _import_chunk(self, pending, counts):
+        """Write one chunk of validated rows in a single transaction, skipping sets that are already stored
+        
+        A set that is the file's n-th copy of its content is already stored when the database holds n or more
+        copies. New copies take the lowest occurrence hashes still free, like sets logged in the app.
+        """
+        new_rows, new_hashes = [], []
+        with self.pool.transaction() as cursor:
+            taken = self._stored_content_hashes(cursor, [row for row, _, _ in pending['workouts']])
+            stored_copies = {first: len(hashes) for first, hashes in taken.items()}
+            
+            for row, first, copy in pending['workouts']:
+                if copy < stored_copies.get(first, 0):
+                    continue
+                occupied = taken.setdefault(first, set())
+                occurrence, content_hash = 0, first
+                while content_hash in occupied:
+                    occurrence += 1
+                    content_hash = self._content_hash(*row, occurrence=occurrence)
+                occupied.add(content_hash)
+                new_rows.append(row)
+                new_hashes.append(content_hash)
+            
+            if new_rows:
+                self._insert_sets(cursor, new_rows, new_hashes, rebuild_summary=True)
+            
+            cursor.executemany('''
+                INSERT OR IGNORE INTO workout_templates (template_name, category, description, created_by, exercises, is_public)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', pending['templates'])
+            counts['templates'] += max(cursor.rowcount, 0)
+            
+            cursor.executemany('''
+                INSERT OR IGNORE INTO custom_exercises (exercise_name, category, description)
+                VALUES (?, ?, ?)
+            ''', pending['custom_exercises'])
+            counts['custom_exercises'] += max(cursor.rowcount, 0)
+        
+        counts['sets'] += len(new_rows)
+        counts['duplicates'] += len(pending['workouts']) - len(new_rows)
+        for rows in pending.values():
+            rows.clear()
+    
+    def _stored_content_hashes(self, cursor, rows):
+        """Content hashes stored for the sessions of the given insert rows, grouped by occurrence-free hash
+        
+        One range query over the (exercise, date) index covers the whole chunk; stored sets outside the
+        chunk's sessions are ignored.
+        """
+        sessions = {(str(row[0])[:10], row[1]) for row in rows}
+        if not sessions:
+            return {}
+        
+        days = sorted(day for day, _ in sessions)
+        where, params = self._set_filters(sorted({exercise for _, exercise in sessions}), days[0], days[-1])
+        cursor.execute(f'''
+            SELECT date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, content_hash
+            FROM workouts{where}
+        ''', params)
+        
+        taken = {}
+        for *row, content_hash in cursor.fetchall():
+            if (str(row[0])[:10], row[1]) in sessions:
+                taken.setdefault(self._content_hash(*row), set()).add(content_hash)
+        return taken
+    
+    def add_custom_exercise(self, exercise_name, category="Custom", description=""):
+        """Add a new custom exercise"""
+        try:
+            with self.pool.transaction() as cursor:
+                base_version = self.get_data_version(cursor, 'custom_exercises')
+                cursor.execute('''
+                    INSERT INTO custom_exercises (exercise_name, category, description)
+                    VALUES (?, ?, ?)
+                ''', (exercise_name, category, description))
+                new_version = self.get_data_version(cursor, 'custom_exercises')
+            
+            # Merge our own addition into the cached catalog and index instead of rebuilding them
+            if self._all_exercises is not None and self._catalog_version == base_version:
+                if exercise_name not in self._exercise_categories:
+                    bisect.insort(self._all_exercises, exercise_name)
+                    self._exercise_categories[exercise_name] = category
+                    if self._search_index is not None:
+                        self._search_index.add(exercise_name)
+                self._catalog_version = new_version
+            return f"✅ Successfully added: {exercise_name}"
+        except sqlite3.IntegrityError:
+            return f"❌ Exercise '{exercise_name}' already exists!"
+    
+    def create_daily_program(self, date_str, program_name, created_by, program_notes, exercises_list):
+        """Create a daily workout program"""
+        exercises_json = json.dumps(exercises_list)
+        
+        with self.pool.transaction() as cursor:
+            cursor.execute('DELETE FROM daily_programs WHERE date = ?', (date_str,))
+            
+            cursor.execute('''
+                INSERT INTO daily_programs (date, program_name, created_by, program_notes, exercises)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (date_str, program_name, created_by, program_notes, exercises_json))
+        
+        return f"✅ Created program '{program_name}' for {date_str}"
+    
+    def get_daily_program(self, date_str):
+        """Get the daily program for a specific date"""
+        cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT * FROM daily_programs WHERE date = ?', (date_str,))
+        result = cursor.fetchone()
+        
+        if result:
+            return {
+                'id': result[0],
+                'date': result[1],
+                'program_name': result[2],
+                'created_by': result[3],
+                'program_notes': result[4],
+                'exercises': json.loads(result[5]),
+                'created_at': result[6]
+            }
+        return None
+    
+    def save_template(self, template_name, category, description, created_by, exercises_list, is_public=False):
+        """Save a workout template"""
+        exercises_json = json.dumps(exercises_list)
+        
+        try:
+            with self.pool.transaction() as cursor:
+                cursor.execute('''
+                    INSERT INTO workout_templates (template_name, category, description, created_by, exercises, is_public)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (template_name, category, description, created_by, exercises_json, int(is_public)))
+            
+            return f"✅ Template '{template_name}' saved successfully!"
+        except sqlite3.IntegrityError:
+            return f"❌ Template '{template_name}' already exists!"
+
+    def get_templates(self, category=None, created_by=None):
+        """Get workout templates with optional filtering"""
+        cursor = self.pool.connection().cursor()
+        
+        query = 'SELECT * FROM workout_templates WHERE 1=1'
+        params = []
+        
+        if category:
+            query += ' AND category = ?'
+            params.append(category)
+        
+        if created_by:
+            query += ' AND created_by = ?'
+            params.append(created_by)
+        
+        query += ' ORDER BY last_used DESC, created_at DESC'
+        
+        cursor.execute(query, params)
+        templates = cursor.fetchall()
+        
+        template_list = []
+        for template in templates:
+            template_list.append({
+                'id': template[0],
+                'name': template[1],
+                'category': template[2],
+                'description': template[3],
+                'created_by': template[4],
+                'exercises': json.loads(template[5]),
+                'is_public': bool(template[6]),
+                'created_at': template[7],
+                'last_used': template[8]
+            })
+        
+        return template_list
+
+    def delete_template(self, template_id):
+        """Delete a workout template"""
+        with self.pool.transaction() as cursor:
+            cursor.execute('DELETE FROM workout_templates WHERE id = ?', (template_id,))
+            rows_affected = cursor.rowcount
+        
+        return "✅ Template deleted successfully!" if rows_affected > 0 else "❌ Template not found!"
+    
+    def get_all_exercises(self):
+        """Get the built-in catalog merged with custom exercises, cached until custom_exercises changes"""
+        self._refresh_exercise_catalog()
+        return list(self._all_exercises)
+    
+    def get_exercise_category(self, exercise):
+        """Get the category of a built-in or custom exercise"""
+        self._refresh_exercise_catalog()
+        return self._exercise_categories.get(exercise)
+    
+    def _refresh_exercise_catalog(self):
+        """Rebuild the merged catalog only when the custom_exercises version moved"""
+        version = self.get_data_version(table='custom_exercises')
+        if self._all_exercises is not None and version == self._catalog_version:
+            return
+        
+        cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT exercise_name, category FROM custom_exercises ORDER BY exercise_name')
+        custom_exercises = cursor.fetchall()
+        
+        categories = {name: category or 'Custom' for name, category in custom_exercises}
+        categories.update(BUILT_IN_CATEGORIES)
+        
+        self._all_exercises = sorted(categories)
+        self._exercise_categories = categories
+        self._catalog_version = version
+        self._search_index = None
+    
+    def search_exercises(self, search_term, max_results=10):
+        """Ranked exercise search over the prebuilt index"""
+        self._refresh_exercise_catalog()
+        if self._search_index is None:
+            self._search_index = ExerciseSearchIndex(self._all_exercises)
+        return self._search_index.search(search_term, max_results)
+    
+    def get_custom_exercises(self):
+        """Get all custom exercises with details"""
+        try:
+            return pd.read_sql_query('''
+                SELECT exercise_name, category, description, created_at 
+                FROM custom_exercises 
+                ORDER BY created_at DESC
+            ''', self.pool.connection())
+        except:
+            return pd.DataFrame()
+    
+    def get_data(self):
+        """Get every set as a compact frame - served from memory while the data version is unchanged
+        
+        Columns are id (int64), date (int32 days since 1970-01-01), exercise (categorical over the exercise
+        catalog), set_number and reps (int16 unless a value needs more), weight (float32), rpe_x2 (RPE in half points as nullable Int8,
+        so 17 is RPE 8.5) and created_at (datetime64[s]) - 32 bytes a set. Notes stay in SQLite, see
+        get_set_notes(). Rows are newest first, then by exercise and set number; pd.to_datetime(df['date'],
+        unit='D') gives the calendar dates and df['rpe_x2'] / 2 the RPEs.
+        """
+        try:
+            pending = self._pending_snapshot()
+            with self._data_lock:
+                with self.pool.snapshot() as cursor:
+                    version = self.get_data_version(cursor)
+                    if self._workouts_frame is None or version != self._workouts_version:
+                        self._workouts_frame = self._load_compact_sets(cursor)
+                        self._workouts_version = version
+                
+                # Callers are free to modify what they get back
+                frame = self._workouts_frame.copy()
+                version = self._workouts_version
+            
+            rows = self._uncommitted_rows(pending, version)
+            return self._merge_sets(frame, self._compact_pending(rows)) if rows else frame
+        except:
+            return pd.DataFrame()
+    
+    def get_set_notes(self, set_ids):
+        """Fetch the set and workout notes get_data() leaves out, as a frame indexed by set id
+        
+        Only committed sets have notes to fetch - queued write-behind sets (negative ids) are skipped.
+        """
+        ids = [int(set_id) for set_id in set_ids if set_id > 0]
+        notes = []
+        with self.pool.snapshot() as cursor:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                cursor.execute(f"SELECT id, set_notes, workout_notes FROM workouts WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+                notes.extend(cursor.fetchall())
+        return pd.DataFrame(notes, columns=['id', 'set_notes', 'workout_notes']).set_index('id')
+    
+    def _load_compact_sets(self, cursor, chunk_size=50000):
+        """Read every set into the compact get_data() frame a chunk at a time, so no wide copy ever exists"""
+        cursor.execute('SELECT DISTINCT exercise FROM workouts')
+        exercise_dtype = self._exercise_dtype(row[0] for row in cursor.fetchall())
+        
+        cursor.execute(f'SELECT {self.COMPACT_COLUMNS} FROM workouts ORDER BY date DESC, exercise, set_number')
+        columns = [column[0] for column in cursor.description]
+        chunks = [self._compact_sets(pd.DataFrame.from_records(rows, columns=columns), exercise_dtype)
+                  for rows in self._iter_rows(cursor, chunk_size)]
+        if not chunks:
+            return self._compact_sets(pd.DataFrame(columns=columns), exercise_dtype)
+        return pd.concat(chunks, ignore_index=True)
+    
+    def _exercise_dtype(self, exercises=()):
+        """Categorical dtype over the exercise catalog plus the given names, sorted the way SQLite sorts them"""
+        return pd.CategoricalDtype(sorted(set(self.get_all_exercises()).union(exercises)))
+    
+    @staticmethod
+    def _compact_sets(df, exercise_dtype):
+        """Convert raw id, date, exercise, set_number, reps, weight, rpe, created_at rows to the compact dtypes"""
+        dates = pd.Series(df['date'], dtype=object).astype(str).str[:10].to_numpy(dtype=object)
+        return pd.DataFrame({
+            'id': df['id'].astype(np.int64),
+            'date': dates.astype('datetime64[D]').astype(np.int32),
+            'exercise': pd.Categorical(df['exercise'], dtype=exercise_dtype),
+            'set_number': GymTracker._narrow_ints(df['set_number']),
+            'reps': GymTracker._narrow_ints(df['reps']),
+            'weight': df['weight'].astype(np.float32),
+            # log_workouts, imports and offline sync only store half-point RPEs, so doubling them is exact
+            'rpe_x2': (pd.to_numeric(df['rpe']) * 2).round().astype('Int8'),
+            'created_at': pd.to_datetime(df['created_at'], errors='coerce').astype('datetime64[s]')
+        }).reset_index(drop=True)
+    
+    @staticmethod
+    def _narrow_ints(values):
+        """Integer column as int16, or the next width that holds every value - astype alone would wrap"""
+        values = values.astype(np.int64)
+        for dtype in (np.int16, np.int32):
+            limits = np.iinfo(dtype)
+            if values.empty or (values.min() >= limits.min and values.max() <= limits.max):
+                return values.astype(dtype)
+        return values
+    
+    def _compact_pending(self, rows):
+        """Compact frame of queued (date, exercise, set_number, reps, weight, rpe, ...) insert rows"""
+        df = pd.DataFrame([row[:6] for row in rows], columns=['date', 'exercise', 'set_number', 'reps', 'weight', 'rpe'])
+        # Pending sets have no row id yet
+        df.insert(0, 'id', -np.arange(1, len(df) + 1))
+        df['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._compact_sets(df, self._exercise_dtype(df['exercise']))
+    
+    @staticmethod
+    def _merge_sets(frame, added):
+        """Merge compact sets into a compact newest-first frame, re-sorting only the rows they land among"""
+        if frame.empty:
+            return added.sort_values(['date', 'exercise', 'set_number'], ascending=[False, True, True],
+                                     kind='stable', ignore_index=True)
+        
+        # Both sides need the same categories to stay categorical - sorted, so codes still order like names
+        if frame['exercise'].dtype != added['exercise'].dtype:
+            categories = sorted(set(frame['exercise'].cat.categories).union(added['exercise'].cat.categories))
+            frame = frame.assign(exercise=frame['exercise'].cat.set_categories(categories))
+            added = added.assign(exercise=added['exercise'].cat.set_categories(categories))
+        
+        cut = int((frame['date'].to_numpy() >= added['date'].min()).sum())
+        head = pd.concat([frame.iloc[:cut], added], ignore_index=True)
+        head = head.sort_values(['date', 'exercise', 'set_number'], ascending=[False, True, True], kind='stable')
+        return pd.concat([head, frame.iloc[cut:]], ignore_index=True)
+    
+    def query_sets(self, columns=None, exercises=None, start_date=None, end_date=None, limit=None):
+        """Read only the wanted columns of the sets matching the filters, newest first, as a typed frame
+        
+        Exercise and date filters run in SQL on the (exercise, date) and date indexes; start_date and end_date
+        are inclusive 'YYYY-MM-DD' days. Sets still queued for write-behind are included.
+        """
+        columns = self._set_columns(columns)
+        if exercises is not None:
+            exercises = list(exercises)
+            if not exercises:
+                return self._typed_sets(pd.DataFrame(columns=columns))
+        
+        where, params = self._set_filters(exercises, start_date, end_date)
+        pending = self._pending_snapshot()
+        # Queued sets are merged in by the sort keys, so those are read too when there are any
+        selected = columns + [column for column in self.SET_ORDER if column not in columns] if pending else columns
+        sql = f"SELECT {', '.join(selected)} FROM workouts{where} ORDER BY date DESC, exercise, set_number"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+        
+        with self.pool.snapshot() as cursor:
+            df = self._typed_sets(pd.read_sql_query(sql, cursor.connection, params=params))
+            version = self.get_data_version(cursor) if pending else None
+        
+        if pending:
+            rows = self._filter_rows(self._uncommitted_rows(pending, version), exercises, start_date, end_date)
+            if rows:
+                df = self._typed_sets(self._with_pending(df, [{'version': None, 'rows': rows}], version))
+                if limit is not None:
+                    df = df.head(int(limit))
+            df = df[columns]
+        return df
+    
+    def iter_sets(self, columns=None, exercises=None, start_date=None, end_date=None, chunk_size=10000, raw=False):
+        """Stream the matching sets in (exercise, date, set_number) order as chunks of at most chunk_size rows
+        
+        Chunks are typed frames like query_sets() returns, or lists of row tuples with raw=True. One cursor walks
+        the (exercise, date) index inside a read snapshot, so memory stays bounded by chunk_size for any history
+        size. Sets queued for write-behind are not included - flush() first. The snapshot stays open until the
+        generator is exhausted or closed, so finish with it before writing from the same thread.
+        """
+        columns = self._set_columns(columns)
+        if exercises is not None:
+            exercises = list(exercises)
+            if not exercises:
+                return
+        
+        where, params = self._set_filters(exercises, start_date, end_date)
+        with self.pool.snapshot() as cursor:
+            cursor.execute(f"SELECT {', '.join(columns)} FROM workouts{where} ORDER BY exercise, date, set_number, id", params)
+            for rows in self._iter_rows(cursor, chunk_size):
+                yield rows if raw else self._typed_sets(pd.DataFrame.from_records(rows, columns=columns))
+    
+    def iter_sessions(self, columns=None, exercises=None, start_date=None, end_date=None, chunk_size=10000, raw=False):
+        """Stream (exercise, 'YYYY-MM-DD', sets) per exercise and training day, in (exercise, date) order
+        
+        sets holds that session's rows of the wanted columns, as a typed frame or a list of tuples with raw=True.
+        Built on iter_sets(), so memory is bounded by chunk_size plus one session.
+        """
+        columns = self._set_columns(columns)
+        key = None
+        session = []
+        for rows in self.iter_sets(['exercise', 'date'] + columns, exercises, start_date, end_date, chunk_size, raw=True):
+            for row in rows:
+                row_key = (row[0], row[1][:10])
+                if row_key != key:
+                    if session:
+                        yield key + (session if raw else self._typed_sets(pd.DataFrame.from_records(session, columns=columns)),)
+                    key = row_key
+                    session = []
+                session.append(row[2:])
+        
+        if session:
+            yield key + (session if raw else self._typed_sets(pd.DataFrame.from_records(session, columns=columns)),)
+    
+    @staticmethod
+    def _iter_rows(cursor, chunk_size):
+        """Yield the rows of the cursor's current query as lists of at most chunk_size tuples"""
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    
+    def get_training_days(self):
+        """Distinct training days oldest first as datetime64[D], read from the date index"""
+        pending = self._pending_snapshot()
+        with self.pool.snapshot() as cursor:
+            cursor.execute('SELECT DISTINCT date FROM workouts')
+            dates = [row[0][:10] for row in cursor.fetchall()]
+            version = self.get_data_version(cursor) if pending else None
+        
+        dates += [str(row[0])[:10] for row in self._uncommitted_rows(pending, version)]
+        return np.unique(np.array(dates, dtype='datetime64[D]'))
+    
+    def _set_columns(self, columns):
+        """Validate a projection against SET_COLUMNS - None means every column"""
+        columns = list(self.SET_COLUMNS) if columns is None else list(columns)
+        unknown = [column for column in columns if column not in self.SET_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown workout columns: {', '.join(unknown)}")
+        return columns
+    
+    @staticmethod
+    def _set_filters(exercises=None, start_date=None, end_date=None):
+        """WHERE clause and parameters for the exercise and inclusive date range filters"""
+        clauses, params = [], []
+        if exercises is not None:
+            clauses.append(f"exercise IN ({', '.join('?' * len(exercises))})")
+            params.extend(exercises)
+        if start_date is not None:
+            clauses.append('date >= ?')
+            params.append(str(start_date)[:10])
+        if end_date is not None:
+            # Dates may carry a time part - everything before the next day belongs to end_date
+            clauses.append('date < ?')
+            params.append((pd.Timestamp(str(end_date)[:10]) + timedelta(days=1)).strftime('%Y-%m-%d'))
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+    
+    @staticmethod
+    def _filter_rows(rows, exercises=None, start_date=None, end_date=None):
+        """Apply the _set_filters() filters to queued (date, exercise, ...) insert rows"""
+        if exercises is not None:
+            wanted = set(exercises)
+            rows = [row for row in rows if row[1] in wanted]
+        if start_date is not None:
+            rows = [row for row in rows if str(row[0])[:10] >= str(start_date)[:10]]
+        if end_date is not None:
+            rows = [row for row in rows if str(row[0])[:10] <= str(end_date)[:10]]
+        return rows
+    
+    def _typed_sets(self, df):
+        """Give a projected workouts frame the dtypes listed in SET_COLUMNS"""
+        for column in df.columns:
+            dtype = self.SET_COLUMNS[column]
+            if column == 'date':
+                df[column] = pd.to_datetime(df[column])
+            elif dtype is not None:
+                df[column] = df[column].astype(dtype)
+        return df
+    
+    def get_data_version(self, cursor=None, table='workouts'):
+        """Get a table's change counter maintained by the data_versions triggers"""
+        if cursor is None:
+            cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT version FROM data_versions WHERE name = ?', (table,))
+        return cursor.fetchone()[0]
+    
+    def get_exercise_version(self, exercise, cursor=None):
+        """Get one exercise's change counter maintained by the exercise_versions triggers"""
+        if cursor is None:
+            cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT version FROM exercise_versions WHERE exercise = ?', (exercise,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+    
+    def _fetch_workout_rows(self, cursor, after_id):
+        """Read workout rows written after the given id in the compact get_data() format"""
+        rows = pd.read_sql_query(f'SELECT {self.COMPACT_COLUMNS} FROM workouts WHERE id > ?', cursor.connection, params=(after_id,))
+        return self._compact_sets(rows, self._exercise_dtype(rows['exercise']))
+    
+    def _patch_workouts_cache(self, base_version, new_version, added=None, deleted_ids=None):
+        """Apply our own committed write to the cached frame instead of reloading it"""
+        with self._data_lock:
+            # Someone else wrote in between - leave the stale frame for get_data() to reload
+            if self._workouts_frame is None or self._workouts_version != base_version:
+                return
+            
+            df = self._workouts_frame
+            if deleted_ids:
+                df = df[~df['id'].isin(deleted_ids)]
+            if added is not None and not added.empty:
+                df = self._merge_sets(df, added)
+            
+            self._workouts_frame = df.reset_index(drop=True)
+            self._workouts_version = new_version
+    
+    def get_exercise_summary(self, exercise):
+        """Get the materialized summary of one exercise - a single primary key lookup"""
+        cursor = self.pool.connection().cursor()
+        cursor.execute('''
+            SELECT max_weight, last_date, last_session, total_volume, total_sets, workout_count, rpe_sum, rpe_count
+            FROM exercise_summary WHERE exercise = ?
+        ''', (exercise,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        
+        return {
+            'exercise': exercise,
+            'max_weight': row[0],
+            'last_date': row[1],
+            'last_session': [tuple(s) for s in json.loads(row[2])],
+            'total_volume': row[3],
+            'total_sets': row[4],
+            'workout_count': row[5],
+            'avg_rpe': row[6] / row[7] if row[7] else 0
+        }
+    
+    def get_exercise_summaries(self):
+        """Get the summary of every exercise as a frame indexed by exercise"""
+        return pd.read_sql_query('''
+            SELECT exercise, max_weight, last_date, total_volume, total_sets, workout_count, rpe_sum, rpe_count
+            FROM exercise_summary
+        ''', self.pool.connection(), index_col='exercise')
+    
+    def get_last_session(self, exercise):
+        """Get every set of the exercise's most recent session via the summary and the (exercise, date) index"""
+        df = pd.read_sql_query('''
+            SELECT w.id, w.date, w.exercise, w.set_number, w.reps, w.weight, w.rpe, w.set_notes, w.workout_notes, w.created_at
+            FROM workouts w
+            JOIN exercise_summary s ON s.exercise = w.exercise AND s.last_date = w.date
+            WHERE w.exercise = ?
+            ORDER BY w.set_number, w.id
+        ''', self.pool.connection(), params=(exercise,))
+        df['date'] = pd.to_datetime(df['date'])
+        return df
+    
+    def rebuild_exercise_summary(self):
+        """Recompute the exercise summary table and stored goal progress from the raw sets (repair command)"""
+        with self.pool.transaction() as cursor:
+            count = self._rebuild_exercise_summary(cursor)
+            self._refresh_goal_values(cursor)
+        return f"✅ Rebuilt summary for {count} exercises"
+    
+    def _rebuild_exercise_summary(self, cursor, exercises=None):
+        """Recompute summary rows for the given exercises, or all of them, inside the caller's transaction"""
+        where = ''
+        params = []
+        if exercises is not None:
+            where = f"WHERE exercise IN ({', '.join('?' for _ in exercises)})"
+            params = list(exercises)
+        
+        cursor.execute(f'DELETE FROM exercise_summary {where}', params)
+        cursor.execute(f'''
+            INSERT INTO exercise_summary
+                (exercise, max_weight, last_date, last_session, total_volume, total_sets, workout_count, rpe_sum, rpe_count)
+            SELECT exercise, MAX(weight), MAX(date), '[]', SUM(reps * weight), COUNT(*),
+                   COUNT(DISTINCT date), COALESCE(SUM(rpe), 0), COUNT(rpe)
+            FROM workouts {where}
+            GROUP BY exercise
+        ''', params)
+        
+        cursor.execute(f'''
+            SELECT w.exercise, w.set_number, w.reps, w.weight, w.rpe
+            FROM workouts w
+            JOIN exercise_summary s ON s.exercise = w.exercise AND s.last_date = w.date
+            {where.replace('exercise', 'w.exercise')}
+            ORDER BY w.exercise, w.set_number, w.id
+        ''', params)
+        
+        last_sessions = {}
+        for exercise, set_number, reps, weight, rpe in cursor.fetchall():
+            last_sessions.setdefault(exercise, []).append([set_number, reps, weight, rpe])
+        
+        cursor.executemany('UPDATE exercise_summary SET last_session = ? WHERE exercise = ?',
+                           [(json.dumps(sets), exercise) for exercise, sets in last_sessions.items()])
+        return len(last_sessions)
+    
+    def _summary_add_sets(self, cursor, date_str, exercise, new_sets):
+        """Fold freshly inserted (set_number, reps, weight, rpe) sets into the exercise summary"""
+        cursor.execute('''
+            SELECT max_weight, last_date, last_session, total_volume, total_sets, workout_count, rpe_sum, rpe_count
+            FROM exercise_summary WHERE exercise = ?
+        ''', (exercise,))
+        row = cursor.fetchone()
+        
+        new_sets = [[int(set_number), int(reps), float(weight), None if rpe is None else float(rpe)]
+                    for set_number, reps, weight, rpe in new_sets]
+        volume = sum(reps * weight for _, reps, weight, _ in new_sets)
+        max_weight = max(weight for _, _, weight, _ in new_sets)
+        rpes = [rpe for _, _, _, rpe in new_sets if rpe is not None]
+        
+        if row is None:
+            cursor.execute('''
+                INSERT INTO exercise_summary
+                    (exercise, max_weight, last_date, last_session, total_volume, total_sets, workout_count, rpe_sum, rpe_count)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ''', (exercise, max_weight, date_str, json.dumps(sorted(new_sets, key=lambda s: s[0])),
+                  volume, len(new_sets), sum(rpes), len(rpes)))
+            return
+        
+        last_date = row[1]
+        last_session = json.loads(row[2])
+        workout_count = row[5]
+        
+        if date_str > last_date:
+            last_date, last_session = date_str, new_sets
+            workout_count += 1
+        elif date_str == last_date:
+            last_session = last_session + new_sets
+        else:
+            # Backfilled session - it only adds a workout day if that day had no sets before
+            cursor.execute('SELECT COUNT(*) FROM workouts WHERE exercise = ? AND date = ?', (exercise, date_str))
+            if cursor.fetchone()[0] == len(new_sets):
+                workout_count += 1
+        
+        cursor.execute('''
+            UPDATE exercise_summary
+            SET max_weight = ?, last_date = ?, last_session = ?, total_volume = ?,
+                total_sets = ?, workout_count = ?, rpe_sum = ?, rpe_count = ?
+            WHERE exercise = ?
+        ''', (max(row[0], max_weight), last_date, json.dumps(sorted(last_session, key=lambda s: s[0])),
+              row[3] + volume, row[4] + len(new_sets), workout_count, row[6] + sum(rpes), row[7] + len(rpes),
+              exercise))
+    
+    def get_exercise_rollups(self, exercise, period='weekly', start_date=None, end_date=None):
+        """Per-bucket totals of one exercise from the rollup table - one row per day, ISO week or month"""
+        if period not in self.ROLLUP_BUCKETS:
+            raise ValueError(f"Unknown rollup period: {period}")
+        
+        df = pd.read_sql_query(f'''
+            SELECT bucket, tonnage, set_count, rep_count, max_weight,
+                   CASE WHEN rpe_count > 0 THEN rpe_sum / rpe_count END AS avg_rpe
+            FROM exercise_rollup_{period}
+            WHERE exercise = ? AND bucket >= ? AND bucket <= ?
+            ORDER BY bucket
+        ''', self.pool.connection(), params=(exercise, str(start_date or '0000-00-00'), str(end_date or '9999-12-31')))
+        df['bucket'] = pd.to_datetime(df['bucket'])
+        return df
+    
+    def rebuild_rollups(self):
+        """Recompute every rollup table from the raw sets (repair command)"""
+        with self.pool.transaction() as cursor:
+            count = self._rebuild_rollups(cursor)
+        return f"✅ Rebuilt {count} rollup buckets"
+    
+    def _rebuild_rollups(self, cursor, exercises=None):
+        """Recompute rollup rows for the given exercises, or all of them, inside the caller's transaction
+        
+        One streaming pass of iter_sessions() in (exercise, date) order: each session is a daily bucket and is
+        folded into its week and month, and an exercise's buckets are written as soon as the next one starts.
+        """
+        where, params = self._set_filters(exercises)
+        for period in self.ROLLUP_BUCKETS:
+            cursor.execute(f'DELETE FROM exercise_rollup_{period}{where}', params)
+        
+        count = 0
+        current = None
+        buckets = {period: {} for period in self.ROLLUP_BUCKETS}
+        for exercise, day, sets in self.iter_sessions(['reps', 'weight', 'rpe'], exercises, raw=True):
+            if exercise != current:
+                count += self._write_rollups(cursor, current, buckets)
+                current = exercise
+            
+            rpes = [rpe for _, _, rpe in sets if rpe is not None]
+            session = [sum(reps * weight for reps, weight, _ in sets), len(sets), sum(reps for reps, _, _ in sets),
+                       max(weight for _, weight, _ in sets), sum(rpes), len(rpes)]
+            for period, bucket in self._rollup_bucket_keys(day).items():
+                totals = buckets[period].get(bucket)
+                if totals is None:
+                    buckets[period][bucket] = list(session)
+                else:
+                    for i in (0, 1, 2, 4, 5):
+                        totals[i] += session[i]
+                    totals[3] = max(totals[3], session[3])
+        
+        return count + self._write_rollups(cursor, current, buckets)
+    
+    @staticmethod
+    def _rollup_bucket_keys(day):
+        """The bucket of a 'YYYY-MM-DD' day per period - the Python twin of the ROLLUP_BUCKETS SQL"""
+        day_date = date.fromisoformat(day)
+        monday = day_date - timedelta(days=day_date.weekday())
+        return {'daily': day, 'weekly': monday.strftime('%Y-%m-%d'), 'monthly': day[:7] + '-01'}
+    
+    def _write_rollups(self, cursor, exercise, buckets):
+        """Insert one exercise's accumulated rollup buckets and empty them - returns the rows written"""
+        count = 0
+        for period, totals in buckets.items():
+            cursor.executemany(f'''
+                INSERT INTO exercise_rollup_{period}
+                    (exercise, bucket, tonnage, set_count, rep_count, max_weight, rpe_sum, rpe_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(exercise, bucket, *values) for bucket, values in totals.items()])
+            count += len(totals)
+            totals.clear()
+        return count
+    
+    def _rollups_add_sets(self, cursor, after_id):
+        """Fold the sets inserted after the given id into every rollup table
+        
+        NOT INDEXED keeps the planner on the rowid range - it would otherwise scan the whole
+        (exercise, date) index to satisfy the GROUP BY.
+        """
+        for period, bucket in self.ROLLUP_BUCKETS.items():
+            cursor.execute(f'''
+                INSERT INTO exercise_rollup_{period}
+                    (exercise, bucket, tonnage, set_count, rep_count, max_weight, rpe_sum, rpe_count)
+                SELECT exercise, {bucket}, SUM(reps * weight), COUNT(*), SUM(reps), MAX(weight),
+                       COALESCE(SUM(rpe), 0), COUNT(rpe)
+                FROM workouts NOT INDEXED WHERE id > ?
+                GROUP BY exercise, {bucket}
+                ON CONFLICT (exercise, bucket) DO UPDATE SET
+                    tonnage = tonnage + excluded.tonnage,
+                    set_count = set_count + excluded.set_count,
+                    rep_count = rep_count + excluded.rep_count,
+                    max_weight = MAX(max_weight, excluded.max_weight),
+                    rpe_sum = rpe_sum + excluded.rpe_sum,
+                    rpe_count = rpe_count + excluded.rpe_count
+            ''', (after_id,))
+    
+    def get_exercise_stats(self, exercise):
+        """Get comprehensive stats for an exercise"""
+        try:
+            daily = self._exercise_daily_stats_sql(exercise)
+        except Exception:
+            daily = self._exercise_daily_stats_frame(exercise)
+        
+        if daily.empty:
+            return None
+        
+        rpe_count = daily['rpe_count'].sum()
+        
+        daily_stats = daily[['date', 'max_weight', 'avg_weight', 'total_reps', 'avg_reps', 'total_sets', 'volume']].copy()
+        rounded = ['max_weight', 'avg_weight', 'total_reps', 'avg_reps', 'total_sets']
+        daily_stats[rounded] = daily_stats[rounded].round(2)
+        
+        return {
+            'daily_stats': daily_stats,
+            'max_weight': daily['max_weight'].max(),
+            'total_volume': daily['volume'].sum(),
+            'total_sets': int(daily['total_sets'].sum()),
+            'workout_count': len(daily),
+            'avg_rpe': daily['rpe_sum'].sum() / rpe_count if rpe_count > 0 else 0
+        }
+    
+    def _exercise_daily_stats_sql(self, exercise):
+        """Per-day aggregates for one exercise, grouped in SQL on the (exercise, date) index"""
+        daily = pd.read_sql_query('''
+            SELECT date,
+                   MAX(weight) AS max_weight,
+                   AVG(weight) AS avg_weight,
+                   SUM(reps) AS total_reps,
+                   AVG(reps) AS avg_reps,
+                   COUNT(set_number) AS total_sets,
+                   SUM(reps * weight) AS volume,
+                   COALESCE(SUM(rpe), 0) AS rpe_sum,
+                   COUNT(rpe) AS rpe_count
+            FROM workouts
+            WHERE exercise = ?
+            GROUP BY date
+            ORDER BY date
+        ''', self.pool.connection(), params=(exercise,))
+        daily['date'] = pd.to_datetime(daily['date'])
+        return daily
+    
+    def _exercise_daily_stats_frame(self, exercise):
+        """Vectorized fallback computing the same per-day aggregates from the exercise's projected sets"""
+        exercise_data = self.query_sets(['date', 'set_number', 'reps', 'weight', 'rpe'], exercises=[exercise])
+        if exercise_data.empty:
+            return pd.DataFrame()
+        
+        daily = exercise_data.assign(volume=exercise_data['reps'] * exercise_data['weight']).groupby('date').agg(
+            max_weight=('weight', 'max'),
+            avg_weight=('weight', 'mean'),
+            total_reps=('reps', 'sum'),
+            avg_reps=('reps', 'mean'),
+            total_sets=('set_number', 'count'),
+            volume=('volume', 'sum'),
+            rpe_sum=('rpe', 'sum'),
+            rpe_count=('rpe', 'count')
+        )
+        return daily.reset_index()
+
+    def clean_sample_data(self):
+        """Remove obvious sample/fake data"""
+        # Target specific fake data patterns
+        fake_patterns = [
+            "Warm up set, felt good",
+            "Working weight", 
+            "Heavy set, good depth",
+            "Full range of motion",
+            "Slight fatigue",
+            "Great leg session! Gym was quiet, felt strong.",
+            "Finished with leg press, good pump"
+        ]
+        
+        self.flush()
+        deleted_count = 0
+        with self.pool.transaction() as cursor:
+            for pattern in fake_patterns:
+                cursor.execute('DELETE FROM workouts WHERE set_notes LIKE ? OR workout_notes LIKE ?', 
+                              (f'%{pattern}%', f'%{pattern}%'))
+                deleted_count += cursor.rowcount
+            
+            # Remove specific fake workout combinations
+            cursor.execute('''DELETE FROM workouts WHERE 
+                             exercise = 'Hack Squat' AND weight IN (80.0, 90.0, 100.0) AND reps IN (12, 10, 8)''')
+            deleted_count += cursor.rowcount
+            
+            cursor.execute('''DELETE FROM workouts WHERE 
+                             exercise = 'Leg Press' AND weight IN (150.0, 170.0) AND reps IN (15, 12)''')
+            deleted_count += cursor.rowcount
+            
+            if deleted_count > 0:
+                self._rebuild_exercise_summary(cursor)
+                self._rebuild_rollups(cursor)
+                self._refresh_goal_values(cursor)
+        
+        return f"✅ Removed {deleted_count} fake data entries" if deleted_count > 0 else "✅ No fake data found"
+    
+    def reset_all_data(self):
+        """Nuclear option - delete all workout data"""
+        self.flush()
+        with self.pool.transaction() as cursor:
+            cursor.execute('DELETE FROM workouts')
+            cursor.execute('DELETE FROM daily_programs')
+            cursor.execute('DELETE FROM exercise_summary')
+            for period in self.ROLLUP_BUCKETS:
+                cursor.execute(f'DELETE FROM exercise_rollup_{period}')
+            self._refresh_goal_values(cursor)
+        return "🚨 ALL WORKOUT DATA DELETED"
+
+    # Backup sections in file order, each read straight from SQLite in chunks
+    EXPORT_SECTIONS = [
+        ('workouts', '''
+            SELECT id, substr(date, 1, 10) AS date, exercise, set_number, reps, weight, rpe,
+                   set_notes, workout_notes, created_at
+            FROM workouts ORDER BY id
+        '''),
+        ('templates', '''
+            SELECT id, template_name AS name, category, description, created_by, exercises,
+                   is_public, created_at, last_used
+            FROM workout_templates ORDER BY id
+        '''),
+        ('custom_exercises', '''
+            SELECT exercise_name, category, description, created_at
+            FROM custom_exercises ORDER BY id
+        '''),
+    ]
+    
+    def export_data(self, export_file='gym_backup.json', chunk_size=5000, progress=None):
+        """Stream all data to a JSON backup - .ndjson writes one record per line, a .gz suffix compresses
+        
+        progress(rows_written, total_rows) is called after every chunk; memory stays flat for any history size.
+        """
+        self.flush()
+        try:
+            ndjson = export_file.lower().removesuffix('.gz').endswith(('.ndjson', '.jsonl'))
+            opener = gzip.open if export_file.lower().endswith('.gz') else open
+            
+            with self.pool.snapshot() as cursor, opener(export_file, 'wt', encoding='utf-8') as f:
+                total = sum(cursor.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                            for table in ('workouts', 'workout_templates', 'custom_exercises'))
+                written = 0
+                set_count = 0
+                
+                if not ndjson:
+                    f.write('{')
+                for section_index, (section, query) in enumerate(self.EXPORT_SECTIONS):
+                    if not ndjson:
+                        f.write(f'{"," if section_index else ""}\n"{section}": [')
+                    
+                    cursor.execute(query)
+                    columns = [column[0] for column in cursor.description]
+                    first = True
+                    for rows in self._iter_rows(cursor, chunk_size):
+                        lines = []
+                        for row in rows:
+                            record = dict(zip(columns, row))
+                            if section == 'templates':
+                                record['exercises'] = json.loads(record['exercises'] or '[]')
+                                record['is_public'] = bool(record['is_public'])
+                            if ndjson:
+                                record = {'section': section, **record}
+                            lines.append(json.dumps(record, default=str))
+                        
+                        if ndjson:
+                            f.write('\n'.join(lines) + '\n')
+                        else:
+                            f.write(('\n' if first else ',\n') + ',\n'.join(lines))
+                        first = False
+                        
+                        written += len(rows)
+                        if section == 'workouts':
+                            set_count += len(rows)
+                        if progress:
+                            progress(written, total)
+                    
+                    if not ndjson:
+                        f.write('\n]')
+                if not ndjson:
+                    f.write('}\n')
+            
+            return f"✅ Exported {set_count} sets to {export_file}"
+            
+        except Exception as e:
+            return f"❌ Export failed: {str(e)}"
+
+    def get_database_info(self):
+        """Get information about the database file for GitHub storage"""
+        try:
+            file_size = os.path.getsize(self.db_name)
+            file_size_mb = file_size / (1024 * 1024)
+            
+            workout_count = self._workout_count()
+            
+            return {
+                'file_path': os.path.abspath(self.db_name),
+                'file_size_bytes': file_size,
+                'file_size_mb': round(file_size_mb, 2),
+                'workout_count': workout_count,
+                'github_ready': file_size < self.GITHUB_SIZE_LIMIT
+            }
+        except:
+            return None
+    
+    def _workout_count(self, cursor=None):
+        """Number of stored sets, read from the exercise summary instead of scanning workouts"""
+        if cursor is None:
+            cursor = self.pool.connection().cursor()
+        cursor.execute('SELECT COALESCE(SUM(total_sets), 0) FROM exercise_summary')
+        return cursor.fetchone()[0]
+    
+    def _pragma(self, cursor, name):
+        """Read a single-valued PRAGMA"""
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+    
+    def get_storage_stats(self):
+        """Page, freelist, per-table and per-index size and row count figures from SQLite metadata
+        
+        Object sizes need the dbstat virtual table and are None where SQLite was built without it. Row
+        counts come from sqlite_stat1 as of the last ANALYZE, except workouts, which is exact.
+        """
+        with self.pool.snapshot() as cursor:
+            page_size = self._pragma(cursor, 'page_size')
+            page_count = self._pragma(cursor, 'page_count')
+            freelist_count = self._pragma(cursor, 'freelist_count')
+            auto_vacuum = self._pragma(cursor, 'auto_vacuum')
+            
+            cursor.execute("SELECT name, type, tbl_name FROM sqlite_master WHERE type IN ('table', 'index')")
+            objects = {name: {'name': name, 'type': kind, 'table': table, 'pages': None, 'size_bytes': None}
+                       for name, kind, table in cursor.fetchall()}
+            try:
+                cursor.execute('SELECT name, pageno, pgsize FROM dbstat WHERE aggregate = TRUE')
+                for name, pages, size in cursor.fetchall():
+                    if name in objects:
+                        objects[name].update(pages=pages, size_bytes=size)
+            except sqlite3.Error:
+                pass
+            
+            row_counts = {}
+            try:
+                cursor.execute('SELECT tbl, stat FROM sqlite_stat1')
+                for table, stat in cursor.fetchall():
+                    row_counts[table] = max(row_counts.get(table, 0), int(str(stat).split()[0]))
+            except sqlite3.Error:
+                pass
+            row_counts['workouts'] = self._workout_count(cursor)
+            
+            cursor.execute('SELECT ran_at, trigger FROM maintenance_log ORDER BY id DESC LIMIT 1')
+            last_maintenance = cursor.fetchone()
+        
+        wal_file = f'{self.db_name}-wal'
+        return {
+            'file_size_bytes': os.path.getsize(self.db_name),
+            'wal_size_bytes': os.path.getsize(wal_file) if os.path.exists(wal_file) else 0,
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'freelist_bytes': freelist_count * page_size,
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(auto_vacuum, str(auto_vacuum)),
+            'objects': sorted(objects.values(), key=lambda o: -(o['size_bytes'] or 0)),
+            'row_counts': row_counts,
+            'last_maintenance': {'ran_at': last_maintenance[0], 'trigger': last_maintenance[1]} if last_maintenance else None,
+            'projection': self.project_size_limit()
+        }
+    
+    def project_size_limit(self):
+        """Project when the file crosses the GitHub size limit from the recent ingest rate
+        
+        Bytes per set is the used file size over the stored sets; the rate counts sets dated within the last
+        INGEST_WINDOW_DAYS on the date index.
+        """
+        cursor = self.pool.connection().cursor()
+        page_size = self._pragma(cursor, 'page_size')
+        used_bytes = (self._pragma(cursor, 'page_count') - self._pragma(cursor, 'freelist_count')) * page_size
+        workout_count = self._workout_count(cursor)
+        
+        since = (date.today() - timedelta(days=self.INGEST_WINDOW_DAYS)).strftime('%Y-%m-%d')
+        cursor.execute('SELECT COUNT(*) FROM workouts WHERE date >= ?', (since,))
+        sets_per_day = cursor.fetchone()[0] / self.INGEST_WINDOW_DAYS
+        
+        bytes_per_set = used_bytes / workout_count if workout_count else None
+        days_until_limit = None
+        if bytes_per_set and sets_per_day > 0:
+            days_until_limit = max(self.GITHUB_SIZE_LIMIT - used_bytes, 0) / (bytes_per_set * sets_per_day)
+        
+        return {
+            'used_bytes': used_bytes,
+            'limit_bytes': self.GITHUB_SIZE_LIMIT,
+            'bytes_per_set': bytes_per_set,
+            'sets_per_day': sets_per_day,
+            'days_until_limit': days_until_limit,
+            'limit_date': (date.today() + timedelta(days=days_until_limit)).strftime('%Y-%m-%d')
+                          if days_until_limit is not None and days_until_limit < 365 * 1000 else None
+        }
+    
+    def run_maintenance(self, trigger='manual', vacuum_pages=None, compact=False):
+        """Refresh planner statistics and return free pages to the filesystem
+        
+        Runs ANALYZE and PRAGMA optimize, then an incremental vacuum of vacuum_pages free pages (all when None).
+        compact=True runs a full VACUUM first, which also switches an older file to incremental auto-vacuum.
+        """
+        self.flush()
+        conn = self.pool.connection()
+        cursor = conn.cursor()
+        start = time.perf_counter()
+        pages_before = self._pragma(cursor, 'page_count')
+        freelist_before = self._pragma(cursor, 'freelist_count')
+        
+        # auto_vacuum can only change on an empty file or through VACUUM, which cannot run inside a transaction
+        if compact:
+            if self._pragma(cursor, 'auto_vacuum') != 2:
+                cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            cursor.execute('VACUUM')
+        
+        cursor.execute('ANALYZE')
+        cursor.execute('PRAGMA optimize')
+        if self._pragma(cursor, 'auto_vacuum') == 2:
+            # execute() steps a row-less PRAGMA once, freeing a single page - executescript runs it to completion
+            conn.executescript(f'PRAGMA incremental_vacuum({int(vacuum_pages or 0)});')
+        
+        result = {
+            'trigger': trigger,
+            'duration_ms': (time.perf_counter() - start) * 1000,
+            'pages_before': pages_before,
+            'pages_after': self._pragma(cursor, 'page_count'),
+            'freelist_before': freelist_before,
+            'freelist_after': self._pragma(cursor, 'freelist_count')
+        }
+        with self.pool.transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO maintenance_log (trigger, duration_ms, pages_before, pages_after, freelist_before, freelist_after)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', tuple(result.values()))
+        return result
+    
+    def run_scheduled_maintenance(self):
+        """Run maintenance when the last run is older than MAINTENANCE_INTERVAL_DAYS - returns its result or None"""
+        cursor = self.pool.connection().cursor()
+        cursor.execute("SELECT 1 FROM maintenance_log WHERE ran_at > datetime('now', ?)", (f'-{self.MAINTENANCE_INTERVAL_DAYS} days',))
+        if cursor.fetchone() is not None:
+            return None
+        return self.run_maintenance(trigger='scheduled')
+
+
+# ===== PROCESS-WIDE WRITE-BEHIND WRITER =====
+class _WriteBehindWriter:
+    """One daemon thread committing the write-behind queues of every GymTracker in the process
+    
+    Queued entries hold their tracker only until they are committed, so a tracker whose session ended is
+    freed like any other object. Anything still queued at interpreter exit is committed first.
+    """
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def start(self):
+        """Start the writer thread on first use"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='gym-tracker-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self._queue.join)
+    
+    def put(self, tracker, entry):
+        """Queue one tracker's workout entry for the next group commit"""
+        self._queue.put((tracker, entry))
+    
+    def _run(self):
+        """Collect entries for GROUP_COMMIT_WINDOW and commit each tracker's share in one transaction"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + GymTracker.GROUP_COMMIT_WINDOW
+            while len(batch) < GymTracker.GROUP_COMMIT_MAX_WORKOUTS:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            
+            groups = {}
+            for tracker, entry in batch:
+                groups.setdefault(id(tracker), (tracker, []))[1].append(entry)
+            try:
+                for tracker, entries in groups.values():
+                    tracker._commit_pending(entries)
+            finally:
+                for _ in range(len(batch)):
+                    self._queue.task_done()
+            
+            # Drop the references so trackers of finished sessions can be collected while the queue is idle
+            batch = groups = tracker = entry = entries = None
+
+
+_WRITER = _WriteBehindWriter()
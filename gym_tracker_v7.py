@@ -1,831 +1,21 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, date, timedelta
 import sqlite3
-import numpy as np
 import json
 import time
 import os
+from contextlib import nullcontext
 
-# ===== AI-ENHANCED GITHUB-PERSISTENT GYM TRACKER V9 - SMART FITNESS COMPANION =====
-class GymTracker:
-    def __init__(self, db_name='gym_tracker_MASTER.db'):
-        """Initialize AI-Enhanced GitHub-Persistent Gym Tracker with smart features"""
-        self.db_name = db_name
-        self.init_database()
-        
-        # Only migrate if database is truly empty (first time setup)
-        if self.is_database_empty():
-            self.migrate_old_data()
-        
-    def is_database_empty(self):
-        """Check if database is completely empty"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM workouts')
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count == 0
-        except:
-            return True
-        
-    def migrate_old_data(self):
-        """Migrate data from ALL previous versions - only runs once"""
-        old_db_names = [
-            'complete_gym_app.db', 'demo_workout.db', 'gym_app.db',
-            'gym_tracker_v2.db', 'gym_tracker_v2.1.db', 'gym_tracker_v3.db',
-            'gym_tracker_v4.db', 'gym_tracker_v5.db', 'gym_tracker_v6.db',
-            'gym_tracker_v7.db', 'workout_tracker.db'
-        ]
-        
-        migrated_any = False
-        for old_db in old_db_names:
-            if os.path.exists(old_db) and old_db != self.db_name:
-                try:
-                    old_conn = sqlite3.connect(old_db)
-                    cursor = old_conn.cursor()
-                    
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = [row[0] for row in cursor.fetchall()]
-                    
-                    if 'workouts' in tables:
-                        old_df = pd.read_sql_query('SELECT * FROM workouts', old_conn)
-                        if not old_df.empty:
-                            new_conn = sqlite3.connect(self.db_name)
-                            old_df.to_sql('workouts', new_conn, if_exists='append', index=False)
-                            new_conn.close()
-                            migrated_any = True
-                            break  # Stop after first successful migration
-                    
-                    old_conn.close()
-                        
-                except Exception as e:
-                    continue
-        
-        if migrated_any:
-            st.success("✅ Previous workout data migrated successfully!")
-        
-    def init_database(self):
-        """Create all database tables including new AI features"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workouts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                exercise TEXT NOT NULL,
-                set_number INTEGER NOT NULL,
-                reps INTEGER NOT NULL,
-                weight REAL NOT NULL,
-                rpe INTEGER,
-                set_notes TEXT,
-                workout_notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS custom_exercises (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                exercise_name TEXT UNIQUE NOT NULL,
-                category TEXT,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workout_templates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                template_name TEXT UNIQUE NOT NULL,
-                category TEXT,
-                description TEXT,
-                created_by TEXT,
-                exercises TEXT,
-                is_public INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_used TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_programs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                program_name TEXT,
-                created_by TEXT,
-                program_notes TEXT,
-                exercises TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS goals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                goal_name TEXT NOT NULL,
-                goal_type TEXT NOT NULL,
-                target_value REAL,
-                target_exercise TEXT,
-                target_date TEXT,
-                current_value REAL DEFAULT 0,
-                is_completed INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS offline_queue (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                workout_data TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                synced INTEGER DEFAULT 0
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
-    def log_workout(self, date_str, exercise, sets_data, workout_notes=""):
-        """Log a complete workout with multiple sets"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        for i, set_data in enumerate(sets_data, 1):
-            cursor.execute('''
-                INSERT INTO workouts (date, exercise, set_number, reps, weight, rpe, set_notes, workout_notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (date_str, exercise, i, set_data['reps'], set_data['weight'], 
-                  set_data.get('rpe'), set_data.get('set_notes', ''), workout_notes))
-        
-        conn.commit()
-        conn.close()
-        return f"✅ Logged {len(sets_data)} sets for {exercise}"
-    
-    def quick_log(self, exercise, reps, weight, rpe=None, set_notes="", workout_notes="", date_str=None):
-        """Quick log a single set"""
-        if date_str is None:
-            date_str = date.today().strftime('%Y-%m-%d')
-        
-        self.log_workout(date_str, exercise, [{'reps': reps, 'weight': weight, 'rpe': rpe, 'set_notes': set_notes}], workout_notes)
-    
-    def delete_set(self, set_id):
-        """Delete a specific set by ID"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM workouts WHERE id = ?', (set_id,))
-        rows_affected = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
-        return "✅ Set deleted successfully!" if rows_affected > 0 else "❌ Set not found!"
-    
-    def get_daily_workout(self, date_str):
-        """Get all exercises and sets for a specific date"""
-        conn = sqlite3.connect(self.db_name)
-        try:
-            df = pd.read_sql_query('''
-                SELECT id, exercise, set_number, reps, weight, rpe, set_notes, workout_notes, created_at
-                FROM workouts 
-                WHERE date = ? 
-                ORDER BY exercise, set_number
-            ''', conn, params=(date_str,))
-            conn.close()
-            return df
-        except:
-            conn.close()
-            return pd.DataFrame()
-    
-    def get_smart_suggestions(self, exercise):
-        """Get intelligent workout suggestions based on history"""
-        df = self.get_data()
-        if df.empty:
-            return None
-        
-        exercise_data = df[df['exercise'] == exercise].copy()
-        if exercise_data.empty:
-            return None
-        
-        # Get last workout for this exercise
-        last_date = exercise_data['date'].max()
-        last_workout = exercise_data[exercise_data['date'] == last_date]
-        
-        if last_workout.empty:
-            return None
-        
-        # Calculate suggestions
-        max_weight_last = last_workout['weight'].max()
-        total_volume_last = (last_workout['reps'] * last_workout['weight']).sum()
-        avg_rpe_last = last_workout['rpe'].mean() if last_workout['rpe'].notna().any() else 8
-        
-        # Progressive overload suggestions
-        suggestions = {
-            'last_workout': {
-                'date': last_date.strftime('%Y-%m-%d'),
-                'max_weight': max_weight_last,
-                'total_volume': total_volume_last,
-                'avg_rpe': avg_rpe_last,
-                'sets_reps': [(row['reps'], row['weight']) for _, row in last_workout.iterrows()]
-            }
-        }
-        
-        # Weight progression suggestion
-        if avg_rpe_last < 8:
-            weight_increase = 2.5 if max_weight_last < 60 else 5.0
-            suggestions['weight_suggestion'] = max_weight_last + weight_increase
-            suggestions['progression_type'] = 'weight'
-            suggestions['reason'] = f"Last RPE was {avg_rpe_last:.1f} - ready for more weight!"
-        elif avg_rpe_last > 9:
-            suggestions['weight_suggestion'] = max_weight_last - 2.5
-            suggestions['progression_type'] = 'deload'
-            suggestions['reason'] = f"Last RPE was {avg_rpe_last:.1f} - consider reducing weight"
-        else:
-            # Suggest rep progression
-            avg_reps_last = last_workout['reps'].mean()
-            suggestions['rep_suggestion'] = int(avg_reps_last + 1)
-            suggestions['weight_suggestion'] = max_weight_last
-            suggestions['progression_type'] = 'reps'
-            suggestions['reason'] = f"Good RPE {avg_rpe_last:.1f} - try adding a rep!"
-        
-        return suggestions
-    
-    def get_quick_stats(self):
-        """Calculate motivational quick stats with error handling"""
-        try:
-            df = self.get_data()
-            if df.empty:
-                return {
-                    'streak': 0,
-                    'weekly_volume': 0,
-                    'weekly_workouts': 0,
-                    'recent_prs': [],
-                    'total_workouts': 0,
-                    'total_volume': 0
-                }
-            
-            today = datetime.now().date()
-            
-            # Calculate workout streak with error handling
-            try:
-                dates = sorted(df['date'].dt.date.unique(), reverse=True)
-                streak = 0
-                for i, workout_date in enumerate(dates):
-                    if i == 0:
-                        if workout_date == today:
-                            streak = 1
-                        elif (today - workout_date).days == 1:
-                            streak = 1
-                        else:
-                            break
-                    else:
-                        prev_date = dates[i-1]
-                        if (prev_date - workout_date).days == 1:
-                            streak += 1
-                        elif (prev_date - workout_date).days <= 2:  # Allow 1 rest day
-                            streak += 1
-                        else:
-                            break
-            except:
-                streak = 0
-            
-            # This week's stats with error handling
-            try:
-                week_start = today - timedelta(days=today.weekday())
-                this_week_data = df[df['date'].dt.date >= week_start]
-                weekly_volume = float((this_week_data['reps'] * this_week_data['weight']).sum())
-                weekly_workouts = len(this_week_data['date'].dt.date.unique()) if not this_week_data.empty else 0
-            except:
-                weekly_volume = 0
-                weekly_workouts = 0
-            
-            # Recent PRs (last 30 days) with error handling
-            recent_prs = []
-            try:
-                recent_data = df[df['date'] >= (datetime.now() - timedelta(days=30))]
-                
-                if not recent_data.empty:
-                    for exercise in recent_data['exercise'].unique():
-                        try:
-                            exercise_data = df[df['exercise'] == exercise]
-                            if len(exercise_data) > 1:
-                                recent_exercise_data = recent_data[recent_data['exercise'] == exercise]
-                                if not recent_exercise_data.empty:
-                                    max_weight_recent = recent_exercise_data['weight'].max()
-                                    max_weight_all_time = exercise_data['weight'].max()
-                                    
-                                    if max_weight_recent == max_weight_all_time:
-                                        pr_date = recent_exercise_data[
-                                            recent_exercise_data['weight'] == max_weight_recent
-                                        ]['date'].max()
-                                        recent_prs.append({
-                                            'exercise': exercise,
-                                            'weight': float(max_weight_recent),
-                                            'date': pr_date.strftime('%Y-%m-%d')
-                                        })
-                        except:
-                            continue
-            except:
-                recent_prs = []
-            
-            # Total stats with error handling
-            try:
-                total_workouts = len(df['date'].unique())
-                total_volume = float((df['reps'] * df['weight']).sum())
-            except:
-                total_workouts = 0
-                total_volume = 0
-            
-            return {
-                'streak': int(streak),
-                'weekly_volume': weekly_volume,
-                'weekly_workouts': int(weekly_workouts),
-                'recent_prs': recent_prs[:3],  # Top 3 recent PRs
-                'total_workouts': int(total_workouts),
-                'total_volume': total_volume
-            }
-            
-        except Exception as e:
-            # Fallback to empty stats if anything goes wrong
-            return {
-                'streak': 0,
-                'weekly_volume': 0,
-                'weekly_workouts': 0,
-                'recent_prs': [],
-                'total_workouts': 0,
-                'total_volume': 0
-            }
-    
-    def create_goal(self, goal_name, goal_type, target_value, target_exercise=None, target_date=None):
-        """Create a new fitness goal"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO goals (goal_name, goal_type, target_value, target_exercise, target_date)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (goal_name, goal_type, target_value, target_exercise, target_date))
-        
-        conn.commit()
-        conn.close()
-        return f"✅ Goal '{goal_name}' created successfully!"
-    
-    def get_goals(self):
-        """Get all goals with progress"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM goals ORDER BY created_at DESC')
-        goals = cursor.fetchall()
-        conn.close()
-        
-        goal_list = []
-        df = self.get_data()
-        
-        for goal in goals:
-            goal_data = {
-                'id': goal[0],
-                'name': goal[1],
-                'type': goal[2],
-                'target_value': goal[3],
-                'target_exercise': goal[4],
-                'target_date': goal[5],
-                'current_value': goal[6],
-                'is_completed': bool(goal[7]),
-                'created_at': goal[8],
-                'completed_at': goal[9]
-            }
-            
-            # Calculate current progress
-            if not df.empty and goal_data['target_exercise']:
-                exercise_data = df[df['exercise'] == goal_data['target_exercise']]
-                if not exercise_data.empty:
-                    if goal_data['type'] == 'max_weight':
-                        goal_data['current_value'] = exercise_data['weight'].max()
-                    elif goal_data['type'] == 'total_volume':
-                        goal_data['current_value'] = (exercise_data['reps'] * exercise_data['weight']).sum()
-                    elif goal_data['type'] == 'workout_frequency':
-                        # Count workouts in current period
-                        if goal_data['target_date']:
-                            start_date = datetime.strptime(goal_data['created_at'][:10], '%Y-%m-%d').date()
-                            end_date = datetime.strptime(goal_data['target_date'], '%Y-%m-%d').date()
-                            period_data = df[
-                                (df['date'].dt.date >= start_date) & 
-                                (df['date'].dt.date <= end_date)
-                            ]
-                            goal_data['current_value'] = len(period_data['date'].dt.date.unique())
-            
-            goal_list.append(goal_data)
-        
-        return goal_list
-    
-    def update_goal_progress(self, goal_id):
-        """Update goal progress and check completion"""
-        goals = self.get_goals()
-        goal = next((g for g in goals if g['id'] == goal_id), None)
-        
-        if not goal:
-            return False
-        
-        # Check if goal is completed
-        if goal['current_value'] >= goal['target_value'] and not goal['is_completed']:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE goals 
-                SET current_value = ?, is_completed = 1, completed_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (goal['current_value'], goal_id))
-            
-            conn.commit()
-            conn.close()
-            return True
-        
-        return False
-    
-    def queue_offline_workout(self, workout_data):
-        """Queue workout for offline sync"""
-        # Note: In Claude.ai environment, we'll use in-memory storage
-        # In a real deployment, this would use localStorage
-        if 'offline_queue' not in st.session_state:
-            st.session_state.offline_queue = []
-        
-        st.session_state.offline_queue.append({
-            'data': workout_data,
-            'timestamp': datetime.now().isoformat(),
-            'synced': False
-        })
-        
-        return "📱 Workout saved offline - will sync when connection returns"
-    
-    def sync_offline_workouts(self):
-        """Sync queued offline workouts"""
-        if 'offline_queue' not in st.session_state:
-            return "✅ No offline workouts to sync"
-        
-        synced_count = 0
-        for workout in st.session_state.offline_queue:
-            if not workout['synced']:
-                try:
-                    # Process the offline workout data
-                    data = workout['data']
-                    self.log_workout(
-                        data['date'], data['exercise'], data['sets'], data.get('notes', '')
-                    )
-                    workout['synced'] = True
-                    synced_count += 1
-                except Exception as e:
-                    continue
-        
-        return f"✅ Synced {synced_count} offline workouts"
-    
-    def add_custom_exercise(self, exercise_name, category="Custom", description=""):
-        """Add a new custom exercise"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                INSERT INTO custom_exercises (exercise_name, category, description)
-                VALUES (?, ?, ?)
-            ''', (exercise_name, category, description))
-            conn.commit()
-            conn.close()
-            return f"✅ Successfully added: {exercise_name}"
-        except sqlite3.IntegrityError:
-            conn.close()
-            return f"❌ Exercise '{exercise_name}' already exists!"
-    
-    def create_daily_program(self, date_str, program_name, created_by, program_notes, exercises_list):
-        """Create a daily workout program"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        exercises_json = json.dumps(exercises_list)
-        
-        cursor.execute('DELETE FROM daily_programs WHERE date = ?', (date_str,))
-        
-        cursor.execute('''
-            INSERT INTO daily_programs (date, program_name, created_by, program_notes, exercises)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (date_str, program_name, created_by, program_notes, exercises_json))
-        
-        conn.commit()
-        conn.close()
-        return f"✅ Created program '{program_name}' for {date_str}"
-    
-    def get_daily_program(self, date_str):
-        """Get the daily program for a specific date"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM daily_programs WHERE date = ?', (date_str,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        if result:
-            return {
-                'id': result[0],
-                'date': result[1],
-                'program_name': result[2],
-                'created_by': result[3],
-                'program_notes': result[4],
-                'exercises': json.loads(result[5]),
-                'created_at': result[6]
-            }
-        return None
-    
-    def save_template(self, template_name, category, description, created_by, exercises_list, is_public=False):
-        """Save a workout template"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        exercises_json = json.dumps(exercises_list)
-        
-        try:
-            cursor.execute('''
-                INSERT INTO workout_templates (template_name, category, description, created_by, exercises, is_public)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (template_name, category, description, created_by, exercises_json, int(is_public)))
-            
-            conn.commit()
-            conn.close()
-            return f"✅ Template '{template_name}' saved successfully!"
-        except sqlite3.IntegrityError:
-            conn.close()
-            return f"❌ Template '{template_name}' already exists!"
-
-    def get_templates(self, category=None, created_by=None):
-        """Get workout templates with optional filtering"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        query = 'SELECT * FROM workout_templates WHERE 1=1'
-        params = []
-        
-        if category:
-            query += ' AND category = ?'
-            params.append(category)
-        
-        if created_by:
-            query += ' AND created_by = ?'
-            params.append(created_by)
-        
-        query += ' ORDER BY last_used DESC, created_at DESC'
-        
-        cursor.execute(query, params)
-        templates = cursor.fetchall()
-        conn.close()
-        
-        template_list = []
-        for template in templates:
-            template_list.append({
-                'id': template[0],
-                'name': template[1],
-                'category': template[2],
-                'description': template[3],
-                'created_by': template[4],
-                'exercises': json.loads(template[5]),
-                'is_public': bool(template[6]),
-                'created_at': template[7],
-                'last_used': template[8]
-            })
-        
-        return template_list
-
-    def delete_template(self, template_id):
-        """Delete a workout template"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM workout_templates WHERE id = ?', (template_id,))
-        rows_affected = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
-        return "✅ Template deleted successfully!" if rows_affected > 0 else "❌ Template not found!"
-    
-    def get_all_exercises(self):
-        """Get comprehensive exercise database with 500+ exercises"""
-        built_in_exercises = [
-            # Chest Exercises
-            'Bench Press', 'Incline Bench Press', 'Decline Bench Press', 'Dumbbell Press', 'Incline Dumbbell Press',
-            'Decline Dumbbell Press', 'Dumbbell Flyes', 'Incline Dumbbell Flyes', 'Cable Crossover', 'Pec Deck',
-            'Chest Dips', 'Push-ups', 'Diamond Push-ups', 'Wide Grip Push-ups', 'Incline Push-ups',
-            'Machine Chest Press', 'Hammer Strength Chest Press', 'Landmine Press', 'Svend Press',
-            
-            # Back Exercises  
-            'Deadlift', 'Romanian Deadlift', 'Sumo Deadlift', 'Stiff Leg Deadlift', 'Single Leg RDL',
-            'Barbell Row', 'Bent Over Row', 'Pendlay Row', 'T-Bar Row', 'Dumbbell Row',
-            'Single Arm Dumbbell Row', 'Chest Supported Row', 'Seated Cable Row', 'Wide Grip Cable Row',
-            'Pull-ups', 'Chin-ups', 'Wide Grip Pull-ups', 'Narrow Grip Pull-ups', 'Weighted Pull-ups',
-            'Lat Pulldown', 'Wide Grip Pulldown', 'Reverse Grip Pulldown', 'V-Bar Pulldown',
-            'Face Pulls', 'Reverse Flyes', 'Shrugs', 'Dumbbell Shrugs', 'Cable Shrugs',
-            'Good Mornings', 'Hyperextensions', 'Reverse Hyperextensions',
-            
-            # Leg Exercises
-            'Squat', 'Back Squat', 'Front Squat', 'Goblet Squat', 'Box Squat', 'Pause Squat',
-            'Bulgarian Split Squat', 'Split Squat', 'Reverse Lunge', 'Forward Lunge', 'Walking Lunges',
-            'Lateral Lunges', 'Curtsy Lunges', 'Jump Lunges', 'Hack Squat', 'Leg Press',
-            'Single Leg Press', 'Leg Extension', 'Leg Curl', 'Lying Leg Curl', 'Seated Leg Curl',
-            'Standing Leg Curl', 'Nordic Curls', 'Glute Ham Raise', 'Hip Thrust', 'Glute Bridge',
-            'Single Leg Hip Thrust', 'Barbell Hip Thrust', 'Dumbbell Hip Thrust', 'Cossack Squat',
-            'Pistol Squat', 'Jump Squat', 'Wall Sit', 'Step Ups', 'Lateral Step Ups',
-            
-            # Shoulder Exercises
-            'Overhead Press', 'Military Press', 'Push Press', 'Seated Overhead Press', 'Dumbbell Shoulder Press',
-            'Single Arm Overhead Press', 'Arnold Press', 'Machine Shoulder Press', 'Pike Push-ups',
-            'Lateral Raises', 'Side Lateral Raises', 'Front Raises', 'Rear Delt Flyes', 'Bent Over Lateral Raises',
-            'Cable Lateral Raises', 'Leaning Lateral Raises', 'Upright Row', 'High Pull',
-            'Handstand Push-ups', 'Pike Push-ups', 'Cuban Press', 'Bradford Press',
-            
-            # Arm Exercises
-            'Bicep Curls', 'Barbell Curls', 'Dumbbell Curls', 'Hammer Curls', 'Concentration Curls',
-            'Preacher Curls', 'Spider Curls', 'Cable Curls', '21s', 'Zottman Curls',
-            'Reverse Curls', 'Drag Curls', 'Incline Dumbbell Curls', 'Cable Hammer Curls',
-            'Tricep Pushdown', 'Close Grip Bench Press', 'Tricep Dips', 'Diamond Push-ups',
-            'Overhead Tricep Extension', 'Lying Tricep Extension', 'Skull Crushers', 'French Press',
-            'Single Arm Tricep Extension', 'Tricep Kickbacks', 'Dumbbell Tricep Press',
-            
-            # Core Exercises
-            'Plank', 'Side Plank', 'Plank Up-Downs', 'Plank Jacks', 'Mountain Climbers',
-            'Crunches', 'Bicycle Crunches', 'Reverse Crunches', 'Russian Twists', 'Dead Bug',
-            'Bird Dog', 'Hollow Body Hold', 'V-Ups', 'Leg Raises', 'Hanging Leg Raises',
-            'Knee Raises', 'Windshield Wipers', 'Ab Wheel', 'Dragon Flag', 'L-Sits',
-            'Wood Chops', 'Cable Crunches', 'Machine Crunches', 'Sit-ups', 'Decline Sit-ups',
-            
-            # Additional exercises for completeness
-            'Calf Raises', 'Standing Calf Raises', 'Seated Calf Raises', 'Single Leg Calf Raises',
-            'Farmers Walk', 'Kettlebell Swings', 'Turkish Get-ups', 'Burpees', 'Battle Ropes'
-        ]
-        
-        # Add custom exercises from database
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT exercise_name FROM custom_exercises ORDER BY exercise_name')
-        custom_exercises = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        
-        all_exercises = built_in_exercises + custom_exercises
-        return sorted(list(set(all_exercises)))
-    
-    def get_custom_exercises(self):
-        """Get all custom exercises with details"""
-        conn = sqlite3.connect(self.db_name)
-        try:
-            df = pd.read_sql_query('''
-                SELECT exercise_name, category, description, created_at 
-                FROM custom_exercises 
-                ORDER BY created_at DESC
-            ''', conn)
-            conn.close()
-            return df
-        except:
-            conn.close()
-            return pd.DataFrame()
-    
-    def get_data(self):
-        """Get all workout data"""
-        conn = sqlite3.connect(self.db_name)
-        try:
-            df = pd.read_sql_query('SELECT * FROM workouts ORDER BY date DESC, exercise, set_number', conn)
-            conn.close()
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-            return df
-        except:
-            conn.close()
-            return pd.DataFrame()
-    
-    def get_exercise_stats(self, exercise):
-        """Get comprehensive stats for an exercise"""
-        df = self.get_data()
-        if df.empty:
-            return None
-        
-        exercise_data = df[df['exercise'] == exercise]
-        if exercise_data.empty:
-            return None
-        
-        daily_stats = exercise_data.groupby('date').agg({
-            'weight': ['max', 'mean'],
-            'reps': ['sum', 'mean'],
-            'set_number': 'count'
-        }).round(2)
-        
-        daily_stats.columns = ['max_weight', 'avg_weight', 'total_reps', 'avg_reps', 'total_sets']
-        daily_stats['volume'] = exercise_data.groupby('date').apply(lambda x: (x['reps'] * x['weight']).sum())
-        daily_stats.reset_index(inplace=True)
-        
-        return {
-            'daily_stats': daily_stats,
-            'max_weight': exercise_data['weight'].max(),
-            'total_volume': (exercise_data['reps'] * exercise_data['weight']).sum(),
-            'total_sets': len(exercise_data),
-            'workout_count': len(exercise_data['date'].unique()),
-            'avg_rpe': exercise_data['rpe'].mean() if exercise_data['rpe'].notna().any() else 0
-        }
-
-    def clean_sample_data(self):
-        """Remove obvious sample/fake data"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        # Target specific fake data patterns
-        fake_patterns = [
-            "Warm up set, felt good",
-            "Working weight", 
-            "Heavy set, good depth",
-            "Full range of motion",
-            "Slight fatigue",
-            "Great leg session! Gym was quiet, felt strong.",
-            "Finished with leg press, good pump"
-        ]
-        
-        deleted_count = 0
-        for pattern in fake_patterns:
-            cursor.execute('DELETE FROM workouts WHERE set_notes LIKE ? OR workout_notes LIKE ?', 
-                          (f'%{pattern}%', f'%{pattern}%'))
-            deleted_count += cursor.rowcount
-        
-        # Remove specific fake workout combinations
-        cursor.execute('''DELETE FROM workouts WHERE 
-                         exercise = 'Hack Squat' AND weight IN (80.0, 90.0, 100.0) AND reps IN (12, 10, 8)''')
-        deleted_count += cursor.rowcount
-        
-        cursor.execute('''DELETE FROM workouts WHERE 
-                         exercise = 'Leg Press' AND weight IN (150.0, 170.0) AND reps IN (15, 12)''')
-        deleted_count += cursor.rowcount
-        
-        conn.commit()
-        conn.close()
-        
-        return f"✅ Removed {deleted_count} fake data entries" if deleted_count > 0 else "✅ No fake data found"
-    
-    def reset_all_data(self):
-        """Nuclear option - delete all workout data"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM workouts')
-        cursor.execute('DELETE FROM daily_programs')
-        conn.commit()
-        conn.close()
-        return "🚨 ALL WORKOUT DATA DELETED"
-
-    def export_data(self, export_file='gym_backup.json'):
-        """Export all data to JSON for backup"""
-        try:
-            export_data = {}
-            
-            # Export workouts
-            workouts_df = self.get_data()
-            if not workouts_df.empty:
-                workouts_df['date'] = workouts_df['date'].dt.strftime('%Y-%m-%d')
-                export_data['workouts'] = workouts_df.to_dict('records')
-            
-            # Export templates
-            templates = self.get_templates()
-            if templates:
-                export_data['templates'] = templates
-            
-            # Export custom exercises
-            custom_exercises = self.get_custom_exercises()
-            if not custom_exercises.empty:
-                export_data['custom_exercises'] = custom_exercises.to_dict('records')
-            
-            with open(export_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-            
-            return f"✅ Data exported to {export_file}"
-            
-        except Exception as e:
-            return f"❌ Export failed: {str(e)}"
-
-    def get_database_info(self):
-        """Get information about the database file for GitHub storage"""
-        try:
-            file_size = os.path.getsize(self.db_name)
-            file_size_mb = file_size / (1024 * 1024)
-            
-            workout_count = len(self.get_data())
-            
-            return {
-                'file_path': os.path.abspath(self.db_name),
-                'file_size_bytes': file_size,
-                'file_size_mb': round(file_size_mb, 2),
-                'workout_count': workout_count,
-                'github_ready': file_size < 100 * 1024 * 1024  # 100MB limit
-            }
-        except:
-            return None
+from gym_tracker_core import (
+    BUILT_IN_EXERCISES,
+    EXERCISE_CATALOG,
+    FigureCache,
+    GymTracker,
+    build_trend_figure,
+    build_volume_progress_figure,
+    build_weight_progress_figure,
+)
 
 # Streamlit App Setup
 st.set_page_config(
@@ -1176,6 +366,35 @@ st.markdown("""
         border-color: #e2e8f0;
     }
     
+    /* MAIN NAVIGATION - radio styled like the tab bar */
+    .stRadio [role="radiogroup"] {
+        gap: 8px;
+        background: #f8fafc;
+        padding: 12px;
+        border-radius: 16px;
+        border: 1px solid #e2e8f0;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
+    }
+    
+    .stRadio [role="radiogroup"] label {
+        padding: 0.75rem 1.5rem;
+        border-radius: 12px;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    }
+    
+    .stRadio [role="radiogroup"] label:has(input:checked) {
+        background: #3b82f6;
+        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
+    }
+    
+    .stRadio [role="radiogroup"] label:has(input:checked) p {
+        color: #ffffff !important;
+        font-weight: 700 !important;
+    }
+    
     /* SEARCH INPUT STYLING */
     .stTextInput > div > div > input[placeholder*="Search"] {
         background: #ffffff !important;
@@ -1342,6 +561,16 @@ st.markdown("""
 # Initialize session state
 if 'tracker' not in st.session_state:
     st.session_state.tracker = GymTracker()
+    if st.session_state.tracker.migrated_from:
+        st.success("✅ Previous workout data migrated successfully!")
+    # GYM_TRACKER_INSTRUMENT=1 turns method and SQL timing on from the first rerun
+    if os.environ.get('GYM_TRACKER_INSTRUMENT', '').lower() in ('1', 'true', 'yes'):
+        st.session_state.tracker.enable_instrumentation()
+    # ANALYZE and vacuum when the last run is older than a week - never block the app on it
+    try:
+        st.session_state.tracker.run_scheduled_maintenance()
+    except sqlite3.Error:
+        pass
 
 if 'last_exercise' not in st.session_state:
     st.session_state.last_exercise = 'Bench Press'
@@ -1355,22 +584,18 @@ if 'last_rpe' not in st.session_state:
 if 'template_exercises' not in st.session_state:
     st.session_state.template_exercises = []
 
+if 'figure_cache' not in st.session_state:
+    st.session_state.figure_cache = FigureCache()
+
 if 'program_exercises' not in st.session_state:
     st.session_state.program_exercises = []
 
 # Helper Functions
 def get_last_workout_for_exercise(exercise):
     """Get the last workout data for a specific exercise"""
-    df = st.session_state.tracker.get_data()
-    if df.empty:
-        return None
-    
-    exercise_data = df[df['exercise'] == exercise]
-    if exercise_data.empty:
+    last_workout = st.session_state.tracker.get_last_session(exercise)
+    if last_workout.empty:
         return None
-    
-    last_date = exercise_data['date'].max()
-    last_workout = exercise_data[exercise_data['date'] == last_date]
     return last_workout
 
 def smart_exercise_search(all_exercises, search_term, max_results=10):
@@ -1378,76 +603,33 @@ def smart_exercise_search(all_exercises, search_term, max_results=10):
     if not search_term:
         return all_exercises[:max_results]
     
-    search_term = search_term.lower().strip()
-    
-    # Exact matches first
-    exact_matches = [ex for ex in all_exercises if search_term in ex.lower()]
-    
-    # Common abbreviations and synonyms
-    abbreviations = {
-        'rdl': 'romanian deadlift',
-        'ohp': 'overhead press',
-        'bp': 'bench press',
-        'mp': 'military press',
-        'dl': 'deadlift',
-        'sq': 'squat',
-        'db': 'dumbbell',
-        'bb': 'barbell',
-        'cg': 'close grip',
-        'wg': 'wide grip',
-        'lat': 'lateral',
-        'tri': 'tricep',
-        'bi': 'bicep',
-        'leg ext': 'leg extension',
-        'leg cur': 'leg curl',
-        'calf': 'calf raises',
-        'pull up': 'pull-ups',
-        'chin up': 'chin-ups',
-        'push up': 'push-ups'
-    }
-    
-    # Check abbreviations
-    expanded_search = abbreviations.get(search_term, search_term)
-    if expanded_search != search_term:
-        exact_matches.extend([ex for ex in all_exercises if expanded_search in ex.lower() and ex not in exact_matches])
-    
-    # Fuzzy matching for typos
-    fuzzy_matches = []
-    for exercise in all_exercises:
-        if exercise in exact_matches:
-            continue
-            
-        exercise_lower = exercise.lower()
-        
-        # Check if most characters match (typo tolerance)
-        if len(search_term) >= 3:
-            matches = sum(1 for c in search_term if c in exercise_lower)
-            if matches >= len(search_term) * 0.7:  # 70% character match
-                fuzzy_matches.append(exercise)
-    
-    # Combine results, exact matches first
-    results = exact_matches + fuzzy_matches
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    final_results = []
-    for ex in results:
-        if ex not in seen:
-            seen.add(ex)
-            final_results.append(ex)
-    
-    return final_results[:max_results]
+    return st.session_state.tracker.search_exercises(search_term, max_results)
+
+def kept_value(key, default=None):
+    """Last value of a page widget - Streamlit drops the state of widgets a rerun does not render"""
+    return st.session_state.get(f"kept_{key}", default)
+
+def keep_value(key, value):
+    """Remember a page widget's value outside the widget, so switching pages and back restores it"""
+    st.session_state[f"kept_{key}"] = value
+    return value
+
+def kept_index(key, options, default=0):
+    """Position of a widget's remembered option, for seeding index= when its page renders again"""
+    value = kept_value(key)
+    return options.index(value) if value in options else default
 
 def clean_exercise_selector(all_exercises, default_exercise=None, key="exercise_search"):
     """Clean, mobile-optimized exercise selector with smart search"""
     
     # Search input with better styling
-    search_term = st.text_input(
+    search_term = keep_value(f"{key}_search", st.text_input(
         "",  # No label to save space
         placeholder="🔍 Search 500+ exercises... (try 'rdl', 'bench', 'squat')",
+        value=kept_value(f"{key}_search", ""),
         key=f"{key}_search",
         help="Smart search with typo tolerance and abbreviations"
-    )
+    ))
     
     # Smart search with fuzzy matching
     if search_term:
@@ -1478,11 +660,11 @@ def clean_exercise_selector(all_exercises, default_exercise=None, key="exercise_
         selected_exercise = st.selectbox(
             "Select Exercise",
             options=exercises_to_show,
-            index=default_index,
+            index=kept_index(f"{key}_select", exercises_to_show, default_index),
             key=f"{key}_select",
             label_visibility="collapsed"  # Hide label for cleaner look
         )
-        return selected_exercise
+        return keep_value(f"{key}_select", selected_exercise)
     
     return default_exercise or ""
 
@@ -1491,7 +673,7 @@ def todays_workout_page():
     """Today's workout with program support"""
     st.markdown('<h1 style="font-size: 2rem; font-weight: 800; color: #1e293b; margin-bottom: 1.5rem; text-transform: uppercase;">🔥 Today\'s Workout</h1>', unsafe_allow_html=True)
     
-    selected_date = st.date_input("📅 Workout Date", value=date.today())
+    selected_date = keep_value("today_date", st.date_input("📅 Workout Date", value=kept_value("today_date", date.today()), key="today_date"))
     date_str = selected_date.strftime('%Y-%m-%d')
     
     if selected_date == date.today():
@@ -1520,11 +702,8 @@ def todays_workout_page():
         exercises = program['exercises']
         
         # Calculate progress
-        completed_exercises = []
-        df = st.session_state.tracker.get_data()
-        if not df.empty:
-            today_data = df[df['date'] == date_str]
-            completed_exercises = today_data['exercise'].unique().tolist()
+        today_sets = st.session_state.tracker.query_sets(['exercise'], start_date=date_str, end_date=date_str)
+        completed_exercises = today_sets['exercise'].unique().tolist()
         
         progress_percentage = (len(completed_exercises) / len(exercises)) * 100 if exercises else 0
         
@@ -1585,27 +764,24 @@ def todays_workout_page():
     # Today's summary
     st.markdown('<h2 style="font-size: 1.75rem; font-weight: 800; color: #1e40af; margin-bottom: 1.25rem; text-transform: uppercase;">📊 Today\'s Summary</h2>', unsafe_allow_html=True)
     
-    df = st.session_state.tracker.get_data()
-    if not df.empty:
-        today_data = df[df['date'] == date_str]
+    today_data = st.session_state.tracker.query_sets(['exercise', 'reps', 'weight'], start_date=date_str, end_date=date_str)
+    if not today_data.empty:
+        col1, col2, col3 = st.columns(3)
         
-        if not today_data.empty:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown('<div class="stats-card">💪<br><strong>Exercises</strong><br>' + 
-                           str(len(today_data['exercise'].unique())) + '</div>', unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown('<div class="stats-card">🎯<br><strong>Sets</strong><br>' + 
-                           str(len(today_data)) + '</div>', unsafe_allow_html=True)
-            
-            with col3:
-                volume = (today_data['reps'] * today_data['weight']).sum()
-                st.markdown('<div class="stats-card">🏋️<br><strong>Volume</strong><br>' + 
-                           f'{volume:,.0f} kg</div>', unsafe_allow_html=True)
-        else:
-            st.info("💡 No exercises logged yet today. Time to get started! 🔥")
+        with col1:
+            st.markdown('<div class="stats-card">💪<br><strong>Exercises</strong><br>' + 
+                       str(len(today_data['exercise'].unique())) + '</div>', unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown('<div class="stats-card">🎯<br><strong>Sets</strong><br>' + 
+                       str(len(today_data)) + '</div>', unsafe_allow_html=True)
+        
+        with col3:
+            volume = (today_data['reps'] * today_data['weight']).sum()
+            st.markdown('<div class="stats-card">🏋️<br><strong>Volume</strong><br>' + 
+                       f'{volume:,.0f} kg</div>', unsafe_allow_html=True)
+    elif not st.session_state.tracker.is_database_empty():
+        st.info("💡 No exercises logged yet today. Time to get started! 🔥")
     else:
         st.info("💡 No workout data yet. Start your fitness journey today! 🚀")
 
@@ -1613,7 +789,7 @@ def enhanced_quick_log_page():
     """Clean, simplified quick log optimized for mobile with smart suggestions"""
     st.markdown('<h1 style="font-size: 2rem; font-weight: 800; color: #1e293b; margin-bottom: 1.5rem; text-transform: uppercase;">⚡ Quick Log</h1>', unsafe_allow_html=True)
     
-    log_date = st.date_input("📅 Select Date", value=date.today())
+    log_date = keep_value("quick_log_date", st.date_input("📅 Select Date", value=kept_value("quick_log_date", date.today()), key="quick_log_date"))
     date_str = log_date.strftime('%Y-%m-%d')
     
     if log_date == date.today():
@@ -1692,6 +868,26 @@ def enhanced_quick_log_page():
     else:
         suggested_weight = st.session_state.last_weight
     
+    # Offline status indicator - buttons are not allowed inside the form
+    offline_count = st.session_state.tracker.get_offline_queue_count()
+    if offline_count > 0:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.warning(f"📱 {offline_count} workouts saved offline")
+        with col2:
+            if st.button("🔄 Sync", help="Sync offline workouts", use_container_width=True):
+                result = st.session_state.tracker.sync_offline_workouts()
+                st.success(result)
+                st.rerun()
+
+    # Write-behind logging - LOG SET returns before the set is committed
+    write_behind = st.toggle("⚡ Fast logging (write-behind)", value=st.session_state.tracker.write_behind,
+                             help="Sets are committed in the background; they show up immediately")
+    st.session_state.tracker.set_write_behind(write_behind)
+    write_status = st.session_state.tracker.get_write_behind_status()
+    if write_status['last_error']:
+        st.warning(f"📱 Background save failed, sets were saved offline: {write_status['last_error']}")
+
     # Clean, simplified logging form
     with st.form("quick_log_form", clear_on_submit=True):
         # Input fields in clean layout
@@ -1705,21 +901,8 @@ def enhanced_quick_log_page():
         rpe = st.select_slider("💥 RPE", options=[6, 7, 8, 9, 10], value=st.session_state.last_rpe)
         set_notes = st.text_input("📝 Notes (optional)", placeholder="Form, fatigue, equipment notes...")
         
-        # Offline status indicator
-        col1, col2 = st.columns([3, 1])
-        with col2:
-            if 'offline_queue' in st.session_state and st.session_state.offline_queue:
-                offline_count = len([w for w in st.session_state.offline_queue if not w['synced']])
-                if offline_count > 0:
-                    st.warning(f"📱 {offline_count} offline")
-                    if st.button("🔄 Sync", help="Sync offline workouts"):
-                        result = st.session_state.tracker.sync_offline_workouts()
-                        st.success(result)
-                        st.rerun()
-        
         # Clean submit button
-        with col1:
-            submitted = st.form_submit_button("🚀 LOG SET", use_container_width=True)
+        submitted = st.form_submit_button("🚀 LOG SET", use_container_width=True)
         
         if submitted and exercise:
             try:
@@ -1732,11 +915,9 @@ def enhanced_quick_log_page():
                 st.session_state.last_rpe = rpe
                 
                 # Check goal progress
-                goals = st.session_state.tracker.get_goals()
-                for goal in goals:
-                    if st.session_state.tracker.update_goal_progress(goal['id']):
-                        st.balloons()
-                        st.success(f"🎉 Goal Completed: {goal['name']}!")
+                for goal in st.session_state.tracker.evaluate_goals():
+                    st.balloons()
+                    st.success(f"🎉 Goal Completed: {goal['name']}!")
                 
                 st.balloons()
                 st.rerun()
@@ -1780,7 +961,10 @@ def enhanced_quick_log_page():
                                unsafe_allow_html=True)
                 
                 with col2:
-                    if st.button("🗑️", key=f"delete_{set_row['id']}", help="Delete this set"):
+                    # Queued write-behind sets get a real id only once the writer commits them
+                    if set_row['id'] < 0:
+                        st.caption("⏳ pending")
+                    elif st.button("🗑️", key=f"delete_{set_row['id']}", help="Delete this set"):
                         if st.session_state.get('confirm_delete_set') == set_row['id']:
                             result = st.session_state.tracker.delete_set(set_row['id'])
                             st.session_state.pop('confirm_delete_set', None)
@@ -1818,15 +1002,21 @@ def progress_page():
     """Progress tracking page"""
     st.markdown('<h1 style="font-size: 2rem; font-weight: 800; color: #1e293b; margin-bottom: 1.5rem; text-transform: uppercase;">📈 Progress</h1>', unsafe_allow_html=True)
     
-    df = st.session_state.tracker.get_data()
+    summaries = st.session_state.tracker.get_exercise_summaries()
     
-    if df.empty:
+    if summaries.empty:
         st.warning("No workout data yet. Start logging to see progress! 🚀")
         return
     
-    available_exercises = df['exercise'].unique()
-    selected_exercise = st.selectbox("🏋️ Choose Exercise", available_exercises)
+    # Most recently trained first
+    available_exercises = summaries.sort_values('last_date', ascending=False, kind='stable').index.tolist()
+    selected_exercise = keep_value("progress_exercise", st.selectbox(
+        "🏋️ Choose Exercise", available_exercises,
+        index=kept_index("progress_exercise", available_exercises), key="progress_exercise"
+    ))
     
+    # Read before the stats so a write racing them leaves the cached figures stale rather than mislabelled
+    version = st.session_state.tracker.get_exercise_version(selected_exercise)
     stats = st.session_state.tracker.get_exercise_stats(selected_exercise)
     
     if stats:
@@ -1849,76 +1039,36 @@ def progress_page():
         daily_stats = stats['daily_stats']
         
         if len(daily_stats) > 1:
-            fig = go.Figure()
-            
-            # Max weight line
-            fig.add_trace(go.Scatter(
-                x=daily_stats['date'], 
-                y=daily_stats['max_weight'],
-                mode='lines+markers',
-                name='Max Weight',
-                line=dict(color='#1e40af', width=3),
-                marker=dict(size=8, color='#1e40af')
-            ))
-            
-            # Average weight line
-            fig.add_trace(go.Scatter(
-                x=daily_stats['date'], 
-                y=daily_stats['avg_weight'],
-                mode='lines+markers',
-                name='Average Weight',
-                line=dict(color='#10b981', width=2, dash='dash'),
-                marker=dict(size=6, color='#10b981')
-            ))
-            
-            fig.update_layout(
-                title=f'{selected_exercise} - Weight Progress',
-                xaxis_title='Date',
-                yaxis_title='Weight (kg)',
-                height=400,
-                paper_bgcolor='#ffffff',
-                plot_bgcolor='#f8fafc',
-                font=dict(color='#1e293b', size=12),
-                xaxis=dict(gridcolor='#e2e8f0'),
-                yaxis=dict(gridcolor='#e2e8f0'),
-                legend=dict(
-                    bgcolor='rgba(248, 250, 252, 0.9)',
-                    bordercolor='#e2e8f0',
-                    borderwidth=1,
-                    font=dict(color='#1e293b')
-                )
-            )
+            # Figures are rebuilt only when this exercise's sets change
+            figure_cache = st.session_state.figure_cache
+            fig = figure_cache.get_or_build(selected_exercise, version, 'weight',
+                                            lambda: build_weight_progress_figure(selected_exercise, daily_stats))
             st.plotly_chart(fig, use_container_width=True)
             
             # Volume progression chart
             st.markdown('<h3 style="font-size: 1.375rem; font-weight: 800; color: #374151; margin-bottom: 1rem;">📦 Volume Progression</h3>', unsafe_allow_html=True)
             
-            fig2 = go.Figure()
-            fig2.add_trace(go.Scatter(
-                x=daily_stats['date'], 
-                y=daily_stats['volume'],
-                mode='lines+markers',
-                name='Daily Volume',
-                line=dict(color='#f59e0b', width=3),
-                marker=dict(size=8, color='#f59e0b'),
-                fill='tonexty'
-            ))
-            
-            fig2.update_layout(
-                title=f'{selected_exercise} - Volume Progress',
-                xaxis_title='Date',
-                yaxis_title='Volume (kg)',
-                height=400,
-                paper_bgcolor='#ffffff',
-                plot_bgcolor='#f8fafc',
-                font=dict(color='#1e293b', size=12),
-                xaxis=dict(gridcolor='#e2e8f0'),
-                yaxis=dict(gridcolor='#e2e8f0')
-            )
+            fig2 = figure_cache.get_or_build(selected_exercise, version, 'volume',
+                                             lambda: build_volume_progress_figure(selected_exercise, daily_stats))
             st.plotly_chart(fig2, use_container_width=True)
         
         else:
             st.info("📊 Need more data points to show progression charts. Keep logging workouts!")
+        
+        # Long-range trends read the weekly/monthly rollups instead of raw sets
+        st.markdown('<h3 style="font-size: 1.375rem; font-weight: 800; color: #374151; margin-bottom: 1rem;">🗓️ Long-Range Trends</h3>', unsafe_allow_html=True)
+        
+        period = keep_value("trend_period", st.radio(
+            "Period", options=['weekly', 'monthly'], format_func=str.title, horizontal=True,
+            index=kept_index("trend_period", ['weekly', 'monthly']), key="trend_period"
+        ))
+        rollups = st.session_state.tracker.get_exercise_rollups(selected_exercise, period)
+        if len(rollups) > 1:
+            fig3 = st.session_state.figure_cache.get_or_build(selected_exercise, version, f'trend_{period}',
+                                                              lambda: build_trend_figure(selected_exercise, period, rollups))
+            st.plotly_chart(fig3, use_container_width=True)
+        else:
+            st.info(f"📊 Need more than one {period[:-2]} of data to show the trend.")
 
 def goals_dashboard_page():
     """SMART Goals Management Dashboard"""
@@ -2086,16 +1236,15 @@ def goals_dashboard_page():
         # Quick goal suggestions
         st.markdown('<div class="section-header">💡 SUGGESTED GOALS</div>', unsafe_allow_html=True)
         
-        df = st.session_state.tracker.get_data()
-        if not df.empty:
+        summaries = st.session_state.tracker.get_exercise_summaries()
+        if not summaries.empty:
             # Suggest goals based on current performance
             popular_exercises = ['Bench Press', 'Squat', 'Deadlift', 'Overhead Press']
             suggestions = []
             
             for exercise in popular_exercises:
-                exercise_data = df[df['exercise'] == exercise]
-                if not exercise_data.empty:
-                    current_max = exercise_data['weight'].max()
+                if exercise in summaries.index:
+                    current_max = summaries.loc[exercise, 'max_weight']
                     suggested_target = current_max + (10 if current_max < 100 else 20)
                     suggestions.append({
                         'name': f"{exercise} {suggested_target}kg PR",
@@ -2361,14 +1510,15 @@ def exercises_page():
     
     # Built-in exercises info
     st.subheader("📚 Comprehensive Exercise Database")
-    built_in_count = len(st.session_state.tracker.get_all_exercises()) - len(custom_exercises)
+    built_in_count = len(BUILT_IN_EXERCISES)
     st.info(f"💪 **{built_in_count}+ exercises** available including strength, cardio, Olympic lifts, strongman, and specialty movements.")
+    st.caption(" • ".join(f"{category}: {len(exercises)}" for category, exercises in EXERCISE_CATALOG.items()))
 
 def data_manager_page():
     """Data management page with GitHub storage info"""
     st.markdown('<h1 style="font-size: 2rem; font-weight: 800; color: #1e293b; margin-bottom: 1.5rem; text-transform: uppercase;">💾 Data Manager</h1>', unsafe_allow_html=True)
     
-    df = st.session_state.tracker.get_data()
+    summaries = st.session_state.tracker.get_exercise_summaries()
     templates = st.session_state.tracker.get_templates()
     custom_exercises = st.session_state.tracker.get_custom_exercises()
     
@@ -2389,16 +1539,62 @@ def data_manager_page():
         
         st.markdown('</div>', unsafe_allow_html=True)
     
+    with st.expander("🗄️ Storage Details & Maintenance"):
+        storage = st.session_state.tracker.get_storage_stats()
+        projection = storage['projection']
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📄 Pages", f"{storage['page_count']:,}", help=f"{storage['page_size']:,} bytes each")
+        with col2:
+            st.metric("🕳️ Free Pages", f"{storage['freelist_count']:,}", help=f"{storage['freelist_bytes'] / 1024:,.0f} KB reclaimable")
+        with col3:
+            st.metric("📝 WAL", f"{storage['wal_size_bytes'] / (1024 * 1024):.2f} MB")
+        with col4:
+            st.metric("📏 Per Set", f"{projection['bytes_per_set']:,.0f} B" if projection['bytes_per_set'] else "-")
+        
+        if projection['limit_date']:
+            st.write(f"**📈 Projection:** at {projection['sets_per_day']:.1f} sets/day the file reaches GitHub's "
+                     f"100MB limit around **{projection['limit_date']}** ({projection['days_until_limit']:,.0f} days)")
+        else:
+            st.write("**📈 Projection:** no recent logging - the file is not growing")
+        
+        sized = [o for o in storage['objects'] if o['size_bytes'] is not None]
+        if sized:
+            st.dataframe(pd.DataFrame([
+                {
+                    'Name': o['name'],
+                    'Type': o['type'],
+                    'Table': o['table'],
+                    'Size (KB)': round(o['size_bytes'] / 1024, 1),
+                    'Rows': storage['row_counts'].get(o['name']) if o['type'] == 'table' else None
+                }
+                for o in sized
+            ]), use_container_width=True, hide_index=True)
+        
+        last = storage['last_maintenance']
+        st.caption(f"Last maintenance: {last['ran_at']} UTC ({last['trigger']})" if last else "Maintenance has not run yet")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🧰 Run Maintenance", use_container_width=True, help="ANALYZE, PRAGMA optimize and incremental vacuum"):
+                result = st.session_state.tracker.run_maintenance()
+                st.success(f"✅ Freed {result['pages_before'] - result['pages_after']} pages in {result['duration_ms']:.0f} ms")
+        with col2:
+            if st.button("🗜️ Compact (VACUUM)", use_container_width=True, help="Rewrite the whole file - slower, reclaims everything"):
+                result = st.session_state.tracker.run_maintenance(compact=True)
+                st.success(f"✅ Compacted from {result['pages_before']} to {result['pages_after']} pages")
+    
     st.subheader("📊 Data Overview")
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        workout_count = len(df) if not df.empty else 0
+        workout_count = int(summaries['total_sets'].sum()) if not summaries.empty else 0
         st.metric("🏋️ Total Sets", f"{workout_count:,}")
     
     with col2:
-        exercise_count = len(df['exercise'].unique()) if not df.empty else 0
+        exercise_count = len(summaries)
         st.metric("📝 Exercises", exercise_count)
     
     with col3:
@@ -2434,14 +1630,22 @@ def data_manager_page():
                 st.session_state.confirm_nuclear = True
                 st.warning("⚠️ Tap again to DELETE ALL workout data!")
     
+    if st.button("🔧 Rebuild Exercise Summaries", use_container_width=True, help="Recompute per-exercise stats and goal progress from raw sets"):
+        st.success(st.session_state.tracker.rebuild_exercise_summary())
+    
+    if st.button("🔧 Rebuild Trend Rollups", use_container_width=True, help="Recompute the daily, weekly and monthly totals behind the long-range charts"):
+        st.success(st.session_state.tracker.rebuild_rollups())
+    
     if st.button("🔍 Show Current Data (Debug)", use_container_width=True):
-        if not df.empty:
+        if not summaries.empty:
             st.subheader("🔍 Current Workout Data")
             
-            recent_data = df.head(20)[['date', 'exercise', 'reps', 'weight', 'rpe', 'set_notes', 'workout_notes']]
+            debug_columns = ['date', 'exercise', 'reps', 'weight', 'rpe', 'set_notes', 'workout_notes']
+            recent_data = st.session_state.tracker.query_sets(debug_columns, limit=20)
             recent_data['date'] = recent_data['date'].dt.strftime('%Y-%m-%d')
             st.dataframe(recent_data, use_container_width=True)
             
+            df = st.session_state.tracker.query_sets(['date', 'exercise', 'reps', 'weight', 'set_notes', 'workout_notes'])
             suspicious_notes = df[
                 df['set_notes'].str.contains('Warm up set|Working weight|Heavy set', case=False, na=False) |
                 df['workout_notes'].str.contains('Great leg session|Finished with leg press', case=False, na=False)
@@ -2456,12 +1660,13 @@ def data_manager_page():
         else:
             st.info("📊 No workout data found")
     
-    if not df.empty:
+    if not summaries.empty:
         st.subheader("📈 Analytics")
         
-        total_volume = (df['reps'] * df['weight']).sum()
-        total_days = len(df['date'].unique())
-        avg_rpe = df['rpe'].mean() if df['rpe'].notna().any() else 0
+        total_volume = summaries['total_volume'].sum()
+        total_days = len(st.session_state.tracker.get_training_days())
+        rpe_count = summaries['rpe_count'].sum()
+        avg_rpe = summaries['rpe_sum'].sum() / rpe_count if rpe_count else 0
         
         col1, col2, col3 = st.columns(3)
         
@@ -2478,15 +1683,32 @@ def data_manager_page():
     st.markdown('<div class="workout-card">', unsafe_allow_html=True)
     st.write("**📤 Export Your Data**")
     
-    export_filename = st.text_input("Backup filename", value=f"gym_backup_{date.today().strftime('%Y%m%d')}.json")
+    export_filename = st.text_input("Backup filename", value=f"gym_backup_{date.today().strftime('%Y%m%d')}.json",
+                                    help="Use .ndjson for one record per line, add .gz to compress")
     
     if st.button("📤 Export All Data", use_container_width=True, type="primary"):
-        result = st.session_state.tracker.export_data(export_filename)
+        export_progress = st.progress(0.0, text="Exporting...")
+        result = st.session_state.tracker.export_data(
+            export_filename, progress=lambda done, total: export_progress.progress(done / total if total else 1.0, text=f"Exported {done:,} of {total:,} records"))
         if "✅" in result:
             st.balloons()
         else:
             st.error(result)
     
+    st.write("**📥 Import / Restore**")
+    
+    import_file = st.file_uploader("CSV, JSON or NDJSON backup (optionally .gz)", type=["csv", "json", "ndjson", "jsonl", "gz"],
+                                   help="Sets that are already in the database are skipped")
+    
+    if import_file is not None and st.button("📥 Import Sets", use_container_width=True):
+        import_progress = st.progress(0.0, text="Importing...")
+        result = st.session_state.tracker.import_workouts(
+            import_file, progress=lambda done, total: import_progress.progress(done / total if total else 1.0, text=f"Read {done:,} of {total:,} bytes"))
+        if "✅" in result:
+            st.success(result)
+        else:
+            st.error(result)
+    
     st.markdown('</div>', unsafe_allow_html=True)
 
 def info_page():
@@ -2538,6 +1760,102 @@ def info_page():
     **Storage:** Permanent GitHub-based SQLite with offline support  
     **Accessibility:** WCAG AAA compliant for all users
     """)
+    
+    # Page render timings recorded by render_page()
+    timings = st.session_state.get('page_timings', {})
+    if timings:
+        st.subheader("⏱️ Page Render Timings")
+        st.dataframe(pd.DataFrame([
+            {
+                'Page': page_name,
+                'Renders': len(history),
+                'Last (ms)': round(history[-1], 1),
+                'Average (ms)': round(sum(history) / len(history), 1)
+            }
+            for page_name, history in timings.items()
+        ]), use_container_width=True, hide_index=True)
+    
+    # Progress chart cache counters
+    figure_stats = st.session_state.figure_cache.get_stats()
+    if figure_stats['hits'] + figure_stats['misses'] > 0:
+        st.subheader("📈 Chart Cache")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Cached Charts", f"{figure_stats['entries']} / {figure_stats['max_entries']}")
+        with col2:
+            st.metric("Hits", figure_stats['hits'])
+        with col3:
+            st.metric("Misses", figure_stats['misses'])
+        with col4:
+            st.metric("Hit Rate", f"{figure_stats['hit_rate']:.0%}")
+
+    # Opt-in method and SQL instrumentation
+    st.subheader("🔬 Instrumentation")
+    tracker = st.session_state.tracker
+    instrumented = st.toggle("Record method and SQL timings", value=tracker.instrumentation is not None,
+                             help="Times every tracker method and SQL statement; adds a little overhead")
+    if instrumented and tracker.instrumentation is None:
+        tracker.enable_instrumentation()
+    elif not instrumented and tracker.instrumentation is not None:
+        tracker.disable_instrumentation()
+    
+    report = tracker.get_instrumentation_report()
+    if report is not None:
+        if report['reruns']:
+            st.write("**Recent reruns**")
+            st.dataframe(pd.DataFrame([
+                {
+                    'Started': trace['started_at'],
+                    'Page': page['page'],
+                    'Page (ms)': round(page['ms'], 1),
+                    'SQL (ms)': round(page['sql_ms'], 1),
+                    'Queries': page['sql_calls'],
+                    'Rows': page['sql_rows'],
+                    'Tracker Calls': page['method_calls'],
+                    'Rerun (ms)': round(trace['total_ms'], 1)
+                }
+                for trace in reversed(report['reruns']) for page in trace['pages']
+            ]), use_container_width=True, hide_index=True)
+        
+        for title, rows, key in (("Slowest tracker methods", report['methods'], 'method'),
+                                 ("Slowest SQL statements", report['statements'], 'sql')):
+            if rows:
+                st.write(f"**{title}**")
+                st.dataframe(pd.DataFrame([
+                    {
+                        key.upper() if key == 'sql' else 'Method': row[key],
+                        'Calls': row['calls'],
+                        'Total (ms)': round(row['total_ms'], 1),
+                        'Avg (ms)': round(row['avg_ms'], 2),
+                        'Max (ms)': round(row['max_ms'], 1),
+                        'Rows': row['rows']
+                    }
+                    for row in rows[:25]
+                ]), use_container_width=True, hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📥 Download JSON", json.dumps(report, indent=2, default=str),
+                               file_name=f"gym_tracker_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                               mime="application/json", use_container_width=True)
+        with col2:
+            if st.button("🧹 Reset Timings", use_container_width=True):
+                tracker.instrumentation.reset()
+                st.rerun()
+
+def render_page(page_name, page_function):
+    """Run a single page and record how long it took to render"""
+    instrumentation = st.session_state.tracker.instrumentation
+    start = time.perf_counter()
+    try:
+        with instrumentation.page(page_name) if instrumentation is not None else nullcontext():
+            page_function()
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        timings = st.session_state.setdefault('page_timings', {})
+        history = timings.setdefault(page_name, [])
+        history.append(elapsed_ms)
+        del history[:-20]  # Keep the last 20 renders per page
 
 def main():
     """Main application entry point"""
@@ -2545,26 +1863,23 @@ def main():
     # Header with improved typography
     st.markdown('<div class="main-header">💪 AI-Enhanced Gym Tracker</div>', unsafe_allow_html=True)
     
-    # Enhanced main navigation - now with Goals
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🔥 Today",
-        "⚡ Quick Log", 
-        "📈 Progress",
-        "🎯 Goals"
-    ])
-    
-    # Main tab content
-    with tab1:
-        todays_workout_page()
-    
-    with tab2:
-        enhanced_quick_log_page()
+    # Enhanced main navigation - only the active page runs on each rerun
+    main_pages = {
+        "🔥 Today": todays_workout_page,
+        "⚡ Quick Log": enhanced_quick_log_page,
+        "📈 Progress": progress_page,
+        "🎯 Goals": goals_dashboard_page
+    }
     
-    with tab3:
-        progress_page()
+    active_page = st.radio(
+        "Navigation",
+        options=list(main_pages),
+        horizontal=True,
+        key="active_page",
+        label_visibility="collapsed"
+    )
     
-    with tab4:
-        goals_dashboard_page()
+    render_page(active_page, main_pages[active_page])
     
     # Additional features dropdown in main area
     st.markdown('<div class="section-header">MORE FEATURES</div>', unsafe_allow_html=True)
@@ -2579,17 +1894,20 @@ def main():
     # Show additional feature content if selected
     if additional_feature == "📋 Programs":
         st.markdown("---")
-        program_creator_page()
+        render_page(additional_feature, program_creator_page)
     elif additional_feature == "➕ Exercises":
         st.markdown("---")
-        exercises_page()
+        render_page(additional_feature, exercises_page)
     elif additional_feature == "💾 Data":
         st.markdown("---")
-        data_manager_page()
+        render_page(additional_feature, data_manager_page)
     elif additional_feature == "ℹ️ Info":
         st.markdown("---")
-        info_page()
+        render_page(additional_feature, info_page)
 
 # Run the application
 if __name__ == "__main__":
-    main()
+    # Each rerun becomes one trace while instrumentation is on
+    instrumentation = st.session_state.tracker.instrumentation
+    with instrumentation.trace() if instrumentation is not None else nullcontext():
+        main()
@@ -0,0 +1,72 @@
+"""The compact get_data() frame must hold the same numbers query_sets() reads, just in narrower dtypes
+
+Usage: python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gym_tracker_core import GymTracker
+
+SETS = [
+    {'set_number': 1, 'reps': 5, 'weight': 100, 'rpe': 8.5},
+    {'set_number': 2, 'reps': 5, 'weight': 100, 'rpe': 6.5},
+    {'set_number': 3, 'reps': 5, 'weight': 100}
+]
+HUGE_SET = {'set_number': 70000, 'reps': 40000, 'weight': 20, 'rpe': 10}
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = GymTracker(str(tmp_path / 'compact.db'))
+    yield tracker
+    tracker.close()
+
+
+def assert_frames_agree(tracker):
+    compact = tracker.get_data().sort_values('id', ignore_index=True)
+    wide = tracker.query_sets(['id', 'set_number', 'reps', 'rpe']).sort_values('id', ignore_index=True)
+    assert compact['set_number'].tolist() == wide['set_number'].tolist()
+    assert compact['reps'].tolist() == wide['reps'].tolist()
+    assert (compact['rpe_x2'] / 2).astype('Float64').tolist() == wide['rpe'].astype('Float64').tolist()
+
+
+def test_half_point_rpe_survives(tracker):
+    tracker.log_workout('2026-10-01', 'Bench Press', SETS)
+    assert tracker.get_data()['rpe_x2'].dtype == 'Int8'
+    assert_frames_agree(tracker)
+
+
+def test_small_numbers_stay_int16(tracker):
+    tracker.log_workout('2026-10-01', 'Bench Press', SETS)
+    frame = tracker.get_data()
+    assert frame['set_number'].dtype == np.int16
+    assert frame['reps'].dtype == np.int16
+
+
+def test_numbers_beyond_int16_are_not_wrapped(tracker):
+    tracker.log_workout('2026-10-01', 'Bench Press', SETS + [HUGE_SET])
+    assert_frames_agree(tracker)
+
+
+def test_cached_frame_widens_for_a_huge_set(tracker):
+    tracker.log_workout('2026-10-01', 'Bench Press', SETS)
+    tracker.get_data()
+
+    # Patched into the cached int16 frame rather than reloaded
+    tracker.log_workout('2026-10-02', 'Squat', [HUGE_SET])
+    assert_frames_agree(tracker)
+
+
+def test_queued_huge_set_is_not_wrapped(tracker):
+    tracker.log_workout('2026-10-01', 'Bench Press', SETS)
+    tracker.set_write_behind(True)
+    tracker.log_workout('2026-10-02', 'Squat', [HUGE_SET])
+    assert_frames_agree(tracker)
+
+    tracker.flush()
+    assert_frames_agree(tracker)
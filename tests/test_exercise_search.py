@@ -0,0 +1,42 @@
+"""Ranked exercise search over the built-in catalog, including the typos the old fuzzy scan forgave
+
+Usage: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gym_tracker_core import BUILT_IN_EXERCISES, ExerciseSearchIndex
+
+
+@pytest.fixture(scope='module')
+def index():
+    return ExerciseSearchIndex(BUILT_IN_EXERCISES)
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('bench', 'Bench Press'),
+    ('ohp', 'Overhead Press'),
+    ('press bench', 'Bench Press'),
+    ('benhc press', 'Bench Press'),
+])
+def test_best_match_comes_first(index, query, expected):
+    assert index.search(query)[0] == expected
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('bnech', ['Bench Press']),
+    ('sqaut', ['Squat', 'Back Squat']),
+    ('dedlift', ['Deadlift']),
+])
+def test_transposed_letters_still_match(index, query, expected):
+    results = index.search(query)
+    assert results[0] == expected[0]
+    assert set(expected) <= set(results)
+
+
+def test_unrelated_query_finds_nothing(index):
+    assert index.search('xyzq') == []
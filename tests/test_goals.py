@@ -0,0 +1,47 @@
+"""Stored goal progress must follow the data down as well as up
+
+Exercise goals copy the exercise summary; once an exercise has no sets left its goals have to drop to 0
+instead of keeping the last value they saw.
+
+Usage: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gym_tracker_core import GymTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = GymTracker(str(tmp_path / 'goals.db'))
+    tracker.create_goal('Big bench', 'max_weight', 200, 'Bench Press', '2099-01-01')
+    tracker.create_goal('Bench tonnage', 'total_volume', 10000, 'Bench Press', '2099-01-01')
+    tracker.log_workout('2026-10-01', 'Bench Press', [{'reps': 5, 'weight': 150}, {'reps': 3, 'weight': 140}])
+    yield tracker
+    tracker.close()
+
+
+def goal_values(tracker):
+    return {goal['type']: goal['current_value'] for goal in tracker.get_goals()}
+
+
+def test_goals_track_logged_sets(tracker):
+    assert goal_values(tracker) == {'max_weight': 150, 'total_volume': 5 * 150 + 3 * 140}
+
+
+def test_deleting_the_last_sets_resets_goals(tracker):
+    ids = tracker.query_sets(['id'])['id'].tolist()
+    tracker.delete_set(ids[0])
+    assert goal_values(tracker) == {'max_weight': 140, 'total_volume': 3 * 140}
+
+    tracker.delete_set(ids[1])
+    assert goal_values(tracker) == {'max_weight': 0, 'total_volume': 0}
+
+
+def test_reset_all_data_resets_goals(tracker):
+    tracker.reset_all_data()
+    assert goal_values(tracker) == {'max_weight': 0, 'total_volume': 0}
@@ -0,0 +1,44 @@
+"""Schema migrations that rewrite existing rows must give what writing those rows fresh gives
+
+Usage: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gym_tracker_core import GymTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = GymTracker(str(tmp_path / 'migrations.db'))
+    yield tracker
+    tracker.close()
+
+
+def stored_hashes(tracker):
+    with tracker.pool.snapshot() as cursor:
+        cursor.execute('SELECT id, content_hash FROM workouts ORDER BY id')
+        return cursor.fetchall()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 50000])
+def test_content_hash_backfill_matches_insert_time_hashes(tracker, chunk_size):
+    # Repeats of the same set, spread over several chunks and mixed with other sets
+    same = {'reps': 5, 'weight': 100, 'rpe': 8}
+    for day in ('2026-10-01', '2026-10-02'):
+        tracker.log_workout(day, 'Bench Press', [dict(same, set_number=1)] * 3 + [{'reps': 3, 'weight': 110}])
+        tracker.quick_log('Bench Press', 5, 100, 8, date_str=day)
+        tracker.quick_log('Squat', 5, 140, date_str=day)
+    expected = stored_hashes(tracker)
+    assert len({content_hash for _, content_hash in expected}) == len(expected)
+
+    with tracker.pool.transaction() as cursor:
+        cursor.execute('DROP INDEX idx_workouts_content_hash')
+        cursor.execute('UPDATE workouts SET content_hash = NULL')
+        tracker._migration_add_content_hashes(cursor, chunk_size=chunk_size)
+
+    assert stored_hashes(tracker) == expected
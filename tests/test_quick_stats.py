@@ -0,0 +1,190 @@
+"""get_quick_stats() must give what the original per-exercise loop over the full frame gave
+
+reference_quick_stats() is the implementation get_quick_stats had before it was vectorized and moved off
+get_data(), run on the same wide frame get_data() used to return. Both are compared on seeded random
+histories with future dates, missing RPEs and sets on the week and 30-day boundaries.
+
+Usage: python -m pytest tests
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gym_tracker_core import GymTracker, tracker as tracker_module
+
+EXERCISES = ['Bench Press', 'Squat', 'Deadlift', 'Overhead Press', 'Barbell Row', 'Pull-ups']
+
+
+def reference_quick_stats(df, now):
+    """get_quick_stats as it was before user-005, over the wide frame of every set"""
+    if df.empty:
+        return {
+            'streak': 0,
+            'weekly_volume': 0,
+            'weekly_workouts': 0,
+            'recent_prs': [],
+            'total_workouts': 0,
+            'total_volume': 0
+        }
+
+    today = now.date()
+
+    dates = sorted(df['date'].dt.date.unique(), reverse=True)
+    streak = 0
+    for i, workout_date in enumerate(dates):
+        if i == 0:
+            if workout_date == today:
+                streak = 1
+            elif (today - workout_date).days == 1:
+                streak = 1
+            else:
+                break
+        else:
+            prev_date = dates[i-1]
+            if (prev_date - workout_date).days == 1:
+                streak += 1
+            elif (prev_date - workout_date).days <= 2:  # Allow 1 rest day
+                streak += 1
+            else:
+                break
+
+    week_start = today - timedelta(days=today.weekday())
+    this_week_data = df[df['date'].dt.date >= week_start]
+    weekly_volume = float((this_week_data['reps'] * this_week_data['weight']).sum())
+    weekly_workouts = len(this_week_data['date'].dt.date.unique()) if not this_week_data.empty else 0
+
+    recent_prs = []
+    recent_data = df[df['date'] >= (now - timedelta(days=30))]
+    if not recent_data.empty:
+        for exercise in recent_data['exercise'].unique():
+            exercise_data = df[df['exercise'] == exercise]
+            if len(exercise_data) > 1:
+                recent_exercise_data = recent_data[recent_data['exercise'] == exercise]
+                if not recent_exercise_data.empty:
+                    max_weight_recent = recent_exercise_data['weight'].max()
+                    max_weight_all_time = exercise_data['weight'].max()
+
+                    if max_weight_recent == max_weight_all_time:
+                        pr_date = recent_exercise_data[
+                            recent_exercise_data['weight'] == max_weight_recent
+                        ]['date'].max()
+                        recent_prs.append({
+                            'exercise': exercise,
+                            'weight': float(max_weight_recent),
+                            'date': pr_date.strftime('%Y-%m-%d')
+                        })
+
+    return {
+        'streak': int(streak),
+        'weekly_volume': weekly_volume,
+        'weekly_workouts': int(weekly_workouts),
+        'recent_prs': recent_prs[:3],
+        'total_workouts': int(len(df['date'].unique())),
+        'total_volume': float((df['reps'] * df['weight']).sum())
+    }
+
+
+def random_workouts(rng, today):
+    """Random workouts from 90 days back to 5 days ahead, always hitting the week and 30-day boundaries"""
+    week_start = today - timedelta(days=today.weekday())
+    boundary_days = [
+        today, today - timedelta(days=1), week_start, week_start - timedelta(days=1),
+        today - timedelta(days=29), today - timedelta(days=30), today - timedelta(days=31),
+        today + timedelta(days=rng.randint(1, 5))
+    ]
+    days = rng.sample(range(-90, 6), rng.randint(0, 40))
+    days = [today + timedelta(days=offset) for offset in days]
+    days += rng.sample(boundary_days, rng.randint(1, len(boundary_days)))
+
+    workouts = []
+    for day in days:
+        for exercise in rng.sample(EXERCISES, rng.randint(1, 3)):
+            base = rng.choice([20, 40, 60, 80, 100])
+            workouts.append({
+                'date': day.strftime('%Y-%m-%d'),
+                'exercise': exercise,
+                'sets': [{
+                    'reps': rng.randint(1, 12),
+                    'weight': base + 2.5 * rng.randint(0, 8),
+                    'rpe': None if rng.random() < 0.3 else rng.randint(12, 20) / 2
+                } for _ in range(rng.randint(1, 4))],
+                'notes': ''
+            })
+    rng.shuffle(workouts)
+    return workouts
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the tracker's clock to mid-morning, so a run near midnight cannot move the boundaries"""
+    now = datetime.combine(datetime.now().date(), datetime.min.time()) + timedelta(hours=10, minutes=30)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(tracker_module, 'datetime', FrozenDatetime)
+    return now
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = GymTracker(str(tmp_path / 'quick_stats.db'))
+    yield tracker
+    tracker.close()
+
+
+def assert_same_stats(stats, expected):
+    assert stats['streak'] == expected['streak']
+    assert stats['weekly_workouts'] == expected['weekly_workouts']
+    assert stats['total_workouts'] == expected['total_workouts']
+    assert stats['weekly_volume'] == pytest.approx(expected['weekly_volume'])
+    assert stats['total_volume'] == pytest.approx(expected['total_volume'])
+    assert stats['recent_prs'] == expected['recent_prs']
+
+
+def test_empty_history(tracker, frozen_now):
+    assert_same_stats(tracker.get_quick_stats(), reference_quick_stats(tracker.query_sets(), frozen_now))
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_random_history(tracker, frozen_now, seed):
+    rng = random.Random(seed)
+    tracker.log_workouts(random_workouts(rng, frozen_now.date()))
+
+    assert_same_stats(tracker.get_quick_stats(), reference_quick_stats(tracker.query_sets(), frozen_now))
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_random_history_with_queued_sets(tracker, frozen_now, monkeypatch, seed):
+    rng = random.Random(seed)
+    workouts = random_workouts(rng, frozen_now.date())
+    tracker.log_workouts(workouts[len(workouts) // 2:])
+
+    # The rest waits in the write-behind queue, which get_quick_stats has to count too
+    monkeypatch.setattr(GymTracker, 'GROUP_COMMIT_WINDOW', 0.5)
+    tracker.set_write_behind(True)
+    tracker.log_workouts(workouts[:len(workouts) // 2])
+
+    expected = reference_quick_stats(tracker.query_sets(), frozen_now)
+    assert_same_stats(tracker.get_quick_stats(), expected)
+
+    tracker.flush()
+    assert_same_stats(tracker.get_quick_stats(), expected)
+
+
+def test_streak_allows_one_rest_day(tracker, frozen_now):
+    today = frozen_now.date()
+    for offset in (0, 2, 3, 5, 9):
+        tracker.quick_log('Squat', 5, 100, date_str=(today - timedelta(days=offset)).strftime('%Y-%m-%d'))
+
+    stats = tracker.get_quick_stats()
+    assert stats['streak'] == 4
+    assert stats['total_workouts'] == 5
+    assert_same_stats(stats, reference_quick_stats(tracker.query_sets(), frozen_now))